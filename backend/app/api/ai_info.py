@@ -1,16 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
 import json
+import logging
+import os
 import re
 
-from ..database import get_db
-from ..models import AIInfo
+from ..auth import get_current_active_user
+from ..database import get_db, get_read_db, get_async_db
+from ..models import AIInfo, User
 from ..schemas import AIInfoCreate, AIInfoResponse, AIInfoItem, TermItem, TermsUpdate
 from ..utils.ai_classifier import ai_classifier
+from ..utils.content_version import bump_content_version
+from ..utils.payload_cache import payload_cache
+from ..utils.etag import conditional_get, conditional_get_async
+from ..utils.search_index import search_index, make_snippet
+from ..utils.ai_info_items import LANGUAGES, fill_empty_items, item_value, new_row_columns, parse_terms
+from ..utils.category_index import category_index
+from ..utils.ai_info_import import AI_INFO_IMPORT_MODES, AIInfoImporter, parse_record
+from ..utils.bulk_import import BulkReport, detect_format, iter_records, validation_message
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
+AI_INFO_BULK_MAX_ROWS = int(os.getenv("AI_INFO_BULK_MAX_ROWS", "5000"))
+
+def _require_admin(current_user: User):
+    if current_user.role != 'admin':
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
 
 
 def normalize_text(text):
@@ -19,29 +43,101 @@ def normalize_text(text):
     text = re.sub(r'\s+', '', text)
     return text
 
+def mark_ai_info_changed(db: Session, date: str):
+    """AI 정보가 바뀌었음을 기록합니다. 쓰기 핸들러는 커밋하기 전에 같은 세션으로 호출해야 합니다."""
+    search_index.reindex_date(db, date)
+    category_index.reindex_date(db, date)
+    bump_content_version(db, "ai_info")
+
+# /{date}보다 먼저 등록해야 "search"가 날짜로 해석되지 않음
+@router.get("/search")
+def search_ai_info(
+    q: str,
+    request: Request,
+    response: Response,
+    language: str = "ko",
+    page: int = 1,
+    page_size: int = 20,
+    db: Session = Depends(get_read_db)
+):
+    """제목, 내용, 용어에서 AI 정보를 검색합니다. (language=all이면 모든 언어)"""
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="Search query is required")
+    if language != "all" and language not in LANGUAGES:
+        raise HTTPException(status_code=400, detail=f"Unsupported language: {language}")
+    page = max(page, 1)
+    page_size = min(max(page_size, 1), 100)
+    
+    not_modified = conditional_get(request, response, db, "ai_info")
+    if not_modified:
+        return not_modified
+    
+    try:
+        total, hits = search_index.search(
+            db, q,
+            language=None if language == "all" else language,
+            limit=page_size,
+            offset=(page - 1) * page_size
+        )
+        
+        # 현재 페이지 결과의 내용만 가져와서 snippet 생성
+        rows = {}
+        if hits:
+            dates = list({hit["date"] for hit in hits})
+            for ai_info in db.query(AIInfo).filter(AIInfo.date.in_(dates)).all():
+                rows.setdefault(ai_info.date, ai_info)
+        
+        results = []
+        for hit in hits:
+            ai_info = rows.get(hit["date"])
+            content = item_value(ai_info, hit["info_index"], "content", hit["language"]) if ai_info else None
+            results.append({
+                "id": f"{hit['date']}_{hit['info_index']}",
+                **hit,
+                **make_snippet(content, q)
+            })
+        
+        return {
+            "query": q,
+            "language": language,
+            "page": page,
+            "page_size": page_size,
+            "total": total,
+            "total_pages": (total + page_size - 1) // page_size,
+            "results": results
+        }
+    except Exception as e:
+        logger.error("Error in search_ai_info: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to search AI info: {str(e)}")
+
 @router.get("/{date}", response_model=List[AIInfoItem])
-def get_ai_info_by_date(date: str, db: Session = Depends(get_db)):
+async def get_ai_info_by_date(date: str, request: Request, response: Response, db: AsyncSession = Depends(get_async_db)):
+    not_modified = await conditional_get_async(request, response, db, "ai_info")
+    if not_modified:
+        return not_modified
     try:
-        print(f"=== Getting AI Info for Date: {date} ===")
-        ai_info = db.query(AIInfo).filter(AIInfo.date == date).first()
+        logger.debug("=== Getting AI Info for Date: %s ===", date)
+        result = await db.execute(select(AIInfo).where(AIInfo.date == date).limit(1))
+        ai_info = result.scalars().first()
         if not ai_info:
-            print(f"No AI info found for date: {date}")
+            logger.debug("No AI info found for date: %s", date)
             return []
         
-        print(f"Found AI info record: ID={ai_info.id}")
-        print(f"Info1 - Title KO: {ai_info.info1_title_ko}")
-        print(f"Info1 - Title EN: {ai_info.info1_title_en}")
-        print(f"Info1 - Title JA: {ai_info.info1_title_ja}")
-        print(f"Info1 - Title ZH: {ai_info.info1_title_zh}")
-        print(f"Info1 - Content KO: {ai_info.info1_content_ko[:50] if ai_info.info1_content_ko else 'None'}...")
-        print(f"Info1 - Content EN: {ai_info.info1_content_en[:50] if ai_info.info1_content_en else 'None'}...")
-        print(f"Info1 - Content JA: {ai_info.info1_content_ja[:50] if ai_info.info1_content_ja else 'None'}...")
-        print(f"Info1 - Content ZH: {ai_info.info1_content_zh[:50] if ai_info.info1_content_zh else 'None'}...")
-        print(f"Info1 - Terms KO: {ai_info.info1_terms_ko}")
-        print(f"Info1 - Terms EN: {ai_info.info1_terms_en}")
-        print(f"Info1 - Terms JA: {ai_info.info1_terms_ja}")
-        print(f"Info1 - Terms ZH: {ai_info.info1_terms_zh}")
-        print(f"================================")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Found AI info record: ID=%s", ai_info.id)
+            logger.debug("Info1 - Title KO: %s", ai_info.info1_title_ko)
+            logger.debug("Info1 - Title EN: %s", ai_info.info1_title_en)
+            logger.debug("Info1 - Title JA: %s", ai_info.info1_title_ja)
+            logger.debug("Info1 - Title ZH: %s", ai_info.info1_title_zh)
+            logger.debug("Info1 - Content KO: %s...", ai_info.info1_content_ko[:50] if ai_info.info1_content_ko else 'None')
+            logger.debug("Info1 - Content EN: %s...", ai_info.info1_content_en[:50] if ai_info.info1_content_en else 'None')
+            logger.debug("Info1 - Content JA: %s...", ai_info.info1_content_ja[:50] if ai_info.info1_content_ja else 'None')
+            logger.debug("Info1 - Content ZH: %s...", ai_info.info1_content_zh[:50] if ai_info.info1_content_zh else 'None')
+            logger.debug("Info1 - Terms KO: %s", ai_info.info1_terms_ko)
+            logger.debug("Info1 - Terms EN: %s", ai_info.info1_terms_en)
+            logger.debug("Info1 - Terms JA: %s", ai_info.info1_terms_ja)
+            logger.debug("Info1 - Terms ZH: %s", ai_info.info1_terms_zh)
+            logger.debug("================================")
         
         infos = []
         if ai_info.info1_title_ko and ai_info.info1_content_ko:
@@ -143,30 +239,31 @@ def get_ai_info_by_date(date: str, db: Session = Depends(get_db)):
         
         return infos
     except Exception as e:
-        print(f"Error in get_ai_info_by_date: {e}")
+        logger.error("Error in get_ai_info_by_date: %s", e)
         return []
 
 @router.post("/", response_model=AIInfoResponse)
 def add_ai_info(ai_info_data: AIInfoCreate, db: Session = Depends(get_db)):
     try:
-        print(f"=== AI Info Registration Debug ===")
-        print(f"Date: {ai_info_data.date}")
-        print(f"Number of infos: {len(ai_info_data.infos)}")
-        for i, info in enumerate(ai_info_data.infos):
-            print(f"Info {i+1}:")
-            print(f"  Title KO: {info.title_ko}")
-            print(f"  Title EN: {info.title_en}")
-            print(f"  Title JA: {info.title_ja}")
-            print(f"  Title ZH: {info.title_zh}")
-            print(f"  Content KO: {info.content_ko[:50]}...")
-            print(f"  Content EN: {info.content_en[:50] if info.content_en else 'None'}...")
-            print(f"  Content JA: {info.content_ja[:50] if info.content_ja else 'None'}...")
-            print(f"  Content ZH: {info.content_zh[:50] if info.content_zh else 'None'}...")
-            print(f"  Terms KO count: {len(info.terms_ko) if info.terms_ko else 0}")
-            print(f"  Terms EN count: {len(info.terms_en) if info.terms_en else 0}")
-            print(f"  Terms JA count: {len(info.terms_ja) if info.terms_ja else 0}")
-            print(f"  Terms ZH count: {len(info.terms_zh) if info.terms_zh else 0}")
-        print(f"================================")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("=== AI Info Registration Debug ===")
+            logger.debug("Date: %s", ai_info_data.date)
+            logger.debug("Number of infos: %s", len(ai_info_data.infos))
+            for i, info in enumerate(ai_info_data.infos):
+                logger.debug("Info %s:", i+1)
+                logger.debug("  Title KO: %s", info.title_ko)
+                logger.debug("  Title EN: %s", info.title_en)
+                logger.debug("  Title JA: %s", info.title_ja)
+                logger.debug("  Title ZH: %s", info.title_zh)
+                logger.debug("  Content KO: %s...", info.content_ko[:50])
+                logger.debug("  Content EN: %s...", info.content_en[:50] if info.content_en else 'None')
+                logger.debug("  Content JA: %s...", info.content_ja[:50] if info.content_ja else 'None')
+                logger.debug("  Content ZH: %s...", info.content_zh[:50] if info.content_zh else 'None')
+                logger.debug("  Terms KO count: %s", len(info.terms_ko) if info.terms_ko else 0)
+                logger.debug("  Terms EN count: %s", len(info.terms_en) if info.terms_en else 0)
+                logger.debug("  Terms JA count: %s", len(info.terms_ja) if info.terms_ja else 0)
+                logger.debug("  Terms ZH count: %s", len(info.terms_zh) if info.terms_zh else 0)
+            logger.debug("================================")
         existing_info = db.query(AIInfo).filter(AIInfo.date == ai_info_data.date).first()
 
         def build_infos(obj):
@@ -260,39 +357,11 @@ def add_ai_info(ai_info_data: AIInfoCreate, db: Session = Depends(get_db)):
                 })
             return infos
 
-        def terms_to_dict(terms):
-            """TermItem 객체들을 딕셔너리 리스트로 변환"""
-            if not terms:
-                return []
-            return [{"term": term.term, "description": term.description} for term in terms]
-
         if existing_info:
-            # 기존 데이터 업데이트 (비어있는 info2, info3에 순차적으로 채움)
-            infos_to_add = [i for i in ai_info_data.infos if i.title_ko and i.content_ko]
-            fields = [
-                ("info1_title_ko", "info1_content_ko", "info1_terms_ko", "info1_category"),
-                ("info2_title_ko", "info2_content_ko", "info2_terms_ko", "info2_category"),
-                ("info3_title_ko", "info3_content_ko", "info3_terms_ko", "info3_category"),
-            ]
-            for i, (title_field, content_field, terms_field, category_field) in enumerate(fields):
-                if getattr(existing_info, title_field) == '' or getattr(existing_info, content_field) == '':
-                    if infos_to_add:
-                        info = infos_to_add.pop(0)
-                        setattr(existing_info, title_field, info.title_ko)
-                        setattr(existing_info, content_field, info.content_ko)
-                        setattr(existing_info, terms_field, json.dumps(terms_to_dict(info.terms_ko or [])))
-                        setattr(existing_info, category_field, info.category or '')
-                        
-                        # 다른 언어 필드들도 설정
-                        setattr(existing_info, title_field.replace('_ko', '_en'), info.title_en or '')
-                        setattr(existing_info, title_field.replace('_ko', '_ja'), info.title_ja or '')
-                        setattr(existing_info, title_field.replace('_ko', '_zh'), info.title_zh or '')
-                        setattr(existing_info, content_field.replace('_ko', '_en'), info.content_en or '')
-                        setattr(existing_info, content_field.replace('_ko', '_ja'), info.content_ja or '')
-                        setattr(existing_info, content_field.replace('_ko', '_zh'), info.content_zh or '')
-                        setattr(existing_info, terms_field.replace('_ko', '_en'), json.dumps(terms_to_dict(info.terms_en or [])))
-                        setattr(existing_info, terms_field.replace('_ko', '_ja'), json.dumps(terms_to_dict(info.terms_ja or [])))
-                        setattr(existing_info, terms_field.replace('_ko', '_zh'), json.dumps(terms_to_dict(info.terms_zh or [])))
+            # 기존 데이터 업데이트 (비어있는 info1~3 칸에 순차적으로 채움)
+            for column, value in fill_empty_items(existing_info, ai_info_data.infos).items():
+                setattr(existing_info, column, value)
+            mark_ai_info_changed(db, ai_info_data.date)
             db.commit()
             db.refresh(existing_info)
             return {
@@ -303,49 +372,9 @@ def add_ai_info(ai_info_data: AIInfoCreate, db: Session = Depends(get_db)):
             }
         else:
             # 새 데이터 생성
-            db_ai_info = AIInfo(
-                date=ai_info_data.date,
-                info1_title_ko=ai_info_data.infos[0].title_ko if len(ai_info_data.infos) >= 1 else "",
-                info1_title_en=ai_info_data.infos[0].title_en if len(ai_info_data.infos) >= 1 else "",
-                info1_title_ja=ai_info_data.infos[0].title_ja if len(ai_info_data.infos) >= 1 else "",
-                info1_title_zh=ai_info_data.infos[0].title_zh if len(ai_info_data.infos) >= 1 else "",
-                info1_content_ko=ai_info_data.infos[0].content_ko if len(ai_info_data.infos) >= 1 else "",
-                info1_content_en=ai_info_data.infos[0].content_en if len(ai_info_data.infos) >= 1 else "",
-                info1_content_ja=ai_info_data.infos[0].content_ja if len(ai_info_data.infos) >= 1 else "",
-                info1_content_zh=ai_info_data.infos[0].content_zh if len(ai_info_data.infos) >= 1 else "",
-                info1_terms_ko=json.dumps(terms_to_dict(ai_info_data.infos[0].terms_ko or [])) if len(ai_info_data.infos) >= 1 else "[]",
-                info1_terms_en=json.dumps(terms_to_dict(ai_info_data.infos[0].terms_en or [])) if len(ai_info_data.infos) >= 1 else "[]",
-                info1_terms_ja=json.dumps(terms_to_dict(ai_info_data.infos[0].terms_ja or [])) if len(ai_info_data.infos) >= 1 else "[]",
-                info1_terms_zh=json.dumps(terms_to_dict(ai_info_data.infos[0].terms_zh or [])) if len(ai_info_data.infos) >= 1 else "[]",
-                info1_category=ai_info_data.infos[0].category if len(ai_info_data.infos) >= 1 else "",
-                info2_title_ko=ai_info_data.infos[1].title_ko if len(ai_info_data.infos) >= 2 else "",
-                info2_title_en=ai_info_data.infos[1].title_en if len(ai_info_data.infos) >= 2 else "",
-                info2_title_ja=ai_info_data.infos[1].title_ja if len(ai_info_data.infos) >= 2 else "",
-                info2_title_zh=ai_info_data.infos[1].title_zh if len(ai_info_data.infos) >= 2 else "",
-                info2_content_ko=ai_info_data.infos[1].content_ko if len(ai_info_data.infos) >= 2 else "",
-                info2_content_en=ai_info_data.infos[1].content_en if len(ai_info_data.infos) >= 2 else "",
-                info2_content_ja=ai_info_data.infos[1].content_ja if len(ai_info_data.infos) >= 2 else "",
-                info2_content_zh=ai_info_data.infos[1].content_zh if len(ai_info_data.infos) >= 2 else "",
-                info2_terms_ko=json.dumps(terms_to_dict(ai_info_data.infos[1].terms_ko or [])) if len(ai_info_data.infos) >= 2 else "[]",
-                info2_terms_en=json.dumps(terms_to_dict(ai_info_data.infos[1].terms_en or [])) if len(ai_info_data.infos) >= 2 else "[]",
-                info2_terms_ja=json.dumps(terms_to_dict(ai_info_data.infos[1].terms_ja or [])) if len(ai_info_data.infos) >= 2 else "[]",
-                info2_terms_zh=json.dumps(terms_to_dict(ai_info_data.infos[1].terms_zh or [])) if len(ai_info_data.infos) >= 2 else "[]",
-                info2_category=ai_info_data.infos[1].category if len(ai_info_data.infos) >= 2 else "",
-                info3_title_ko=ai_info_data.infos[2].title_ko if len(ai_info_data.infos) >= 3 else "",
-                info3_title_en=ai_info_data.infos[2].title_en if len(ai_info_data.infos) >= 3 else "",
-                info3_title_ja=ai_info_data.infos[2].title_ja if len(ai_info_data.infos) >= 3 else "",
-                info3_title_zh=ai_info_data.infos[2].title_zh if len(ai_info_data.infos) >= 3 else "",
-                info3_content_ko=ai_info_data.infos[2].content_ko if len(ai_info_data.infos) >= 3 else "",
-                info3_content_en=ai_info_data.infos[2].content_en if len(ai_info_data.infos) >= 3 else "",
-                info3_content_ja=ai_info_data.infos[2].content_ja if len(ai_info_data.infos) >= 3 else "",
-                info3_content_zh=ai_info_data.infos[2].content_zh if len(ai_info_data.infos) >= 3 else "",
-                info3_terms_ko=json.dumps(terms_to_dict(ai_info_data.infos[2].terms_ko or [])) if len(ai_info_data.infos) >= 3 else "[]",
-                info3_terms_en=json.dumps(terms_to_dict(ai_info_data.infos[2].terms_en or [])) if len(ai_info_data.infos) >= 3 else "[]",
-                info3_terms_ja=json.dumps(terms_to_dict(ai_info_data.infos[2].terms_ja or [])) if len(ai_info_data.infos) >= 3 else "[]",
-                info3_terms_zh=json.dumps(terms_to_dict(ai_info_data.infos[2].terms_zh or [])) if len(ai_info_data.infos) >= 3 else "[]",
-                info3_category=ai_info_data.infos[2].category if len(ai_info_data.infos) >= 3 else ""
-            )
+            db_ai_info = AIInfo(date=ai_info_data.date, **new_row_columns(ai_info_data.infos))
             db.add(db_ai_info)
+            mark_ai_info_changed(db, ai_info_data.date)
             db.commit()
             db.refresh(db_ai_info)
             return {
@@ -355,9 +384,73 @@ def add_ai_info(ai_info_data: AIInfoCreate, db: Session = Depends(get_db)):
                 "created_at": str(db_ai_info.created_at) if db_ai_info.created_at else None
             }
     except Exception as e:
-        print(f"Error in add_ai_info: {e}")
+        logger.error("Error in add_ai_info: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to add AI info: {str(e)}")
 
+@router.post("/bulk")
+async def bulk_import_ai_info(
+    request: Request,
+    mode: str = "replace",
+    dry_run: bool = False,
+    atomic: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    NDJSON 본문(한 줄에 {"date": ..., "infos": [...]} 하나)으로 여러 날짜를 한 트랜잭션에 가져옵니다. (관리자만)
+    배치마다 기존 날짜를 한 번에 조회해 INSERT/UPDATE를 각각 한 번씩 실행하고, 마지막에 한 번 커밋합니다.
+    - mode: replace(날짜의 항목을 덮어씀, 기본) / append(기존 행의 빈 칸에만 채움, POST /와 같은 방식)
+    - dry_run: 검증만 하고 저장하지 않음
+    - atomic: 잘못된 레코드가 하나라도 있으면 아무것도 저장하지 않음
+    응답에 처리 시간과 초당 처리 날짜 수를 함께 돌려줍니다.
+    """
+    _require_admin(current_user)
+    if mode not in AI_INFO_IMPORT_MODES:
+        raise HTTPException(status_code=400, detail=f"mode must be one of {', '.join(AI_INFO_IMPORT_MODES)}")
+    fmt = detect_format(request.headers.get("content-type"), request.query_params.get("format") or "ndjson")
+    if fmt != "ndjson":
+        raise HTTPException(status_code=400, detail="Only NDJSON is supported for AI info bulk import")
+    
+    report = BulkReport(fmt, dry_run)
+    importer = AIInfoImporter(db, mode=mode, dry_run=dry_run)
+    try:
+        async for record in iter_records(request.stream(), fmt):
+            report.received += 1
+            if report.received > AI_INFO_BULK_MAX_ROWS:
+                raise HTTPException(status_code=413, detail=f"Too many records (max {AI_INFO_BULK_MAX_ROWS})")
+            if record.error:
+                report.error(record.line, record.error)
+                continue
+            try:
+                importer.add(parse_record(record.data))
+            except ValueError as e:
+                report.error(record.line, validation_message(e))
+                continue
+            if importer.batch_full:
+                await run_in_threadpool(importer.flush)
+        
+        if atomic and report.failed:
+            await run_in_threadpool(db.rollback)
+        else:
+            await run_in_threadpool(importer.commit)
+            report.inserted = importer.inserted
+            report.updated = importer.updated
+    except HTTPException:
+        await run_in_threadpool(db.rollback)
+        raise
+    except Exception as e:
+        await run_in_threadpool(db.rollback)
+        logger.exception("bulk_import_ai_info failed after %s records", report.received)
+        raise HTTPException(status_code=500, detail=f"Bulk import failed: {e}")
+    
+    result = {**report.as_dict(), **importer.stats()}
+    logger.info(
+        "AI info bulk import: received=%s inserted=%s updated=%s failed=%s in %ss (%s dates/s)",
+        report.received, report.inserted, report.updated, report.failed,
+        result["elapsed_seconds"], result["dates_per_second"]
+    )
+    return result
+
 @router.delete("/{date}")
 def delete_ai_info(date: str, db: Session = Depends(get_db)):
     ai_info = db.query(AIInfo).filter(AIInfo.date == date).first()
@@ -365,6 +458,7 @@ def delete_ai_info(date: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="AI info not found")
     
     db.delete(ai_info)
+    mark_ai_info_changed(db, date)
     db.commit()
     return {"message": "AI info deleted successfully"}
 
@@ -427,48 +521,57 @@ def delete_ai_info_item(date: str, item_index: int, db: Session = Depends(get_db
             not ai_info.info2_title_ko and not ai_info.info2_content_ko and
             not ai_info.info3_title_ko and not ai_info.info3_content_ko):
             db.delete(ai_info)
-        else:
-            db.commit()
+        mark_ai_info_changed(db, date)
+        db.commit()
         
         return {"message": f"Item {item_index} deleted successfully"}
         
     except Exception as e:
-        print(f"Error in delete_ai_info_item: {e}")
+        logger.error("Error in delete_ai_info_item: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to delete item: {str(e)}")
 
 @router.get("/dates/all")
-def get_all_ai_info_dates(db: Session = Depends(get_db)):
+def get_all_ai_info_dates(request: Request, response: Response, db: Session = Depends(get_read_db)):
+    not_modified = conditional_get(request, response, db, "ai_info")
+    if not_modified:
+        return not_modified
     dates = [row.date for row in db.query(AIInfo).order_by(AIInfo.date).all()]
     return dates
 
 @router.get("/all")
-def get_all_ai_info(language: str = "ko", db: Session = Depends(get_db)):
-    """모든 AI 정보를 제목과 날짜로 반환합니다."""
+def get_all_ai_info(request: Request, language: str = "ko", db: Session = Depends(get_read_db)):
+    """모든 AI 정보를 제목과 날짜로 반환합니다. (콘텐츠 버전별로 인코딩된 응답을 캐시)"""
+    return payload_cache.response(request, db, "ai_info", ("all", language), lambda: build_all_ai_info(db, language))
+
+def build_all_ai_info(db: Session, language: str):
     try:
         all_ai_info = []
         ai_infos = db.query(AIInfo).order_by(AIInfo.date.desc()).all()
         
-        print(f"DEBUG: get_all_ai_info called with language: {language}")
-        print(f"DEBUG: Total AIInfo records in database: {len(ai_infos)}")
+        logger.debug("get_all_ai_info called with language: %s", language)
+        logger.debug("Total AIInfo records in database: %s", len(ai_infos))
         
         # 언어별 컬럼 선택 (올바른 컬럼명 사용)
         title_suffix = f"info1_title_{language}"
         content_suffix = f"info1_content_{language}"
         terms_suffix = f"info1_terms_{language}"
         
-        print(f"DEBUG: Using columns: {title_suffix}, {content_suffix}, {terms_suffix}")
+        logger.debug("Using columns: %s, %s, %s", title_suffix, content_suffix, terms_suffix)
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         for ai_info in ai_infos:
-            print(f"DEBUG: Processing AIInfo record for date: {ai_info.date}")
-            print(f"DEBUG: Record ID: {ai_info.id}")
+            if debug:
+                logger.debug("Processing AIInfo record for date: %s", ai_info.date)
+                logger.debug("Record ID: %s", ai_info.id)
             
             # info1 - 요청된 언어의 데이터만 사용
             info1_title = getattr(ai_info, title_suffix, None)
             info1_content = getattr(ai_info, content_suffix, None)
             info1_terms = getattr(ai_info, terms_suffix, None)
             
-            print(f"DEBUG: info1{title_suffix}: {info1_title[:50] if info1_title else 'None'}...")
-            print(f"DEBUG: info1{content_suffix}: {info1_content[:50] if info1_content else 'None'}...")
+            if debug:
+                logger.debug("info1%s: %s...", title_suffix, info1_title[:50] if info1_title else 'None')
+                logger.debug("info1%s: %s...", content_suffix, info1_content[:50] if info1_content else 'None')
             
             if info1_title and info1_content:
                 try:
@@ -498,17 +601,20 @@ def get_all_ai_info(language: str = "ko", db: Session = Depends(get_db)):
                     "created_at": ai_info.created_at,
                     "info_index": 0
                 })
-                print(f"DEBUG: Added info1 for date {ai_info.date} with title: {info1_title[:30]}...")
+                if debug:
+                    logger.debug("Added info1 for date %s with title: %s...", ai_info.date, info1_title[:30])
             else:
-                print(f"DEBUG: Skipped info1 for date {ai_info.date} - {language} language data not available")
+                if debug:
+                    logger.debug("Skipped info1 for date %s - %s language data not available", ai_info.date, language)
             
             # info2 - 요청된 언어의 데이터만 사용
             info2_title = getattr(ai_info, f'info2_title_{language}', None)
             info2_content = getattr(ai_info, f'info2_content_{language}', None)
             info2_terms = getattr(ai_info, f'info2_terms_{language}', None)
             
-            print(f"DEBUG: info2{title_suffix}: {info2_title[:50] if info2_title else 'None'}...")
-            print(f"DEBUG: info2{content_suffix}: {info2_content[:50] if info2_content else 'None'}...")
+            if debug:
+                logger.debug("info2%s: %s...", title_suffix, info2_title[:50] if info2_title else 'None')
+                logger.debug("info2%s: %s...", content_suffix, info2_content[:50] if info2_content else 'None')
             
             if info2_title and info2_content:
                 try:
@@ -538,17 +644,20 @@ def get_all_ai_info(language: str = "ko", db: Session = Depends(get_db)):
                     "created_at": ai_info.created_at,
                     "info_index": 1
                 })
-                print(f"DEBUG: Added info2 for date {ai_info.date} with title: {info2_title[:30]}...")
+                if debug:
+                    logger.debug("Added info2 for date %s with title: %s...", ai_info.date, info2_title[:30])
             else:
-                print(f"DEBUG: Skipped info2 for date {ai_info.date} - {language} language data not available")
+                if debug:
+                    logger.debug("Skipped info2 for date %s - %s language data not available", ai_info.date, language)
             
             # info3 - 요청된 언어의 데이터만 사용
             info3_title = getattr(ai_info, f'info3_title_{language}', None)
             info3_content = getattr(ai_info, f'info3_content_{language}', None)
             info3_terms = getattr(ai_info, f'info3_terms_{language}', None)
             
-            print(f"DEBUG: info3{title_suffix}: {info3_title[:50] if info3_title else 'None'}...")
-            print(f"DEBUG: info3{content_suffix}: {info3_content[:50] if info3_content else 'None'}...")
+            if debug:
+                logger.debug("info3%s: %s...", title_suffix, info3_title[:50] if info3_title else 'None')
+                logger.debug("info3%s: %s...", content_suffix, info3_content[:50] if info3_content else 'None')
             
             if info3_title and info3_content:
                 try:
@@ -578,32 +687,41 @@ def get_all_ai_info(language: str = "ko", db: Session = Depends(get_db)):
                     "created_at": ai_info.created_at,
                     "info_index": 2
                 })
-                print(f"DEBUG: Added info3 for date {ai_info.date} with title: {info3_title[:30]}...")
+                if debug:
+                    logger.debug("Added info3 for date %s with title: %s...", ai_info.date, info3_title[:30])
             else:
-                print(f"DEBUG: Skipped info3 for date {ai_info.date} - {language} language data not available")
+                if debug:
+                    logger.debug("Skipped info3 for date %s - %s language data not available", ai_info.date, language)
         
-        print(f"DEBUG: Total AI info items found: {len(all_ai_info)}")
+        logger.debug("Total AI info items found: %s", len(all_ai_info))
         return all_ai_info
         
     except Exception as e:
-        print(f"Error in get_all_ai_info: {e}")
+        logger.error("Error in get_all_ai_info: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get all AI info: {str(e)}")
 
 @router.get("/total-days")
-def get_total_ai_info_days(db: Session = Depends(get_db)):
+def get_total_ai_info_days(request: Request, response: Response, db: Session = Depends(get_read_db)):
     """AI 정보가 등록된 총 일 수를 반환합니다."""
+    not_modified = conditional_get(request, response, db, "ai_info")
+    if not_modified:
+        return not_modified
     total_days = db.query(AIInfo).count()
     return {"total_days": total_days}
 
 @router.get("/total-count", response_model=dict)
-def get_total_ai_info_count(db: Session = Depends(get_db)):
+def get_total_ai_info_count(request: Request, response: Response, db: Session = Depends(get_read_db)):
     """AI 정보 전체목록의 총 카드 수를 반환합니다."""
+    not_modified = conditional_get(request, response, db, "ai_info")
+    if not_modified:
+        return not_modified
     try:
         # AI 정보 전체목록 가져오기 (실제 카드 수 계산)
         total_cards = 0
         ai_infos = db.query(AIInfo).all()
         
-        print(f"DEBUG: Total AIInfo records found: {len(ai_infos)}")
+        logger.debug("Total AIInfo records found: %s", len(ai_infos))
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         for ai_info in ai_infos:
             info1_count = 0
@@ -614,26 +732,30 @@ def get_total_ai_info_count(db: Session = Depends(get_db)):
             if ai_info.info1_title_ko and ai_info.info1_content_ko:
                 total_cards += 1
                 info1_count = 1
-                print(f"DEBUG: Date {ai_info.date} - Info1: title='{ai_info.info1_title_ko[:20]}...', content='{ai_info.info1_content_ko[:20]}...'")
+                if debug:
+                    logger.debug("Date %s - Info1: title='%s...', content='%s...'", ai_info.date, ai_info.info1_title_ko[:20], ai_info.info1_content_ko[:20])
             
             # info2
             if ai_info.info2_title_ko and ai_info.info2_content_ko:
                 total_cards += 1
                 info2_count = 1
-                print(f"DEBUG: Date {ai_info.date} - Info2: title='{ai_info.info2_title_ko[:20]}...', content='{ai_info.info2_content_ko[:20]}...'")
+                if debug:
+                    logger.debug("Date %s - Info2: title='%s...', content='%s...'", ai_info.date, ai_info.info2_title_ko[:20], ai_info.info2_content_ko[:20])
             
             # info3
             if ai_info.info3_title_ko and ai_info.info3_content_ko:
                 total_cards += 1
                 info3_count = 1
-                print(f"DEBUG: Date {ai_info.date} - Info3: title='{ai_info.info3_title_ko[:20]}...', content='{ai_info.info3_content_ko[:20]}...'")
+                if debug:
+                    logger.debug("Date %s - Info3: title='%s...', content='%s...'", ai_info.date, ai_info.info3_title_ko[:20], ai_info.info3_content_ko[:20])
             
-            print(f"DEBUG: Date {ai_info.date} - Info1: {info1_count}, Info2: {info2_count}, Info3: {info3_count}")
+            if debug:
+                logger.debug("Date %s - Info1: %s, Info2: %s, Info3: %s", ai_info.date, info1_count, info2_count, info3_count)
         
-        print(f"DEBUG: Final total_cards: {total_cards}")
+        logger.debug("Final total_cards: %s", total_cards)
         return {"total_count": total_cards}
     except Exception as e:
-        print(f"Error getting total AI info count: {e}")
+        logger.error("Error getting total AI info count: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get total AI info count: {str(e)}")
 
 @router.get("/learned-count/{session_id}", response_model=dict)
@@ -717,12 +839,15 @@ def get_user_learned_ai_info_count(session_id: str, db: Session = Depends(get_db
         
         return {"learned_count": total_learned_count}
     except Exception as e:
-        print(f"Error getting user learned AI info count: {e}")
+        logger.error("Error getting user learned AI info count: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get user learned AI info count: {str(e)}")
 
 @router.get("/terms-total-count", response_model=dict)
-def get_total_terms_count(db: Session = Depends(get_db)):
+def get_total_terms_count(request: Request, response: Response, db: Session = Depends(get_read_db)):
     """AI 정보 전체목록의 총 용어 수를 반환합니다 (총 정보 개수 * 20)."""
+    not_modified = conditional_get(request, response, db, "ai_info")
+    if not_modified:
+        return not_modified
     try:
         # AI 정보 전체목록 가져오기 (실제 카드 수 계산)
         total_cards = 0
@@ -746,7 +871,7 @@ def get_total_terms_count(db: Session = Depends(get_db)):
         
         return {"total_terms": total_terms}
     except Exception as e:
-        print(f"Error getting total terms count: {e}")
+        logger.error("Error getting total terms count: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get total terms count: {str(e)}")
 
 @router.get("/terms-learned-count/{session_id}", response_model=dict)
@@ -832,7 +957,7 @@ def get_user_learned_terms_count(session_id: str, db: Session = Depends(get_db))
         
         return {"learned_terms": total_learned_terms}
     except Exception as e:
-        print(f"Error getting user learned terms count: {e}")
+        logger.error("Error getting user learned terms count: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get user learned terms count: {str(e)}")
 
 @router.get("/terms-quiz/{session_id}")
@@ -926,7 +1051,7 @@ def get_terms_quiz(session_id: str, language: str = "ko", db: Session = Depends(
         return {"quizzes": quizzes, "total_terms": len(unique_terms)}
         
     except Exception as e:
-        print(f"Error in get_terms_quiz: {e}")
+        logger.error("Error in get_terms_quiz: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to generate terms quiz: {str(e)}")
 
 @router.get("/terms-quiz-by-date/{date}")
@@ -1026,7 +1151,7 @@ def get_terms_quiz_by_date(date: str, language: str = "ko", db: Session = Depend
         return {"quizzes": quizzes, "total_terms": len(unique_terms)}
         
     except Exception as e:
-        print(f"Error in get_terms_quiz_by_date: {e}")
+        logger.error("Error in get_terms_quiz_by_date: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to generate terms quiz: {str(e)}")
 
 @router.get("/learned-terms/{session_id}")
@@ -1112,13 +1237,13 @@ def get_learned_terms(session_id: str, language: str = "ko", db: Session = Depen
                                             term['info_index'] = info_index
                                             all_terms.append(term)
                             except (ValueError, IndexError) as e:
-                                print(f"Error parsing date from {progress.date}: {e}")
+                                logger.error("Error parsing date from %s: %s", progress.date, e)
                                 continue
                 except json.JSONDecodeError:
                     continue
         
-        print(f"Debug - Total terms found: {len(all_terms)}")
-        print(f"Debug - Learned dates: {learned_dates}")
+        logger.debug("Total terms found: %s", len(all_terms))
+        logger.debug("Learned dates: %s", learned_dates)
         
         if not all_terms:
             return {"terms": [], "message": "학습한 용어가 없습니다."}
@@ -1156,7 +1281,7 @@ def get_learned_terms(session_id: str, language: str = "ko", db: Session = Depen
         }
         
     except Exception as e:
-        print(f"Error in get_learned_terms: {e}")
+        logger.error("Error in get_learned_terms: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get learned terms: {str(e)}")
 
  
@@ -1189,14 +1314,14 @@ def get_sample_data(db: Session = Depends(get_db)):
         return {"sample_data": sample_data, "total_records": db.query(AIInfo).count()}
         
     except Exception as e:
-        print(f"Error getting sample data: {e}")
+        logger.error("Error getting sample data: %s", e)
         return {"error": str(e)}
 
 @router.get("/debug/category-check/{category:path}")
 def check_category_data(category: str, db: Session = Depends(get_db)):
     """디버깅용: 특정 카테고리의 데이터 상세 확인"""
     try:
-        print(f"카테고리 '{category}' 상세 확인 요청됨")
+        logger.debug("카테고리 '%s' 상세 확인 요청됨", category)
         
         all_ai_info = db.query(AIInfo).all()
         category_data = []
@@ -1214,7 +1339,7 @@ def check_category_data(category: str, db: Session = Depends(get_db)):
                         "matches_requested": stored_category == category,
                         "content_preview": ai_info.info1_content[:100]
                     })
-                    print(f"  info1: 저장된 카테고리 '{stored_category}' -> 요청된 카테고리 '{category}'와 일치: {stored_category == category}")
+                    logger.debug("  info1: 저장된 카테고리 '%s' -> 요청된 카테고리 '%s'와 일치: %s", stored_category, category, stored_category == category)
             
             # info2 확인
             if ai_info.info2_title and ai_info.info2_content:
@@ -1228,7 +1353,7 @@ def check_category_data(category: str, db: Session = Depends(get_db)):
                         "matches_requested": stored_category == category,
                         "content_preview": ai_info.info2_content[:100]
                     })
-                    print(f"  info2: 저장된 카테고리 '{stored_category}' -> 요청된 카테고리 '{category}'와 일치: {stored_category == category}")
+                    logger.debug("  info2: 저장된 카테고리 '%s' -> 요청된 카테고리 '%s'와 일치: %s", stored_category, category, stored_category == category)
             
             # info3 확인
             if ai_info.info3_title and ai_info.info3_content:
@@ -1242,12 +1367,12 @@ def check_category_data(category: str, db: Session = Depends(get_db)):
                         "matches_requested": stored_category == category,
                         "content_preview": ai_info.info3_content[:100]
                     })
-                    print(f"  info3: 저장된 카테고리 '{stored_category}' -> 요청된 카테고리 '{category}'와 일치: {stored_category == category}")
+                    logger.debug("  info3: 저장된 카테고리 '%s' -> 요청된 카테고리 '%s'와 일치: %s", stored_category, category, stored_category == category)
         
         # 요청된 카테고리와 일치하는 항목만 필터링
         matching_items = [item for item in category_data if item["matches_requested"]]
         
-        print(f"총 {len(category_data)}개 항목에서 요청된 카테고리 '{category}'와 일치하는 항목: {len(matching_items)}개")
+        logger.debug("총 %s개 항목에서 요청된 카테고리 '%s'와 일치하는 항목: %s개", len(category_data), category, len(matching_items))
         
         return {
             "requested_category": category,
@@ -1257,14 +1382,14 @@ def check_category_data(category: str, db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        print(f"Error checking category data: {e}")
+        logger.error("Error checking category data: %s", e)
         return {"error": str(e)}
 
 @router.get("/debug/all-stored-categories")
 def get_all_stored_categories(db: Session = Depends(get_db)):
     """디버깅용: 데이터베이스에 저장된 모든 카테고리 값 확인"""
     try:
-        print("저장된 모든 카테고리 값 확인 요청됨")
+        logger.debug("저장된 모든 카테고리 값 확인 요청됨")
         
         all_ai_info = db.query(AIInfo).all()
         stored_categories = set()
@@ -1275,26 +1400,26 @@ def get_all_stored_categories(db: Session = Depends(get_db)):
                 stored_category = getattr(ai_info, 'info1_category', None)
                 if stored_category and stored_category.strip():
                     stored_categories.add(stored_category)
-                    print(f"  info1: '{stored_category}'")
+                    logger.debug("  info1: '%s'", stored_category)
             
             # info2 카테고리
             if ai_info.info2_title and ai_info.info2_content:
                 stored_category = getattr(ai_info, 'info2_category', None)
                 if stored_category and stored_category.strip():
                     stored_categories.add(stored_category)
-                    print(f"  info2: '{stored_category}'")
+                    logger.debug("  info2: '%s'", stored_category)
             
             # info3 카테고리
             if ai_info.info3_title and ai_info.info3_content:
                 stored_category = getattr(ai_info, 'info3_category', None)
                 if stored_category and stored_category.strip():
                     stored_categories.add(stored_category)
-                    print(f"  info3: '{stored_category}'")
+                    logger.debug("  info3: '%s'", stored_category)
         
         stored_categories_list = list(stored_categories)
         stored_categories_list.sort()
         
-        print(f"총 {len(stored_categories_list)}개의 고유한 카테고리 값 발견: {stored_categories_list}")
+        logger.debug("총 %s개의 고유한 카테고리 값 발견: %s", len(stored_categories_list), stored_categories_list)
         
         return {
             "total_unique_categories": len(stored_categories_list),
@@ -1302,7 +1427,7 @@ def get_all_stored_categories(db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        print(f"Error getting stored categories: {e}")
+        logger.error("Error getting stored categories: %s", e)
         return {"error": str(e)}
 
 @router.get("/categories/all", response_model=List[str])
@@ -1311,7 +1436,7 @@ def get_all_categories():
     try:
         return ai_classifier.get_all_categories()
     except Exception as e:
-        print(f"Error getting categories: {e}")
+        logger.error("Error getting categories: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get categories: {str(e)}")
 
 @router.get("/categories/{category:path}/subcategories", response_model=List[str])
@@ -1320,309 +1445,69 @@ def get_subcategories(category: str):
     return []
 
 @router.get("/by-category/{category:path}", response_model=List[dict])
-def get_ai_info_by_category(category: str, language: str = "ko", db: Session = Depends(get_db)):
-    """특정 카테고리의 AI 정보를 반환합니다."""
+def get_ai_info_by_category(category: str, request: Request, response: Response, language: str = "ko", db: Session = Depends(get_read_db)):
+    """특정 카테고리의 AI 정보를 반환합니다. (카테고리 색인으로 해당 항목만 조회)"""
+    not_modified = conditional_get(request, response, db, "ai_info")
+    if not_modified:
+        return not_modified
     try:
-        print(f"카테고리 '{category}' 요청됨 (언어: {language})")
-        
-        # 언어별 컬럼 선택
-        title_suffix = f"_title_{language}"
-        content_suffix = f"_content_{language}"
-        terms_suffix = f"_terms_{language}"
+        postings = category_index.postings(db, category)
+        if not postings:
+            return []
         
-        # 모든 AI 정보를 가져와서 카테고리별로 필터링
-        all_ai_info = db.query(AIInfo).all()
-        print(f"총 {len(all_ai_info)}개의 AI 정보 레코드 발견")
+        # 해당 항목이 있는 행만 가져옴
+        ids = {posting.ai_info_id for posting in postings}
+        rows = {ai_info.id: ai_info for ai_info in db.query(AIInfo).filter(AIInfo.id.in_(ids)).all()}
         
         filtered_infos = []
-        total_classifications = 0
+        for posting in postings:
+            ai_info = rows.get(posting.ai_info_id)
+            if ai_info is None:
+                continue
+            title = item_value(ai_info, posting.info_index, "title", language)
+            content = item_value(ai_info, posting.info_index, "content", language)
+            if not (title and content):
+                continue
+            filtered_infos.append({
+                "id": f"{ai_info.date}_{posting.info_index}",
+                "date": ai_info.date,
+                "title": title,
+                "content": content,
+                "terms": parse_terms(item_value(ai_info, posting.info_index, "terms", language)),
+                "category": category,
+                "subcategory": posting.subcategory,
+                "confidence": posting.confidence,
+                "created_at": ai_info.created_at
+            })
         
-        for ai_info in all_ai_info:
-            print(f"날짜 {ai_info.date} 처리 중...")
-            
-            # info1 처리
-            info1_title = getattr(ai_info, f'info1{title_suffix}', None)
-            info1_content = getattr(ai_info, f'info1{content_suffix}', None)
-            info1_terms = getattr(ai_info, f'info1{terms_suffix}', None)
-            
-            if info1_title and info1_content:
-                # 저장된 카테고리가 있으면 우선 사용, 없으면 실시간 분류
-                stored_category = getattr(ai_info, 'info1_category', None)
-                if stored_category and stored_category.strip():
-                    print(f"  info1 저장된 카테고리: {stored_category}")
-                    if stored_category == category:
-                        try:
-                            terms1 = json.loads(info1_terms) if info1_terms else []
-                        except json.JSONDecodeError:
-                            terms1 = []
-                        
-                        filtered_infos.append({
-                            "id": f"{ai_info.date}_0",
-                            "date": ai_info.date,
-                            "title": info1_title,
-                            "content": info1_content,
-                            "terms": terms1,
-                            "category": stored_category,
-                            "subcategory": None,
-                            "confidence": 1.0,
-                            "created_at": ai_info.created_at
-                        })
-                        print(f"  -> info1 저장된 카테고리로 매칭됨!")
-                else:
-                    # 실시간 분류
-                    total_classifications += 1
-                    classification = ai_classifier.classify_content(
-                        info1_title, 
-                        info1_content
-                    )
-                    print(f"  info1 실시간 분류 결과: {classification['category']} (신뢰도: {classification['confidence']:.2f})")
-                    
-                    if classification["category"] == category:
-                        try:
-                            terms1 = json.loads(info1_terms) if info1_terms else []
-                        except json.JSONDecodeError:
-                            terms1 = []
-                        
-                        filtered_infos.append({
-                            "id": f"{ai_info.date}_0",
-                            "date": ai_info.date,
-                            "title": info1_title,
-                            "content": info1_content,
-                            "terms": terms1,
-                            "category": classification["category"],
-                            "subcategory": classification["subcategory"],
-                            "confidence": classification["confidence"],
-                            "created_at": ai_info.created_at
-                        })
-                        print(f"  -> info1 실시간 분류로 매칭됨!")
-            
-            # info2 처리
-            info2_title = getattr(ai_info, f'info2{title_suffix}', None)
-            info2_content = getattr(ai_info, f'info2{content_suffix}', None)
-            info2_terms = getattr(ai_info, f'info2{terms_suffix}', None)
-            
-            if info2_title and info2_content:
-                # 저장된 카테고리가 있으면 우선 사용, 없으면 실시간 분류
-                stored_category = getattr(ai_info, 'info2_category', None)
-                if stored_category and stored_category.strip():
-                    print(f"  info2 저장된 카테고리: {stored_category}")
-                    if stored_category == category:
-                        try:
-                            terms2 = json.loads(info2_terms) if info2_terms else []
-                        except json.JSONDecodeError:
-                            terms2 = []
-                        
-                        filtered_infos.append({
-                            "id": f"{ai_info.date}_1",
-                            "date": ai_info.date,
-                            "title": info2_title,
-                            "content": info2_content,
-                            "terms": terms2,
-                            "category": stored_category,
-                            "subcategory": None,
-                            "confidence": 1.0,
-                            "created_at": ai_info.created_at
-                        })
-                        print(f"  -> info2 저장된 카테고리로 매칭됨!")
-                else:
-                    # 실시간 분류
-                    total_classifications += 1
-                    classification = ai_classifier.classify_content(
-                        info2_title, 
-                        info2_content
-                    )
-                    print(f"  info2 실시간 분류 결과: {classification['category']} (신뢰도: {classification['confidence']:.2f})")
-                    
-                    if classification["category"] == category:
-                        try:
-                            terms2 = json.loads(info2_terms) if info2_terms else []
-                        except json.JSONDecodeError:
-                            terms2 = []
-                        
-                        filtered_infos.append({
-                            "id": f"{ai_info.date}_1",
-                            "date": ai_info.date,
-                            "title": info2_title,
-                            "content": info2_content,
-                            "terms": terms2,
-                            "category": classification["category"],
-                            "subcategory": classification["subcategory"],
-                            "confidence": classification["confidence"],
-                            "created_at": ai_info.created_at
-                        })
-                        print(f"  -> info2 실시간 분류로 매칭됨!")
-            
-            # info3 처리
-            info3_title = getattr(ai_info, f'info3{title_suffix}', None)
-            info3_content = getattr(ai_info, f'info3{content_suffix}', None)
-            info3_terms = getattr(ai_info, f'info3{terms_suffix}', None)
-            
-            if info3_title and info3_content:
-                # 저장된 카테고리가 있으면 우선 사용, 없으면 실시간 분류
-                stored_category = getattr(ai_info, 'info3_category', None)
-                if stored_category and stored_category.strip():
-                    print(f"  info3 저장된 카테고리: {stored_category}")
-                    if stored_category == category:
-                        try:
-                            terms3 = json.loads(info3_terms) if info3_terms else []
-                        except json.JSONDecodeError:
-                            terms3 = []
-                        
-                        filtered_infos.append({
-                            "id": f"{ai_info.date}_2",
-                            "date": ai_info.date,
-                            "title": info3_title,
-                            "content": info3_content,
-                            "terms": terms3,
-                            "category": stored_category,
-                            "subcategory": None,
-                            "confidence": 1.0,
-                            "created_at": ai_info.created_at
-                        })
-                        print(f"  -> info3 저장된 카테고리로 매칭됨!")
-                else:
-                    # 실시간 분류
-                    total_classifications += 1
-                    classification = ai_classifier.classify_content(
-                        info3_title, 
-                        info3_content
-                    )
-                    print(f"  info3 실시간 분류 결과: {classification['category']} (신뢰도: {classification['confidence']:.2f})")
-                    
-                    if classification["category"] == category:
-                        try:
-                            terms3 = json.loads(info3_terms) if info3_terms else []
-                        except json.JSONDecodeError:
-                            terms3 = []
-                        
-                        filtered_infos.append({
-                            "id": f"{ai_info.date}_2",
-                            "date": ai_info.date,
-                            "title": info3_title,
-                            "content": info3_content,
-                            "terms": terms3,
-                            "category": classification["category"],
-                            "subcategory": classification["subcategory"],
-                            "confidence": classification["confidence"],
-                            "created_at": ai_info.created_at
-                        })
-                        print(f"  -> info3 매칭됨!")
-        
-        print(f"총 {total_classifications}개 항목 분류 완료")
-        print(f"카테고리 '{category}'에서 {len(filtered_infos)}개 항목 발견")
-        
-        # 날짜순으로 정렬
-        filtered_infos.sort(key=lambda x: x["date"], reverse=True)
+        # 색인이 날짜 내림차순이므로 별도 정렬 불필요
         return filtered_infos
         
     except Exception as e:
-        print(f"Error getting AI info by category: {e}")
+        logger.error("Error getting AI info by category: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get AI info by category: {str(e)}")
 
 @router.get("/categories/stats", response_model=dict)
-def get_category_statistics(db: Session = Depends(get_db)):
-    """카테고리별 통계를 반환합니다."""
+def get_category_statistics(request: Request, response: Response, db: Session = Depends(get_read_db)):
+    """카테고리별 통계를 반환합니다. (카테고리 색인에서 미리 집계된 값)"""
+    not_modified = conditional_get(request, response, db, "ai_info")
+    if not_modified:
+        return not_modified
     try:
-        print("카테고리 통계 요청됨")
-        all_ai_info = db.query(AIInfo).all()
-        print(f"총 {len(all_ai_info)}개의 AI 정보 레코드 발견")
-        
-        category_stats = {}
-        total_items = 0
-        
-        for ai_info in all_ai_info:
-            print(f"날짜 {ai_info.date} 통계 처리 중...")
-            
-            # info1 처리
-            if ai_info.info1_title_ko and ai_info.info1_content_ko:
-                total_items += 1
-                stored_category = getattr(ai_info, 'info1_category', None)
-                if stored_category and stored_category.strip():
-                    category = stored_category
-                    print(f"  info1: '{ai_info.info1_title_ko[:30]}...' -> 저장된 카테고리: {category}")
-                else:
-                    classification = ai_classifier.classify_content(ai_info.info1_title_ko, ai_info.info1_content_ko)
-                    category = classification["category"]
-                    print(f"  info1: '{ai_info.info1_title_ko[:30]}...' -> 실시간 분류: {category}")
-                
-                if category not in category_stats:
-                    category_stats[category] = {
-                        "count": 0,
-                        "dates": []
-                    }
-                
-                category_stats[category]["count"] += 1
-                
-                # 날짜 정보
-                if ai_info.date not in category_stats[category]["dates"]:
-                    category_stats[category]["dates"].append(ai_info.date)
-            
-            # info2 처리
-            if ai_info.info2_title_ko and ai_info.info2_content_ko:
-                total_items += 1
-                stored_category = getattr(ai_info, 'info2_category', None)
-                if stored_category and stored_category.strip():
-                    category = stored_category
-                    print(f"  info2: '{ai_info.info2_title_ko[:30]}...' -> 저장된 카테고리: {category}")
-                else:
-                    classification = ai_classifier.classify_content(ai_info.info2_title_ko, ai_info.info2_content_ko)
-                    category = classification["category"]
-                    print(f"  info2: '{ai_info.info2_title_ko[:30]}...' -> 실시간 분류: {category}")
-                
-                if category not in category_stats:
-                    category_stats[category] = {
-                        "count": 0,
-                        "dates": []
-                    }
-                
-                category_stats[category]["count"] += 1
-                
-                # 날짜 정보
-                if ai_info.date not in category_stats[category]["dates"]:
-                    category_stats[category]["dates"].append(ai_info.date)
-            
-            # info3 처리
-            if ai_info.info3_title_ko and ai_info.info3_content_ko:
-                total_items += 1
-                stored_category = getattr(ai_info, 'info3_category', None)
-                if stored_category and stored_category.strip():
-                    category = stored_category
-                    print(f"  info2: '{ai_info.info3_title_ko[:30]}...' -> 저장된 카테고리: {category}")
-                else:
-                    classification = ai_classifier.classify_content(ai_info.info3_title_ko, ai_info.info3_content_ko)
-                    category = classification["category"]
-                    print(f"  info3: '{ai_info.info3_title_ko[:30]}...' -> 실시간 분류: {category}")
-                
-                if category not in category_stats:
-                    category_stats[category] = {
-                        "count": 0,
-                        "dates": []
-                    }
-                
-                category_stats[category]["count"] += 1
-                
-                # 날짜 정보
-                if ai_info.date not in category_stats[category]["dates"]:
-                    category_stats[category]["dates"].append(ai_info.date)
-        
-        print(f"총 {total_items}개 항목 분류 완료")
-        
-        # 날짜 정렬
-        for category in category_stats:
-            category_stats[category]["dates"].sort(reverse=True)
-        
-        print(f"카테고리 통계 결과: {category_stats}")
-        return category_stats
+        return category_index.stats(db)
         
     except Exception as e:
-        print(f"Error getting category statistics: {e}")
+        logger.error("Error getting category statistics: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get category statistics: {str(e)}")
 
 @router.get("/all-terms/{language}")
-def get_all_terms(language: str = "ko", db: Session = Depends(get_db)):
-    """시스템에 등록된 모든 용어를 가져옵니다."""
+def get_all_terms(request: Request, language: str = "ko", db: Session = Depends(get_read_db)):
+    """시스템에 등록된 모든 용어를 가져옵니다. (콘텐츠 버전별로 인코딩된 응답을 캐시)"""
+    return payload_cache.response(request, db, "ai_info", ("all-terms", language), lambda: build_all_terms(db, language))
+
+def build_all_terms(db: Session, language: str):
     try:
-        print(f"=== Getting All Terms for Language: {language} ===")
+        logger.debug("=== Getting All Terms for Language: %s ===", language)
         
         # 언어별 컬럼 선택
         terms_suffix = f"_terms_{language}"
@@ -1689,7 +1574,7 @@ def get_all_terms(language: str = "ko", db: Session = Depends(get_db)):
                     except json.JSONDecodeError:
                         pass
         
-        print(f"Total terms found: {len(all_terms)}")
+        logger.debug("Total terms found: %s", len(all_terms))
         
         # 중복 제거 (같은 용어라도 다른 날짜에 있다면 모두 포함)
         unique_terms = []
@@ -1701,7 +1586,7 @@ def get_all_terms(language: str = "ko", db: Session = Depends(get_db)):
                 seen_terms.add(term_key)
                 unique_terms.append(term)
         
-        print(f"Unique terms after deduplication: {len(unique_terms)}")
+        logger.debug("Unique terms after deduplication: %s", len(unique_terms))
         
         return {
             "terms": unique_terms,
@@ -1710,14 +1595,17 @@ def get_all_terms(language: str = "ko", db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        print(f"Error in get_all_terms: {e}")
+        logger.error("Error in get_all_terms: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get all terms: {str(e)}") 
 
 @router.get("/titles/{language}")
-def get_all_titles(language: str = "ko", db: Session = Depends(get_db)):
-    """모든 AI 정보의 제목만 가져옵니다 (성능 최적화용)."""
+def get_all_titles(request: Request, language: str = "ko", db: Session = Depends(get_read_db)):
+    """모든 AI 정보의 제목만 가져옵니다 (성능 최적화용, 콘텐츠 버전별로 인코딩된 응답을 캐시)."""
+    return payload_cache.response(request, db, "ai_info", ("titles", language), lambda: build_all_titles(db, language))
+
+def build_all_titles(db: Session, language: str):
     try:
-        print(f"=== Getting All Titles for Language: {language} ===")
+        logger.debug("=== Getting All Titles for Language: %s ===", language)
         
         # 언어별 컬럼 선택
         title_suffix = f"_title_{language}"
@@ -1766,7 +1654,7 @@ def get_all_titles(language: str = "ko", db: Session = Depends(get_db)):
                         'has_content': True
                     })
         
-        print(f"Total titles found: {len(all_titles)}")
+        logger.debug("Total titles found: %s", len(all_titles))
         
         return {
             "titles": all_titles,
@@ -1775,16 +1663,20 @@ def get_all_titles(language: str = "ko", db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        print(f"Error in get_all_titles: {e}")
+        logger.error("Error in get_all_titles: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get all titles: {str(e)}")
 
 @router.get("/content/{date}/{info_index}/{language}")
-def get_content_by_index(date: str, info_index: int, language: str = "ko", db: Session = Depends(get_db)):
+async def get_content_by_index(date: str, info_index: int, request: Request, response: Response, language: str = "ko", db: AsyncSession = Depends(get_async_db)):
     """특정 날짜와 인덱스의 AI 정보 내용을 가져옵니다."""
+    not_modified = await conditional_get_async(request, response, db, "ai_info")
+    if not_modified:
+        return not_modified
     try:
-        print(f"=== Getting Content for Date: {date}, Index: {info_index}, Language: {language} ===")
+        logger.debug("=== Getting Content for Date: %s, Index: %s, Language: %s ===", date, info_index, language)
         
-        ai_info = db.query(AIInfo).filter(AIInfo.date == date).first()
+        result = await db.execute(select(AIInfo).where(AIInfo.date == date).limit(1))
+        ai_info = result.scalars().first()
         if not ai_info:
             raise HTTPException(status_code=404, detail=f"No AI info found for date: {date}")
         
@@ -1837,20 +1729,20 @@ def get_content_by_index(date: str, info_index: int, language: str = "ko", db: S
             "info_index": info_index
         }
         
-        print(f"Content retrieved successfully: {title[:50]}...")
+        logger.debug("Content retrieved successfully: %s...", title[:50])
         return result
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error in get_content_by_index: {e}")
+        logger.error("Error in get_content_by_index: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get content: {str(e)}")
 
 @router.patch("/{date}/category/{info_index}")
 def update_category_only(date: str, info_index: int, category: str, db: Session = Depends(get_db)):
     """특정 날짜와 인덱스의 AI 정보 카테고리만 업데이트합니다."""
     try:
-        print(f"=== Updating Category for Date: {date}, Index: {info_index}, Category: {category} ===")
+        logger.debug("=== Updating Category for Date: %s, Index: %s, Category: %s ===", date, info_index, category)
         
         ai_info = db.query(AIInfo).filter(AIInfo.date == date).first()
         if not ai_info:
@@ -1875,10 +1767,11 @@ def update_category_only(date: str, info_index: int, category: str, db: Session
         
         # 카테고리 업데이트
         setattr(ai_info, category_field, category)
+        mark_ai_info_changed(db, date)
         db.commit()
         db.refresh(ai_info)
         
-        print(f"Category updated successfully: {category}")
+        logger.info("Category updated successfully: %s", category)
         return {
             "message": "카테고리가 업데이트되었습니다.",
             "date": date,
@@ -1889,34 +1782,35 @@ def update_category_only(date: str, info_index: int, category: str, db: Session
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error in update_category_only: {e}")
+        logger.error("Error in update_category_only: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to update category: {str(e)}")
 
 @router.put("/{date}/terms/{item_index}")
 def update_terms_only(date: str, item_index: int, terms_data: TermsUpdate, db: Session = Depends(get_db)):
     """특정 날짜와 항목의 용어만 수정합니다."""
     try:
-        print(f"=== 용어 수정 시작 ===")
-        print(f"날짜: {date}")
-        print(f"항목 인덱스: {item_index}")
-        print(f"수정할 용어 데이터: {terms_data}")
-        print(f"수정할 용어 데이터 타입: {type(terms_data)}")
-        print(f"수정할 용어 데이터 속성들: {dir(terms_data)}")
-        
-        # 각 언어별 용어 데이터 상세 로깅
-        if hasattr(terms_data, 'terms_ko') and terms_data.terms_ko is not None:
-            print(f"한국어 용어 데이터: {terms_data.terms_ko}")
-            print(f"한국어 용어 개수: {len(terms_data.terms_ko)}")
-            if len(terms_data.terms_ko) > 0:
-                print(f"한국어 첫 번째 용어: {terms_data.terms_ko[0]}")
-                print(f"한국어 두 번째 용어: {terms_data.terms_ko[1] if len(terms_data.terms_ko) > 1 else '없음'}")
-        
-        if hasattr(terms_data, 'terms_en') and terms_data.terms_en is not None:
-            print(f"영어 용어 데이터: {terms_data.terms_en}")
-            print(f"영어 용어 개수: {len(terms_data.terms_en)}")
-            if len(terms_data.terms_en) > 0:
-                print(f"영어 첫 번째 용어: {terms_data.terms_en[0]}")
-                print(f"영어 두 번째 용어: {terms_data.terms_en[1] if len(terms_data.terms_en) > 1 else '없음'}")
+        logger.debug("=== 용어 수정 시작 ===")
+        logger.debug("날짜: %s", date)
+        logger.debug("항목 인덱스: %s", item_index)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("수정할 용어 데이터: %s", terms_data)
+            logger.debug("수정할 용어 데이터 타입: %s", type(terms_data))
+            logger.debug("수정할 용어 데이터 속성들: %s", dir(terms_data))
+        
+            # 각 언어별 용어 데이터 상세 로깅
+            if hasattr(terms_data, 'terms_ko') and terms_data.terms_ko is not None:
+                logger.debug("한국어 용어 데이터: %s", terms_data.terms_ko)
+                logger.debug("한국어 용어 개수: %s", len(terms_data.terms_ko))
+                if len(terms_data.terms_ko) > 0:
+                    logger.debug("한국어 첫 번째 용어: %s", terms_data.terms_ko[0])
+                    logger.debug("한국어 두 번째 용어: %s", terms_data.terms_ko[1] if len(terms_data.terms_ko) > 1 else '없음')
+        
+            if hasattr(terms_data, 'terms_en') and terms_data.terms_en is not None:
+                logger.debug("영어 용어 데이터: %s", terms_data.terms_en)
+                logger.debug("영어 용어 개수: %s", len(terms_data.terms_en))
+                if len(terms_data.terms_en) > 0:
+                    logger.debug("영어 첫 번째 용어: %s", terms_data.terms_en[0])
+                    logger.debug("영어 두 번째 용어: %s", terms_data.terms_en[1] if len(terms_data.terms_en) > 1 else '없음')
         
         # 기존 AI 정보 조회
         ai_info = db.query(AIInfo).filter(AIInfo.date == date).first()
@@ -1942,7 +1836,7 @@ def update_terms_only(date: str, item_index: int, terms_data: TermsUpdate, db: S
         else:
             raise HTTPException(status_code=400, detail=f"잘못된 항목 인덱스: {item_index}")
         
-        print(f"선택된 필드: {terms_ko_field}, {terms_en_field}, {terms_ja_field}, {terms_zh_field}")
+        logger.debug("선택된 필드: %s, %s, %s, %s", terms_ko_field, terms_en_field, terms_ja_field, terms_zh_field)
         
         # 기존 용어 데이터 파싱
         try:
@@ -1953,67 +1847,67 @@ def update_terms_only(date: str, item_index: int, terms_data: TermsUpdate, db: S
         except json.JSONDecodeError:
             existing_terms_ko = existing_terms_en = existing_terms_ja = existing_terms_zh = []
         
-        print(f"기존 한국어 용어: {existing_terms_ko}")
-        print(f"기존 영어 용어: {existing_terms_en}")
-        print(f"기존 한국어 용어 개수: {len(existing_terms_ko)}")
-        print(f"기존 영어 용어 개수: {len(existing_terms_en)}")
+        logger.debug("기존 한국어 용어: %s", existing_terms_ko)
+        logger.debug("기존 영어 용어: %s", existing_terms_en)
+        logger.debug("기존 한국어 용어 개수: %s", len(existing_terms_ko))
+        logger.debug("기존 영어 용어 개수: %s", len(existing_terms_en))
         
         # 모든 용어 수정 (새로운 데이터가 제공된 경우)
         if terms_data.terms_ko is not None:
-            print(f"한국어 용어 전체 수정 시도: {terms_data.terms_ko}")
+            logger.debug("한국어 용어 전체 수정 시도: %s", terms_data.terms_ko)
             # TermItem 객체를 딕셔너리로 변환
             existing_terms_ko = [term.dict() for term in terms_data.terms_ko]
-            print(f"한국어 용어 전체 수정됨: {existing_terms_ko}")
-            print(f"수정 후 한국어 용어 개수: {len(existing_terms_ko)}")
+            logger.debug("한국어 용어 전체 수정됨: %s", existing_terms_ko)
+            logger.debug("수정 후 한국어 용어 개수: %s", len(existing_terms_ko))
         
         if terms_data.terms_en is not None:
-            print(f"영어 용어 전체 수정 시도: {terms_data.terms_en}")
+            logger.debug("영어 용어 전체 수정 시도: %s", terms_data.terms_en)
             # TermItem 객체를 딕셔너리로 변환
             existing_terms_en = [term.dict() for term in terms_data.terms_en]
-            print(f"영어 용어 전체 수정됨: {existing_terms_en}")
-            print(f"수정 후 영어 용어 개수: {len(existing_terms_en)}")
+            logger.debug("영어 용어 전체 수정됨: %s", existing_terms_en)
+            logger.debug("수정 후 영어 용어 개수: %s", len(existing_terms_en))
         
         if terms_data.terms_ja is not None:
-            print(f"일본어 용어 전체 수정 시도: {terms_data.terms_ja}")
+            logger.debug("일본어 용어 전체 수정 시도: %s", terms_data.terms_ja)
             # TermItem 객체를 딕셔너리로 변환
             existing_terms_ja = [term.dict() for term in terms_data.terms_ja]
-            print(f"일본어 용어 전체 수정됨: {existing_terms_ja}")
-            print(f"수정 후 일본어 용어 개수: {len(existing_terms_ja)}")
+            logger.debug("일본어 용어 전체 수정됨: %s", existing_terms_ja)
+            logger.debug("수정 후 일본어 용어 개수: %s", len(existing_terms_ja))
         
         if terms_data.terms_zh is not None:
-            print(f"중국어 용어 전체 수정 시도: {terms_data.terms_zh}")
+            logger.debug("중국어 용어 전체 수정 시도: %s", terms_data.terms_zh)
             # TermItem 객체를 딕셔너리로 변환
             existing_terms_zh = [term.dict() for term in terms_data.terms_zh]
-            print(f"중국어 용어 전체 수정됨: {existing_terms_zh}")
-            print(f"수정 후 중국어 용어 개수: {len(existing_terms_zh)}")
+            logger.debug("중국어 용어 전체 수정됨: %s", existing_terms_zh)
+            logger.debug("수정 후 중국어 용어 개수: %s", len(existing_terms_zh))
         
         # 하위 호환성을 위한 첫 번째 용어만 수정하는 방식 (새로운 방식이 사용되지 않은 경우)
         if terms_data.terms_ko is None and len(existing_terms_ko) > 0 and terms_data.target_terms_ko_first is not None:
             existing_terms_ko[0]['term'] = terms_data.target_terms_ko_first
             if terms_data.target_terms_ko_first_desc:
                 existing_terms_ko[0]['description'] = terms_data.target_terms_ko_first_desc
-            print(f"한국어 첫 번째 용어 수정됨 (하위 호환성): {existing_terms_ko[0]}")
+            logger.debug("한국어 첫 번째 용어 수정됨 (하위 호환성): %s", existing_terms_ko[0])
         
         if terms_data.terms_en is None and len(existing_terms_en) > 0 and terms_data.target_terms_en_first is not None:
             existing_terms_en[0]['term'] = terms_data.target_terms_en_first
             if terms_data.target_terms_en_first_desc:
                 existing_terms_en[0]['description'] = terms_data.target_terms_en_first_desc
-            print(f"영어 첫 번째 용어 수정됨 (하위 호환성): {existing_terms_en[0]}")
+            logger.debug("영어 첫 번째 용어 수정됨 (하위 호환성): %s", existing_terms_en[0])
         
         if terms_data.terms_ja is None and len(existing_terms_ja) > 0 and terms_data.target_terms_ja_first is not None:
             existing_terms_ja[0]['term'] = terms_data.target_terms_ja_first
             if terms_data.target_terms_ja_first_desc:
                 existing_terms_ja[0]['description'] = terms_data.target_terms_ja_first_desc
-            print(f"일본어 첫 번째 용어 수정됨 (하위 호환성): {existing_terms_ja[0]}")
+            logger.debug("일본어 첫 번째 용어 수정됨 (하위 호환성): %s", existing_terms_ja[0])
         
         if terms_data.terms_zh is None and len(existing_terms_zh) > 0 and terms_data.target_terms_zh_first is not None:
             existing_terms_zh[0]['term'] = terms_data.target_terms_zh_first
             if terms_data.target_terms_zh_first_desc:
                 existing_terms_zh[0]['description'] = terms_data.target_terms_zh_first_desc
-            print(f"중국어 첫 번째 용어 수정됨 (하위 호환성): {existing_terms_zh[0]}")
+            logger.debug("중국어 첫 번째 용어 수정됨 (하위 호환성): %s", existing_terms_zh[0])
         
-        print(f"최종 수정된 한국어 용어: {existing_terms_ko}")
-        print(f"최종 수정된 영어 용어: {existing_terms_en}")
+        logger.debug("최종 수정된 한국어 용어: %s", existing_terms_ko)
+        logger.debug("최종 수정된 영어 용어: %s", existing_terms_en)
         
         # 데이터베이스에 업데이트된 용어 저장
         setattr(ai_info, terms_ko_field, json.dumps(existing_terms_ko))
@@ -2022,10 +1916,11 @@ def update_terms_only(date: str, item_index: int, terms_data: TermsUpdate, db: S
         setattr(ai_info, terms_zh_field, json.dumps(existing_terms_zh))
         
         # 데이터베이스 커밋
+        mark_ai_info_changed(db, date)
         db.commit()
         db.refresh(ai_info)
         
-        print(f"용어 수정 완료! 데이터베이스에 저장됨")
+        logger.info("용어 수정 완료! 데이터베이스에 저장됨")
         
         # 수정된 데이터 반환
         return {
@@ -2045,7 +1940,7 @@ def update_terms_only(date: str, item_index: int, terms_data: TermsUpdate, db: S
     except HTTPException:
         raise
     except Exception as e:
-        print(f"용어 수정 중 오류 발생: {e}")
+        logger.error("용어 수정 중 오류 발생: %s", e)
         # 데이터베이스 롤백
         db.rollback()
         raise HTTPException(status_code=500, detail=f"용어 수정 실패: {str(e)}")
\ No newline at end of file
@@ -1,18 +1,24 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from datetime import timedelta
+from typing import Optional
 
 from ..database import get_db
 from ..models import User
 from ..schemas import UserCreate, UserLogin, UserResponse, Token
-from ..auth import verify_password, get_password_hash, create_access_token, get_current_active_user, ACCESS_TOKEN_EXPIRE_MINUTES
+from ..auth import verify_password_async, get_password_hash_async, create_access_token, get_current_active_user, invalidate_user_cache, ACCESS_TOKEN_EXPIRE_MINUTES
 from .logs import log_activity
+from ..utils.rate_limit import RateLimiter, client_ip
 
 router = APIRouter()
 
-@router.post("/register", response_model=UserResponse)
-def register_user(user_data: UserCreate, request: Request, db: Session = Depends(get_db)):
-    """사용자 회원가입"""
+# 속도 제한 (RATE_LIMIT_LOGIN 등 환경변수로 조정)
+login_ip_limiter = RateLimiter("login", "20/60")
+login_user_limiter = RateLimiter("login_user", "10/300")
+register_limiter = RateLimiter("register", "5/3600")
+
+def _check_new_user(db: Session, user_data: UserCreate) -> None:
     # 중복 사용자명 확인
     existing_user = db.query(User).filter(User.username == user_data.username).first()
     if existing_user:
@@ -29,9 +35,8 @@ def register_user(user_data: UserCreate, request: Request, db: Session = Depends
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
-    
-    # 새 사용자 생성
-    hashed_password = get_password_hash(user_data.password)
+
+def _create_user(db: Session, user_data: UserCreate, hashed_password: str, ip_address: str) -> User:
     db_user = User(
         username=user_data.username,
         email=user_data.email,
@@ -51,17 +56,46 @@ def register_user(user_data: UserCreate, request: Request, db: Session = Depends
         log_level="info",
         user_id=db_user.id,
         username=db_user.username,
-        ip_address=request.client.host if request.client else None
+        ip_address=ip_address
     )
-    
     return db_user
 
-@router.post("/login", response_model=Token)
-def login_user(user_credentials: UserLogin, request: Request, db: Session = Depends(get_db)):
-    """사용자 로그인"""
+@router.post("/register", response_model=UserResponse, dependencies=[Depends(register_limiter.by_ip())])
+async def register_user(user_data: UserCreate, request: Request, db: Session = Depends(get_db)):
+    """사용자 회원가입 (DB 작업은 스레드 풀, bcrypt는 전용 실행기를 await)"""
+    await run_in_threadpool(_check_new_user, db, user_data)
+    
+    # 새 사용자 생성
+    hashed_password = await get_password_hash_async(user_data.password)
+    return await run_in_threadpool(_create_user, db, user_data, hashed_password, client_ip(request))
+
+def _find_user(db: Session, username: str) -> Optional[User]:
+    return db.query(User).filter(User.username == username).first()
+
+def _log_login(db: Session, user: User, ip_address: str) -> None:
+    log_activity(
+        db=db,
+        action="로그인",
+        details=f"사용자가 성공적으로 로그인했습니다. 역할: {user.role}",
+        log_type="user",
+        log_level="success",
+        user_id=user.id,
+        username=user.username,
+        ip_address=ip_address
+    )
+
+@router.post("/login", response_model=Token, dependencies=[Depends(login_ip_limiter.by_ip())])
+async def login_user(user_credentials: UserLogin, request: Request, db: Session = Depends(get_db)):
+    """사용자 로그인 (DB 작업은 스레드 풀, bcrypt는 전용 실행기를 await)"""
+    # 계정+IP별 비밀번호 대입 방지: 실패한 시도만 세므로 다른 사람이 계정을 잠글 수 없음
+    ip_address = client_ip(request)
+    login_key = (user_credentials.username, ip_address)
+    login_user_limiter.ensure_allowed(login_key)
+    
     # 사용자 확인
-    user = db.query(User).filter(User.username == user_credentials.username).first()
-    if not user or not verify_password(user_credentials.password, user.hashed_password):
+    user = await run_in_threadpool(_find_user, db, user_credentials.username)
+    if not user or not await verify_password_async(user_credentials.password, user.hashed_password):
+        login_user_limiter.record(login_key)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -77,16 +111,7 @@ def login_user(user_credentials: UserLogin, request: Request, db: Session = Depe
     )
     
     # 로그인 로그 기록
-    log_activity(
-        db=db,
-        action="로그인",
-        details=f"사용자가 성공적으로 로그인했습니다. 역할: {user.role}",
-        log_type="user",
-        log_level="success",
-        user_id=user.id,
-        username=user.username,
-        ip_address=request.client.host if request.client else None
-    )
+    await run_in_threadpool(_log_login, db, user, ip_address)
     
     return {
         "access_token": access_token,
@@ -141,6 +166,7 @@ def update_user_role(
     
     user.role = new_role
     db.commit()
+    invalidate_user_cache(user.username)
     
     return {"message": "User role updated successfully"}
 
@@ -171,7 +197,9 @@ def delete_user(
             detail="Cannot delete your own account"
         )
     
+    username = user.username
     db.delete(user)
     db.commit()
+    invalidate_user_cache(username)
     
     return {"message": "User deleted successfully"} 
\ No newline at end of file
@@ -1,61 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from typing import List
 import logging
-import traceback
 
 from ..database import get_db
 from ..models import BaseContent
+from ..utils.content_version import bump_content_version
+from ..utils.etag import conditional_get
 from ..schemas import BaseContentCreate, BaseContentResponse
 
 router = APIRouter()
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 @router.get("/", response_model=List[BaseContentResponse])
-def get_all_base_contents(db: Session = Depends(get_db)):
+def get_all_base_contents(request: Request, response: Response, db: Session = Depends(get_db)):
+    not_modified = conditional_get(request, response, db, "base_content")
+    if not_modified:
+        return not_modified
     try:
-        logger.info("Getting all base contents...")
         contents = db.query(BaseContent).order_by(BaseContent.created_at.desc()).all()
-        logger.info(f"Found {len(contents)} base contents")
+        logger.debug("Found %s base contents", len(contents))
         
-        # 각 항목의 데이터 타입 확인
-        for i, content in enumerate(contents):
-            logger.info(f"Content {i+1}: id={content.id}, title={content.title}, created_at={content.created_at} (type: {type(content.created_at)})")
+        # 항목별 로그는 DEBUG일 때만 (응답 직렬화는 response_model이 한 번만 수행)
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, content in enumerate(contents):
+                logger.debug("Content %s: id=%s, title=%s, created_at=%s", i + 1, content.id, content.title, content.created_at)
         
-        # 응답 직렬화 테스트
-        try:
-            response_data = []
-            for content in contents:
-                # created_at이 None인 경우 현재 시간으로 설정
-                created_at = content.created_at
-                if created_at is None:
-                    from datetime import datetime
-                    created_at = datetime.now()
-                    logger.warning(f"Content {content.id} has None created_at, using current time")
-                
-                content_dict = {
-                    "id": content.id,
-                    "title": content.title,
-                    "content": content.content,
-                    "category": content.category,
-                    "created_at": created_at
-                }
-                response_data.append(content_dict)
-                logger.info(f"Serialized content {content.id} successfully")
-            
-            logger.info("All contents serialized successfully")
-            return contents
-        except Exception as serialize_error:
-            logger.error(f"Serialization error: {serialize_error}")
-            logger.error(f"Serialization traceback: {traceback.format_exc()}")
-            raise HTTPException(status_code=500, detail=f"Serialization error: {str(serialize_error)}")
-            
+        return contents
     except Exception as e:
-        logger.error(f"Error getting base contents: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error getting base contents: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get base contents: {str(e)}")
 
 @router.options("/")
@@ -67,7 +41,7 @@ def add_base_content(content_data: BaseContentCreate, db: Session = Depends(get_
     try:
         from datetime import datetime
         
-        logger.info(f"Adding base content: {content_data.title}")
+        logger.info("Adding base content: %s", content_data.title)
         
         # 입력 데이터 검증
         if not content_data.title or not content_data.title.strip():
@@ -86,22 +60,22 @@ def add_base_content(content_data: BaseContentCreate, db: Session = Depends(get_
             created_at=datetime.now()
         )
         db.add(db_content)
+        bump_content_version(db, "base_content")
         db.commit()
         db.refresh(db_content)
-        logger.info(f"Base content added successfully: {db_content.id}")
+        logger.info("Base content added successfully: %s", db_content.id)
         return db_content
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error adding base content: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error adding base content: %s", e)
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to add base content: {str(e)}")
 
 @router.put("/{content_id}", response_model=BaseContentResponse)
 def update_base_content(content_id: int, content_data: BaseContentCreate, db: Session = Depends(get_db)):
     try:
-        logger.info(f"Updating base content: {content_id}")
+        logger.info("Updating base content: %s", content_id)
         content = db.query(BaseContent).filter(BaseContent.id == content_id).first()
         if not content:
             raise HTTPException(status_code=404, detail="Base content not found")
@@ -110,44 +84,48 @@ def update_base_content(content_id: int, content_data: BaseContentCreate, db: Se
         content.content = content_data.content
         content.category = content_data.category
         
+        bump_content_version(db, "base_content")
         db.commit()
         db.refresh(content)
-        logger.info(f"Base content updated successfully: {content_id}")
+        logger.info("Base content updated successfully: %s", content_id)
         return content
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error updating base content: {e}")
+        logger.error("Error updating base content: %s", e)
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to update base content: {str(e)}")
 
 @router.delete("/{content_id}")
 def delete_base_content(content_id: int, db: Session = Depends(get_db)):
     try:
-        logger.info(f"Deleting base content: {content_id}")
+        logger.info("Deleting base content: %s", content_id)
         content = db.query(BaseContent).filter(BaseContent.id == content_id).first()
         if not content:
             raise HTTPException(status_code=404, detail="Base content not found")
         
         db.delete(content)
+        bump_content_version(db, "base_content")
         db.commit()
-        logger.info(f"Base content deleted successfully: {content_id}")
+        logger.info("Base content deleted successfully: %s", content_id)
         return {"message": "Base content deleted successfully"}
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting base content: {e}")
+        logger.error("Error deleting base content: %s", e)
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to delete base content: {str(e)}")
 
 @router.get("/category/{category}", response_model=List[BaseContentResponse])
-def get_base_contents_by_category(category: str, db: Session = Depends(get_db)):
+def get_base_contents_by_category(category: str, request: Request, response: Response, db: Session = Depends(get_db)):
+    not_modified = conditional_get(request, response, db, "base_content")
+    if not_modified:
+        return not_modified
     try:
-        logger.info(f"Getting base contents by category: {category}")
+        logger.info("Getting base contents by category: %s", category)
         contents = db.query(BaseContent).filter(BaseContent.category == category).all()
-        logger.info(f"Found {len(contents)} base contents in category: {category}")
+        logger.info("Found %s base contents in category: %s", len(contents), category)
         return contents
     except Exception as e:
-        logger.error(f"Error getting base contents by category: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error getting base contents by category: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get base contents by category: {str(e)}") 
\ No newline at end of file
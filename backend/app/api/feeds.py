@@ -0,0 +1,147 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+import logging
+
+from ..database import get_db, get_read_db
+from ..models import FeedEntry, FeedSource, User
+from ..schemas import FeedEntryResponse, FeedEntryStatusUpdate, FeedSourceCreate, FeedSourceResponse
+from ..auth import get_current_active_user
+from ..utils.ai_info_items import LANGUAGES
+from ..utils.feed_ingest import FEED_ALLOW_FILE_URLS, FEED_ENTRY_STATUSES, ingest_feeds
+
+router = APIRouter()
+
+logger = logging.getLogger(__name__)
+
+FEED_ENTRY_PAGE_MAX = 200
+
+def _require_admin(current_user: User):
+    if current_user.role != 'admin':
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+
+def _validate_source(source_data: FeedSourceCreate):
+    if source_data.language not in LANGUAGES:
+        raise HTTPException(status_code=400, detail=f"language must be one of {', '.join(LANGUAGES)}")
+    # file:// 은 서버의 로컬 파일을 읽게 되므로 FEED_ALLOW_FILE_URLS일 때만 허용 (CLI의 --add-fixtures는 DB에 직접 등록)
+    if FEED_ALLOW_FILE_URLS and source_data.url.startswith("file://"):
+        return
+    if not source_data.url.startswith(("http://", "https://")):
+        raise HTTPException(status_code=400, detail="url must start with http:// or https://")
+
+@router.get("/sources", response_model=List[FeedSourceResponse])
+def list_feed_sources(db: Session = Depends(get_read_db), current_user: User = Depends(get_current_active_user)):
+    """등록된 피드 목록 (관리자만)"""
+    _require_admin(current_user)
+    return db.query(FeedSource).order_by(FeedSource.id).all()
+
+@router.post("/sources", response_model=FeedSourceResponse)
+def add_feed_source(source_data: FeedSourceCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+    """피드를 등록합니다. (관리자만)"""
+    _require_admin(current_user)
+    _validate_source(source_data)
+    if db.query(FeedSource.id).filter(FeedSource.url == source_data.url).first():
+        raise HTTPException(status_code=409, detail="Feed already registered")
+    source = FeedSource(**source_data.model_dump())
+    db.add(source)
+    db.commit()
+    db.refresh(source)
+    return source
+
+@router.put("/sources/{source_id}", response_model=FeedSourceResponse)
+def update_feed_source(source_id: int, source_data: FeedSourceCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+    """피드 정보를 수정합니다. 주소가 바뀌면 조건부 GET 상태를 초기화합니다. (관리자만)"""
+    _require_admin(current_user)
+    _validate_source(source_data)
+    source = db.query(FeedSource).filter(FeedSource.id == source_id).first()
+    if not source:
+        raise HTTPException(status_code=404, detail="Feed source not found")
+    if source.url != source_data.url:
+        source.etag = None
+        source.last_modified = None
+    for field, value in source_data.model_dump().items():
+        setattr(source, field, value)
+    db.commit()
+    db.refresh(source)
+    return source
+
+@router.delete("/sources/{source_id}")
+def delete_feed_source(source_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+    """피드를 삭제합니다. 이미 가져온 후보는 남겨 둡니다. (관리자만)"""
+    _require_admin(current_user)
+    source = db.query(FeedSource).filter(FeedSource.id == source_id).first()
+    if not source:
+        raise HTTPException(status_code=404, detail="Feed source not found")
+    db.delete(source)
+    db.commit()
+    return {"message": "Feed source deleted successfully"}
+
+@router.post("/ingest")
+async def run_feed_ingest(
+    target_date: Optional[str] = None,
+    source_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    활성화된 피드(또는 source_id 하나)를 동시에 가져와서 새 기사를 target_date(기본 오늘)의 후보로 저장합니다. (관리자만)
+    변경 없는 피드는 304로 건너뛰고, 이미 저장된 기사는 내용 해시로 걸러냅니다.
+    """
+    _require_admin(current_user)
+    report = await ingest_feeds(db, target_date=target_date, source_ids=[source_id] if source_id else None)
+    logger.info(
+        "Feed ingest for %s: new=%s duplicates=%s not_modified=%s failed=%s in %ss",
+        report["target_date"], report["new"], report["duplicates"], report["not_modified"], report["failed"], report["total_seconds"]
+    )
+    return report
+
+@router.get("/candidates", response_model=List[FeedEntryResponse])
+def list_feed_candidates(
+    date: Optional[str] = None,
+    status: Optional[str] = "candidate",
+    category: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """날짜/상태/카테고리별 후보 기사 목록 (최신 기사부터, 관리자만)"""
+    _require_admin(current_user)
+    if status and status not in FEED_ENTRY_STATUSES:
+        raise HTTPException(status_code=400, detail=f"status must be one of {', '.join(FEED_ENTRY_STATUSES)}")
+    query = db.query(FeedEntry)
+    if date:
+        query = query.filter(FeedEntry.target_date == date)
+    if status:
+        query = query.filter(FeedEntry.status == status)
+    if category:
+        query = query.filter(FeedEntry.category == category)
+    limit = max(1, min(limit, FEED_ENTRY_PAGE_MAX))
+    return (
+        query.order_by(FeedEntry.published_at.desc().nullslast(), FeedEntry.id.desc())
+        .offset(max(0, offset))
+        .limit(limit)
+        .all()
+    )
+
+@router.patch("/candidates/{entry_id}", response_model=FeedEntryResponse)
+def update_feed_candidate_status(
+    entry_id: int,
+    status_data: FeedEntryStatusUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """후보의 상태를 바꿉니다. (AI 정보로 등록했으면 published, 쓰지 않을 기사는 rejected, 관리자만)"""
+    _require_admin(current_user)
+    if status_data.status not in FEED_ENTRY_STATUSES:
+        raise HTTPException(status_code=400, detail=f"status must be one of {', '.join(FEED_ENTRY_STATUSES)}")
+    entry = db.query(FeedEntry).filter(FeedEntry.id == entry_id).first()
+    if not entry:
+        raise HTTPException(status_code=404, detail="Feed entry not found")
+    entry.status = status_data.status
+    db.commit()
+    db.refresh(entry)
+    return entry
@@ -3,14 +3,21 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime, timedelta
 import json
+import logging
 
-from ..database import get_db
+from ..database import get_db, get_read_db
 from ..models import ActivityLog, User
 from ..auth import get_current_active_user
+from ..utils.rate_limit import RateLimiter, client_ip as resolve_client_ip
 
 router = APIRouter()
 
-@router.post("/")
+logger = logging.getLogger(__name__)
+
+# 로그 수집 속도 제한 (RATE_LIMIT_LOG_INGEST로 조정)
+log_ingest_limiter = RateLimiter("log_ingest", "120/60")
+
+@router.post("/", dependencies=[Depends(log_ingest_limiter.by_ip())])
 def create_log(
     request: Request,
     log_data: dict,
@@ -19,7 +26,7 @@ def create_log(
     """활동 로그를 생성합니다."""
     try:
         # IP 주소 추출
-        client_ip = request.client.host if request.client else None
+        client_ip = resolve_client_ip(request)
         user_agent = request.headers.get("user-agent", "")
         
         # 로그 생성
@@ -56,34 +63,31 @@ def get_logs(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """활동 로그 목록을 조회합니다. (관리자만)"""
     
     try:
-        print(f"🔍 로그 조회 요청 시작")
-        print(f"👤 현재 사용자: {current_user.username if current_user else 'None'}")
-        print(f"🏷️ 사용자 역할: {current_user.role if current_user else 'None'}")
-        print(f"📊 조회 파라미터: skip={skip}, limit={limit}, log_type={log_type}, log_level={log_level}")
+        logger.debug("로그 조회: user=%s role=%s skip=%s limit=%s log_type=%s log_level=%s",
+                     current_user.username if current_user else None, current_user.role if current_user else None,
+                     skip, limit, log_type, log_level)
         
         if not current_user:
-            print("❌ 현재 사용자가 None입니다")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User authentication failed"
             )
         
         if current_user.role != 'admin':
-            print(f"❌ 권한 없음 - 사용자 역할: {current_user.role} (admin 필요)")
+            logger.warning("로그 조회 권한 없음 - 사용자 역할: %s (admin 필요)", current_user.role)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not enough permissions - Admin role required"
             )
         
-        print("✅ 권한 확인 완료 - 로그 조회 진행")
-        
     except Exception as e:
-        print(f"❌ 로그 조회 전처리 에러: {str(e)}")
+        if not isinstance(e, HTTPException):
+            logger.exception("로그 조회 전처리 에러: %s", e)
         if isinstance(e, HTTPException):
             raise e
         else:
@@ -164,12 +168,10 @@ def test_logs_api():
 def get_logs_simple(
     skip: int = 0,
     limit: int = 50,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """임시 로그 조회 엔드포인트 (인증 없음) - 디버깅용"""
     try:
-        print("🔍 인증 없는 로그 조회 시작")
-        
         # 간단한 로그 조회
         logs = db.query(ActivityLog).order_by(
             ActivityLog.created_at.desc()
@@ -177,7 +179,7 @@ def get_logs_simple(
         
         total_count = db.query(ActivityLog).count()
         
-        print(f"📊 조회 결과: {len(logs)}개 로그, 전체 {total_count}개")
+        logger.debug("간단 로그 조회 결과: %d개 로그, 전체 %d개", len(logs), total_count)
         
         # 응답 데이터 구성
         logs_data = []
@@ -192,8 +194,6 @@ def get_logs_simple(
                 "details": log.details or ""
             })
         
-        print("✅ 로그 조회 성공")
-        
         return {
             "logs": logs_data,
             "total": total_count,
@@ -203,7 +203,7 @@ def get_logs_simple(
         }
         
     except Exception as e:
-        print(f"❌ 간단 로그 조회 실패: {str(e)}")
+        logger.exception("간단 로그 조회 실패: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Simple log query failed: {str(e)}"
@@ -212,7 +212,7 @@ def get_logs_simple(
 @router.get("/stats")
 def get_log_stats(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """로그 통계를 조회합니다. (관리자만)"""
     
@@ -322,5 +322,5 @@ def log_activity(
     
     except Exception as e:
         db.rollback()
-        print(f"Failed to create log: {str(e)}")
+        logger.exception("Failed to create log: %s", e)
         return None 
\ No newline at end of file
@@ -1,120 +1,179 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import datetime
+import json
+import logging
+import os
+import secrets
 
-from ..database import get_db
-from ..models import Quiz
-from ..schemas import QuizCreate, QuizResponse
+from ..auth import get_current_active_user
+from ..database import ReadSessionLocal, get_db, get_read_db
+from ..models import Quiz, QuizSession, User
+from ..schemas import (
+    QuizCreate, QuizResponse, QuizLocalizedResponse, QuizTopicCount,
+    QuizSessionCreate, QuizSessionResponse, QuizSessionAnswer, QuizSessionResult
+)
+from ..utils.ai_info_items import LANGUAGES
+from ..utils.bulk_import import (
+    BULK_FORMATS, MEDIA_TYPES, BulkReport, detect_format, iter_csv_bytes, iter_ndjson_bytes,
+    iter_records, validation_message
+)
+from ..utils.content_version import bump_content_version
+from ..utils.etag import conditional_get
+from ..utils.random_sampler import RandomIdSampler
+from .user_progress import update_quiz_score
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
+def _require_admin(current_user: User):
+    if current_user.role != 'admin':
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+
+QUIZ_LEGACY_FIELDS = ("question", "option1", "option2", "option3", "option4", "explanation")
+QUIZ_TRANSLATED_FIELDS = {f"{field}_{language}" for field in QUIZ_LEGACY_FIELDS for language in LANGUAGES}
+# 내보내기 컬럼 (id + QuizCreate 필드, 그대로 /bulk로 다시 가져올 수 있음)
+QUIZ_EXPORT_FIELDS = ["id"] + list(QuizCreate.model_fields)
+
+QUIZ_BULK_BATCH_SIZE = 500
+QUIZ_BULK_MAX_ROWS = int(os.getenv("QUIZ_BULK_MAX_ROWS", "20000"))
+
+def _question_column(language: str):
+    if language not in LANGUAGES:
+        raise HTTPException(status_code=400, detail=f"language must be one of {', '.join(LANGUAGES)}")
+    return getattr(Quiz, f"question_{language}")
+
+def _localized(field: str, language: str):
+    """요청 언어 값이 없으면 한국어, 그다음 기존 단일 언어 컬럼 값을 사용 (DB에서 한 컬럼으로 합쳐서 조회)"""
+    columns = [getattr(Quiz, f"{field}_{language}")]
+    if language != "ko":
+        columns.append(getattr(Quiz, f"{field}_ko"))
+    columns.append(getattr(Quiz, field))
+    return func.coalesce(*columns).label(field)
+
 @router.get("/topics", response_model=List[str])
-def get_all_quiz_topics(language: str = "ko", db: Session = Depends(get_db)):
+def get_all_quiz_topics(request: Request, response: Response, language: str = "ko", db: Session = Depends(get_read_db)):
     """언어별로 주제를 반환합니다. 해당 언어에 데이터가 있는 주제만 반환합니다."""
+    question_column = _question_column(language)
+    not_modified = conditional_get(request, response, db, "quiz")
+    if not_modified:
+        return not_modified
     try:
-        # 언어별 컬럼 선택 (올바른 컬럼명 사용)
-        question_suffix = f"question_{language}"
-        
-        # 해당 언어에 데이터가 있는 주제만 필터링
-        topics = []
-        quizzes = db.query(Quiz).all()
-        
-        for quiz in quizzes:
-            # 해당 언어의 문제가 있는지 확인
-            if hasattr(quiz, question_suffix) and getattr(quiz, question_suffix):
-                topics.append(quiz.topic)
-        
-        # 중복 제거하고 반환
-        unique_topics = list(set(topics))
-        print(f"DEBUG: get_all_quiz_topics called with language: {language}")
-        print(f"DEBUG: Found {len(unique_topics)} topics with {language} data")
-        print(f"DEBUG: Using column: {question_suffix}")
-        return unique_topics
+        # 해당 언어에 문제가 있는 주제만 DISTINCT로 조회
+        topics = [
+            row.topic for row in db.query(Quiz.topic)
+            .filter(question_column.isnot(None), question_column != "", Quiz.topic.isnot(None))
+            .distinct()
+            .order_by(Quiz.topic)
+        ]
+        logger.debug("Found %s quiz topics with %s data", len(topics), language)
+        return topics
         
     except Exception as e:
-        print(f"ERROR: get_all_quiz_topics failed: {e}")
+        logger.error("get_all_quiz_topics failed: %s", e)
         # 에러 발생 시 기본 주제 반환
         return ["AI"]
 
-@router.get("/{topic}", response_model=List[QuizResponse])
-def get_quiz_by_topic(topic: str, language: str = "ko", db: Session = Depends(get_db)):
-    """주제별로 퀴즈를 반환합니다. 해당 언어에 데이터가 있는 퀴즈만 반환합니다."""
+@router.get("/topics/counts", response_model=List[QuizTopicCount])
+def get_quiz_topic_counts(request: Request, response: Response, language: str = "ko", db: Session = Depends(get_read_db)):
+    """주제별 문제 수를 반환합니다. (해당 언어에 문제가 있는 것만)"""
+    question_column = _question_column(language)
+    not_modified = conditional_get(request, response, db, "quiz")
+    if not_modified:
+        return not_modified
+    rows = (
+        db.query(Quiz.topic, func.count(Quiz.id))
+        .filter(question_column.isnot(None), question_column != "", Quiz.topic.isnot(None))
+        .group_by(Quiz.topic)
+        .order_by(Quiz.topic)
+        .all()
+    )
+    return [{"topic": topic, "count": count} for topic, count in rows]
+
+@router.get("/export")
+def export_quiz(format: str = "ndjson", topic: Optional[str] = None, current_user: User = Depends(get_current_active_user)):
+    """퀴즈를 NDJSON 또는 CSV로 스트리밍합니다. (관리자만, 전체를 메모리에 올리지 않고 배치 단위로 읽음)"""
+    _require_admin(current_user)
+    if format not in BULK_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(BULK_FORMATS)}")
+    
+    def rows():
+        # 응답 스트리밍이 끝날 때까지 쓰는 세션이므로 요청 의존성 대신 직접 열고 닫음
+        db = ReadSessionLocal()
+        try:
+            query = db.query(*[getattr(Quiz, field) for field in QUIZ_EXPORT_FIELDS]).order_by(Quiz.id)
+            if topic:
+                query = query.filter(Quiz.topic == topic)
+            for row in query.yield_per(QUIZ_BULK_BATCH_SIZE):
+                yield row._asdict()
+        finally:
+            db.close()
+    
+    chunks = iter_csv_bytes(QUIZ_EXPORT_FIELDS, rows()) if format == "csv" else iter_ndjson_bytes(rows())
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="quiz_export.{format}"'}
+    )
+
+# /{topic}보다 먼저 등록해야 하는 GET 라우트는 이 위에 둘 것
+@router.get("/{topic}", response_model=List[QuizLocalizedResponse])
+def get_quiz_by_topic(topic: str, request: Request, response: Response, language: str = "ko", db: Session = Depends(get_read_db)):
+    """
+    주제별로 퀴즈를 반환합니다. 해당 언어에 데이터가 있는 퀴즈만 반환합니다.
+    요청한 언어의 컬럼만 조회해서 question/option1~4/explanation 으로 돌려줍니다.
+    """
+    question_column = _question_column(language)
+    not_modified = conditional_get(request, response, db, "quiz")
+    if not_modified:
+        return not_modified
     try:
-        # 언어별 컬럼 선택
-        question_suffix = f"question_{language}"
-        
-        # 해당 주제의 퀴즈 중에서 선택된 언어에 데이터가 있는 것만 필터링
-        quizzes = db.query(Quiz).filter(Quiz.topic == topic).all()
-        filtered_quizzes = []
-        
-        for quiz in quizzes:
-            # 해당 언어의 문제가 있는지 확인
-            if hasattr(quiz, question_suffix) and getattr(quiz, question_suffix):
-                filtered_quizzes.append(quiz)
-        
-        print(f"DEBUG: get_quiz_by_topic called with topic: {topic}, language: {language}")
-        print(f"DEBUG: Found {len(filtered_quizzes)} quizzes with {language} data out of {len(quizzes)} total")
-        print(f"DEBUG: Using column: {question_suffix}")
-        
-        return filtered_quizzes
+        rows = (
+            db.query(
+                Quiz.id,
+                Quiz.topic,
+                question_column.label("question"),
+                _localized("option1", language),
+                _localized("option2", language),
+                _localized("option3", language),
+                _localized("option4", language),
+                _localized("explanation", language),
+                Quiz.correct,
+                Quiz.created_at
+            )
+            .filter(Quiz.topic == topic, question_column.isnot(None), question_column != "")
+            .order_by(Quiz.id)
+            .all()
+        )
+        logger.debug("Found %s quizzes for topic %s with %s data", len(rows), topic, language)
+        return [dict(row._mapping, language=language) for row in rows]
         
     except Exception as e:
-        print(f"ERROR: get_quiz_by_topic failed: {e}")
+        logger.error("get_quiz_by_topic failed: %s", e)
         # 에러 발생 시 빈 배열 반환
         return []
 
+def _quiz_columns(quiz_data: QuizCreate) -> dict:
+    """QuizCreate를 Quiz 컬럼 값으로 바꿉니다. (단건 추가/수정과 대량 가져오기에서 같이 사용)"""
+    columns = quiz_data.model_dump(include=QUIZ_TRANSLATED_FIELDS | {"topic", "correct"})
+    # 기존 단일 언어 필드들 (하위 호환성을 위해 유지, 없으면 한국어 값 사용)
+    for field in QUIZ_LEGACY_FIELDS:
+        columns[field] = getattr(quiz_data, field) or getattr(quiz_data, f"{field}_ko")
+    return columns
+
 @router.post("/", response_model=QuizResponse)
 def add_quiz(quiz_data: QuizCreate, db: Session = Depends(get_db)):
-    db_quiz = Quiz(
-        topic=quiz_data.topic,
-        
-        # 다국어 지원 - 문제
-        question_ko=quiz_data.question_ko,
-        question_en=quiz_data.question_en,
-        question_ja=quiz_data.question_ja,
-        question_zh=quiz_data.question_zh,
-        
-        # 다국어 지원 - 선택지 1
-        option1_ko=quiz_data.option1_ko,
-        option1_en=quiz_data.option1_en,
-        option1_ja=quiz_data.option1_ja,
-        option1_zh=quiz_data.option1_zh,
-        
-        # 다국어 지원 - 선택지 2
-        option2_ko=quiz_data.option2_ko,
-        option2_en=quiz_data.option2_en,
-        option2_ja=quiz_data.option2_ja,
-        option2_zh=quiz_data.option2_zh,
-        
-        # 다국어 지원 - 선택지 3
-        option3_ko=quiz_data.option3_ko,
-        option3_en=quiz_data.option3_en,
-        option3_ja=quiz_data.option3_ja,
-        option3_zh=quiz_data.option3_zh,
-        
-        # 다국어 지원 - 선택지 4
-        option4_ko=quiz_data.option4_ko,
-        option4_en=quiz_data.option4_en,
-        option4_ja=quiz_data.option4_ja,
-        option4_zh=quiz_data.option4_zh,
-        
-        # 다국어 지원 - 설명
-        explanation_ko=quiz_data.explanation_ko,
-        explanation_en=quiz_data.explanation_en,
-        explanation_ja=quiz_data.explanation_ja,
-        explanation_zh=quiz_data.explanation_zh,
-        
-        correct=quiz_data.correct,
-        
-        # 기존 단일 언어 필드들 (하위 호환성을 위해 유지)
-        question=quiz_data.question or quiz_data.question_ko,
-        option1=quiz_data.option1 or quiz_data.option1_ko,
-        option2=quiz_data.option2 or quiz_data.option2_ko,
-        option3=quiz_data.option3 or quiz_data.option3_ko,
-        option4=quiz_data.option4 or quiz_data.option4_ko,
-        explanation=quiz_data.explanation or quiz_data.explanation_ko
-    )
+    db_quiz = Quiz(**_quiz_columns(quiz_data))
     db.add(db_quiz)
+    bump_content_version(db, "quiz")
     db.commit()
     db.refresh(db_quiz)
     return db_quiz
@@ -125,58 +184,96 @@ def update_quiz(quiz_id: int, quiz_data: QuizCreate, db: Session = Depends(get_d
     if not quiz:
         raise HTTPException(status_code=404, detail="Quiz not found")
     
-    quiz.topic = quiz_data.topic
-    
-    # 다국어 지원 - 문제
-    quiz.question_ko = quiz_data.question_ko
-    quiz.question_en = quiz_data.question_en
-    quiz.question_ja = quiz_data.question_ja
-    quiz.question_zh = quiz_data.question_zh
-    
-    # 다국어 지원 - 선택지 1
-    quiz.option1_ko = quiz_data.option1_ko
-    quiz.option1_en = quiz_data.option1_en
-    quiz.option1_ja = quiz_data.option1_ja
-    quiz.option1_zh = quiz_data.option1_zh
-    
-    # 다국어 지원 - 선택지 2
-    quiz.option2_ko = quiz_data.option2_ko
-    quiz.option2_en = quiz_data.option2_en
-    quiz.option2_ja = quiz_data.option2_ja
-    quiz.option2_zh = quiz_data.option2_zh
-    
-    # 다국어 지원 - 선택지 3
-    quiz.option3_ko = quiz_data.option3_ko
-    quiz.option3_en = quiz_data.option3_en
-    quiz.option3_ja = quiz_data.option3_ja
-    quiz.option3_zh = quiz_data.option3_zh
-    
-    # 다국어 지원 - 선택지 4
-    quiz.option4_ko = quiz_data.option4_ko
-    quiz.option4_en = quiz_data.option4_en
-    quiz.option4_ja = quiz_data.option4_ja
-    quiz.option4_zh = quiz_data.option4_zh
-    
-    # 다국어 지원 - 설명
-    quiz.explanation_ko = quiz_data.explanation_ko
-    quiz.explanation_en = quiz_data.explanation_en
-    quiz.explanation_ja = quiz_data.explanation_ja
-    quiz.explanation_zh = quiz_data.explanation_zh
-    
-    quiz.correct = quiz_data.correct
-    
-    # 기존 단일 언어 필드들 (하위 호환성을 위해 유지)
-    quiz.question = quiz_data.question or quiz_data.question_ko
-    quiz.option1 = quiz_data.option1 or quiz_data.option1_ko
-    quiz.option2 = quiz_data.option2 or quiz_data.option2_ko
-    quiz.option3 = quiz_data.option3 or quiz_data.option3_ko
-    quiz.option4 = quiz_data.option4 or quiz_data.option4_ko
-    quiz.explanation = quiz_data.explanation or quiz_data.explanation_ko
+    for field, value in _quiz_columns(quiz_data).items():
+        setattr(quiz, field, value)
     
+    bump_content_version(db, "quiz")
     db.commit()
     db.refresh(quiz)
     return quiz
 
+def _bulk_quiz_row(data: dict) -> dict:
+    quiz_data = QuizCreate.model_validate(data)
+    if not 0 <= quiz_data.correct <= 3:
+        raise ValueError("correct: must be between 0 and 3")
+    return _quiz_columns(quiz_data)
+
+def _insert_quiz_batch(db: Session, rows: List[dict]) -> None:
+    # executemany 한 번으로 배치 전체를 INSERT (커밋은 마지막에 한 번)
+    db.execute(insert(Quiz), rows)
+
+def _commit_quiz_import(db: Session) -> None:
+    bump_content_version(db, "quiz")
+    db.commit()
+
+@router.post("/bulk")
+async def bulk_import_quiz(
+    request: Request,
+    format: Optional[str] = None,
+    dry_run: bool = False,
+    atomic: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    NDJSON 또는 CSV 본문으로 퀴즈를 한꺼번에 추가합니다. (관리자만)
+    형식은 format 파라미터 또는 Content-Type(application/x-ndjson, text/csv)으로 정합니다.
+    본문을 스트리밍으로 읽으며 행마다 검증하고, 유효한 행은 QUIZ_BULK_BATCH_SIZE개씩 INSERT한 뒤
+    전체를 한 트랜잭션으로 커밋합니다. 잘못된 행은 줄 번호와 함께 errors로 보고합니다.
+    - dry_run: 검증만 하고 저장하지 않음
+    - atomic: 잘못된 행이 하나라도 있으면 아무것도 저장하지 않음
+    """
+    _require_admin(current_user)
+    fmt = detect_format(request.headers.get("content-type"), format)
+    if fmt is None:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(BULK_FORMATS)} (query parameter or Content-Type)")
+    
+    report = BulkReport(fmt, dry_run)
+    batch: List[dict] = []
+    written = 0
+    try:
+        async for record in iter_records(request.stream(), fmt):
+            report.received += 1
+            if report.received > QUIZ_BULK_MAX_ROWS:
+                raise HTTPException(status_code=413, detail=f"Too many rows (max {QUIZ_BULK_MAX_ROWS})")
+            if record.error:
+                report.error(record.line, record.error)
+                continue
+            try:
+                batch.append(_bulk_quiz_row(record.data))
+            except ValueError as e:
+                report.error(record.line, validation_message(e))
+                continue
+            
+            if len(batch) >= QUIZ_BULK_BATCH_SIZE:
+                if not dry_run:
+                    await run_in_threadpool(_insert_quiz_batch, db, batch)
+                written += len(batch)
+                batch = []
+        
+        if batch and not dry_run:
+            await run_in_threadpool(_insert_quiz_batch, db, batch)
+        written += len(batch)
+        
+        if dry_run or (atomic and report.failed) or not written:
+            await run_in_threadpool(db.rollback)
+        else:
+            await run_in_threadpool(_commit_quiz_import, db)
+            report.inserted = written
+    except HTTPException:
+        await run_in_threadpool(db.rollback)
+        raise
+    except Exception as e:
+        await run_in_threadpool(db.rollback)
+        logger.exception("bulk_import_quiz failed after %s rows", report.received)
+        raise HTTPException(status_code=500, detail=f"Bulk import failed: {e}")
+    
+    logger.info(
+        "Quiz bulk import (%s): received=%s inserted=%s failed=%s dry_run=%s",
+        fmt, report.received, report.inserted, report.failed, dry_run
+    )
+    return report.as_dict()
+
 @router.delete("/{quiz_id}")
 def delete_quiz(quiz_id: int, db: Session = Depends(get_db)):
     quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first()
@@ -184,9 +281,142 @@ def delete_quiz(quiz_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Quiz not found")
     
     db.delete(quiz)
+    bump_content_version(db, "quiz")
     db.commit()
     return {"message": "Quiz deleted successfully"}
 
+# 퀴즈 세션: 서버에서 문제를 뽑고 채점 (정답/해설은 채점 후에만 반환)
+QUIZ_SESSION_MAX_QUESTIONS = 50
+
+def _load_quiz_ids(db: Session, key):
+    topic, language = key
+    question_column = getattr(Quiz, f"question_{language}")
+    return [
+        row[0] for row in db.query(Quiz.id)
+        .filter(Quiz.topic == topic, question_column.isnot(None), question_column != "")
+    ]
+
+# (주제, 언어)별 문제 id 배열 (quiz 버전이 바뀌면 다시 읽음)
+quiz_sampler = RandomIdSampler("quiz", _load_quiz_ids)
+
+@router.post("/session", response_model=QuizSessionResponse)
+def create_quiz_session(session_data: QuizSessionCreate, db: Session = Depends(get_db)):
+    """주제에서 문제를 무작위로 뽑아 세션을 만들고, 문제와 보기만 반환합니다."""
+    language = session_data.language
+    question_column = _question_column(language)
+    count = max(1, min(session_data.count, QUIZ_SESSION_MAX_QUESTIONS))
+    
+    quiz_ids = quiz_sampler.sample(db, count, key=(session_data.topic, language))
+    if not quiz_ids:
+        raise HTTPException(status_code=404, detail="No quizzes found for this topic")
+    
+    rows = {
+        row.id: row for row in db.query(
+            Quiz.id,
+            question_column.label("question"),
+            _localized("option1", language),
+            _localized("option2", language),
+            _localized("option3", language),
+            _localized("option4", language)
+        ).filter(Quiz.id.in_(quiz_ids))
+    }
+    # 배열과 테이블이 어긋난 경우(버전 없이 삭제된 문제)는 빼고 출제
+    quiz_ids = [quiz_id for quiz_id in quiz_ids if quiz_id in rows]
+    if not quiz_ids:
+        quiz_sampler.invalidate((session_data.topic, language))
+        raise HTTPException(status_code=404, detail="No quizzes found for this topic")
+    
+    quiz_session = QuizSession(
+        id=secrets.token_urlsafe(16),
+        session_id=session_data.session_id,
+        topic=session_data.topic,
+        language=language,
+        question_ids=json.dumps(quiz_ids),
+        total=len(quiz_ids)
+    )
+    db.add(quiz_session)
+    db.commit()
+    
+    return {
+        "id": quiz_session.id,
+        "topic": quiz_session.topic,
+        "language": language,
+        "total": len(quiz_ids),
+        "questions": [
+            {
+                "id": quiz_id,
+                "question": rows[quiz_id].question,
+                "options": [rows[quiz_id].option1, rows[quiz_id].option2, rows[quiz_id].option3, rows[quiz_id].option4]
+            }
+            for quiz_id in quiz_ids
+        ]
+    }
+
+@router.post("/session/{quiz_session_id}/answer", response_model=QuizSessionResult)
+def answer_quiz_session(quiz_session_id: str, answer_data: QuizSessionAnswer, request: Request, db: Session = Depends(get_db)):
+    """세션의 답안을 채점하고, 사용자 세션이 있으면 기존 퀴즈 점수 기록(update_quiz_score)으로 저장합니다."""
+    quiz_session = db.query(QuizSession).filter(QuizSession.id == quiz_session_id).first()
+    if not quiz_session:
+        raise HTTPException(status_code=404, detail="Quiz session not found")
+    if quiz_session.completed_at is not None:
+        raise HTTPException(status_code=409, detail="Quiz session already answered")
+    
+    quiz_ids = json.loads(quiz_session.question_ids)
+    answer_keys = {
+        row.id: row for row in db.query(
+            Quiz.id,
+            Quiz.correct,
+            _localized("explanation", quiz_session.language)
+        ).filter(Quiz.id.in_(quiz_ids))
+    }
+    
+    results = []
+    score = 0
+    for quiz_id in quiz_ids:
+        answer_key = answer_keys.get(quiz_id)
+        if answer_key is None:
+            # 세션을 만든 뒤 삭제된 문제는 오답 처리
+            results.append({"quiz_id": quiz_id, "selected": answer_data.answers.get(quiz_id), "correct": -1, "is_correct": False})
+            continue
+        selected = answer_data.answers.get(quiz_id)
+        is_correct = selected is not None and selected == answer_key.correct
+        score += 1 if is_correct else 0
+        results.append({
+            "quiz_id": quiz_id,
+            "selected": selected,
+            "correct": answer_key.correct,
+            "is_correct": is_correct,
+            "explanation": answer_key.explanation
+        })
+    
+    total = quiz_session.total
+    # 동시에 들어온 답안 중 하나만 채점되도록 미완료 상태인 세션만 조건부 UPDATE로 차지 (행 잠금은 커밋까지 유지)
+    claimed = db.query(QuizSession).filter(
+        QuizSession.id == quiz_session_id,
+        QuizSession.completed_at.is_(None)
+    ).update({
+        QuizSession.answers: json.dumps({str(quiz_id): selected for quiz_id, selected in answer_data.answers.items()}),
+        QuizSession.score: score,
+        QuizSession.completed_at: datetime.now()
+    }, synchronize_session=False)
+    if claimed != 1:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Quiz session already answered")
+    
+    if quiz_session.session_id:
+        # 기존 점수 기록 흐름 사용 (같은 트랜잭션으로 커밋됨)
+        update_quiz_score(quiz_session.session_id, {"score": score, "total_questions": total}, request, db)
+    else:
+        db.commit()
+    
+    return {
+        "id": quiz_session_id,
+        "score": score,
+        "total": total,
+        "quiz_score": int(score / total * 100) if total else 0,
+        "results": results
+    }
+
 @router.options("/")
 def options_quiz():
     return Response(status_code=200)
@@ -1,88 +1,117 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, FileResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import json
+import functools
 import io
 import os
+import shutil
+import tempfile
 
-from ..database import get_db
+from ..database import get_db, SessionLocal
 from ..models import User, AIInfo, UserProgress, ActivityLog, BackupHistory, Quiz, Prompt, BaseContent, Term
-from ..auth import get_current_active_user
+from ..auth import get_current_active_user, invalidate_user_cache
+from ..utils.backup_stream import iter_backup_stream, build_column_coercers, coerce_record, BackupFormatError
+from ..utils.jobs import job_runner
+from ..utils.table_stats import table_stats_provider
+from ..utils.content_version import bump_all_content_versions
+from ..utils.search_index import search_index
+from ..utils.category_index import category_index
+from ..utils.profiling import request_profiler
+from ..utils.pool_metrics import pool_metrics
+from ..utils.password_hasher import password_hasher
 from .logs import log_activity
 
 router = APIRouter()
 
-@router.post("/backup")
-async def create_backup(
-    include_tables: Optional[List[str]] = None,
-    description: Optional[str] = None,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
-):
-    """전체 시스템 데이터를 백업합니다. (관리자만)"""
-    
+BACKUP_DIR = os.getenv("BACKUP_DIR") or os.path.join(tempfile.gettempdir(), "ai_mastery_backups")
+BACKUP_BATCH_SIZE = int(os.getenv("BACKUP_BATCH_SIZE", "1000"))
+RESTORE_BATCH_SIZE = int(os.getenv("RESTORE_BATCH_SIZE", "1000"))
+
+DEFAULT_BACKUP_TABLES = ['users', 'ai_info', 'user_progress', 'activity_logs', 'quiz', 'prompt', 'base_content', 'term']
+
+# 테이블 모델 매핑
+BACKUP_TABLE_MODELS = {
+    'users': User,
+    'ai_info': AIInfo,
+    'user_progress': UserProgress,
+    'activity_logs': ActivityLog,
+    'quiz': Quiz,
+    'prompt': Prompt,
+    'base_content': BaseContent,
+    'term': Term,
+    'backup_history': BackupHistory
+}
+
+def _require_admin(current_user: User):
     if current_user.role != 'admin':
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
         )
+
+def _job_accepted(job):
+    """작업 제출 응답 (202)"""
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={
+            "job_id": job.id,
+            "job_type": job.job_type,
+            "status": job.status,
+            "status_url": f"/api/system/jobs/{job.id}"
+        }
+    )
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def run_backup_job(job, include_tables: List[str], description: Optional[str], user_id: int, username: str):
+    """테이블을 배치 단위로 읽어 백업 파일에 바로 기록합니다. (작업 실행기에서 호출)"""
+    os.makedirs(BACKUP_DIR, exist_ok=True)
     
+    # 백업 파일명 생성
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"ai_mastery_backup_{timestamp}.json"
+    path = os.path.join(BACKUP_DIR, f"{job.id}_{filename}")
+    
+    backup_info = {
+        "created_at": datetime.now().isoformat(),
+        "created_by": username,
+        "description": description or "Manual backup",
+        "tables_included": include_tables,
+        "version": "1.0.0"
+    }
+    tables = [t for t in include_tables if t in BACKUP_TABLE_MODELS]
+    
+    db = SessionLocal()
     try:
-        # 기본적으로 모든 테이블 백업
-        if not include_tables:
-            include_tables = ['users', 'ai_info', 'user_progress', 'activity_logs', 'quiz', 'prompt', 'base_content', 'term']
-        
-        backup_data = {
-            "backup_info": {
-                "created_at": datetime.now().isoformat(),
-                "created_by": current_user.username,
-                "description": description or "Manual backup",
-                "tables_included": include_tables,
-                "version": "1.0.0"
-            },
-            "data": {}
-        }
-        
-        # 각 테이블 데이터 수집
-        table_models = {
-            'users': User,
-            'ai_info': AIInfo,
-            'user_progress': UserProgress,
-            'activity_logs': ActivityLog,
-            'quiz': Quiz,
-            'prompt': Prompt,
-            'base_content': BaseContent,
-            'term': Term,
-            'backup_history': BackupHistory
-        }
-        
-        for table_name in include_tables:
-            if table_name in table_models:
-                model = table_models[table_name]
-                records = db.query(model).all()
-                
-                # 모델 데이터를 딕셔너리로 변환
-                table_data = []
-                for record in records:
-                    record_dict = {}
-                    for column in record.__table__.columns:
-                        value = getattr(record, column.name)
-                        if isinstance(value, datetime):
-                            value = value.isoformat()
-                        record_dict[column.name] = value
-                    table_data.append(record_dict)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('{\n  "backup_info": ')
+            f.write(json.dumps(backup_info, ensure_ascii=False))
+            f.write(',\n  "data": {')
+            
+            for table_index, table_name in enumerate(tables):
+                job_runner.report(job, progress=table_index * 95 / len(tables), message=f"{table_name} 테이블 백업 중")
+                table = BACKUP_TABLE_MODELS[table_name].__table__
                 
-                backup_data["data"][table_name] = table_data
-        
-        # 백업 파일명 생성
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"ai_mastery_backup_{timestamp}.json"
+                f.write(("," if table_index else "") + f"\n    {json.dumps(table_name)}: [")
+                rows = db.execute(table.select().execution_options(yield_per=BACKUP_BATCH_SIZE))
+                for row_index, row in enumerate(rows):
+                    if row_index and row_index % BACKUP_BATCH_SIZE == 0:
+                        job.check_cancelled()
+                    f.write(("," if row_index else "") + "\n      ")
+                    f.write(json.dumps(dict(row._mapping), ensure_ascii=False, default=_json_default))
+                f.write("\n    ]")
+            
+            f.write("\n  }\n}\n")
         
-        # JSON 문자열 생성
-        json_str = json.dumps(backup_data, indent=2, ensure_ascii=False)
-        file_size = len(json_str.encode('utf-8'))
+        file_size = os.path.getsize(path)
+        job.artifact_path = path
         
         # 백업 히스토리 저장
         backup_history = BackupHistory(
@@ -91,8 +120,8 @@ async def create_backup(
             backup_type='manual',
             tables_included=json.dumps(include_tables),
             description=description,
-            created_by=current_user.id,
-            created_by_username=current_user.username
+            created_by=user_id,
+            created_by_username=username
         )
         db.add(backup_history)
         db.commit()
@@ -104,150 +133,261 @@ async def create_backup(
             details=f"백업 파일이 생성되었습니다. 파일명: {filename}, 크기: {file_size} bytes",
             log_type="system",
             log_level="success",
-            user_id=current_user.id,
-            username=current_user.username
+            user_id=user_id,
+            username=username
         )
         
-        # 파일 스트림으로 반환
-        def generate():
-            yield json_str
+        return {
+            "filename": filename,
+            "file_size": file_size,
+            "tables_included": tables,
+            "download_url": f"/api/system/jobs/{job.id}/download"
+        }
+    except BaseException:
+        db.rollback()
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+    finally:
+        db.close()
+
+@router.post("/backup")
+async def create_backup(
+    include_tables: Optional[List[str]] = None,
+    description: Optional[str] = None,
+    current_user: User = Depends(get_current_active_user)
+):
+    """전체 시스템 데이터 백업 작업을 제출합니다. (관리자만)
+    
+    진행 상황은 GET /api/system/jobs/{job_id}, 완료 후 파일은
+    GET /api/system/jobs/{job_id}/download 로 받습니다.
+    """
+    _require_admin(current_user)
+    
+    # 기본적으로 모든 테이블 백업
+    if not include_tables:
+        include_tables = DEFAULT_BACKUP_TABLES
+    
+    job = job_runner.submit(
+        "backup", run_backup_job, include_tables, description, current_user.id, current_user.username,
+        created_by=current_user.id, created_by_username=current_user.username
+    )
+    return _job_accepted(job)
+
+def restore_from_stream(db: Session, stream, current_user_data: Dict[str, Any], batch_size: int = RESTORE_BATCH_SIZE, on_progress=None):
+    """
+    백업 스트림을 읽으면서 테이블별로 배치 삽입합니다.
+    커밋은 호출한 쪽에서 처리합니다.
+
+    Args:
+        on_progress: 배치를 넣을 때마다 호출되는 콜백 (table_name, restored_rows)
+
+    Returns:
+        (backup_info, restored_tables)
+    """
+    backup_info = {}
+    restored_tables = []
+    
+    model = None
+    coercers = None
+    table_name = None
+    table_started = False
+    batch = []
+    restored_rows = 0
+    users_in_backup = False
+    backup_usernames = set()
+    
+    def flush():
+        nonlocal restored_rows
+        if batch:
+            db.bulk_insert_mappings(model, batch)
+            restored_rows += len(batch)
+            batch.clear()
+            if on_progress:
+                on_progress(table_name, restored_rows)
+    
+    for event, payload in iter_backup_stream(stream):
+        if event == "backup_info":
+            backup_info = payload
+        elif event == "table":
+            flush()
+            table_name = payload
+            model = BACKUP_TABLE_MODELS.get(table_name)
+            coercers = build_column_coercers(model) if model else None
+            table_started = False
+            
+            # 사용자 테이블은 비어 있어도 기존 데이터를 교체 (현재 관리자는 마지막에 보존)
+            if table_name == 'users':
+                users_in_backup = True
+                db.query(User).delete()
+        elif event == "record":
+            if model is None:
+                continue
+            
+            # 기존 데이터 삭제는 첫 레코드가 나올 때 한 번만
+            if not table_started:
+                if table_name != 'users':
+                    db.query(model).delete()
+                restored_tables.append(table_name)
+                table_started = True
+            
+            row = coerce_record(payload, coercers)
+            if table_name == 'users':
+                backup_usernames.add(row.get('username'))
+            batch.append(row)
+            if len(batch) >= batch_size:
+                flush()
+    
+    flush()
+    
+    # 현재 관리자 사용자가 백업에 없으면 추가
+    if users_in_backup and current_user_data['username'] not in backup_usernames:
+        db.add(User(**current_user_data))
+    
+    return backup_info, restored_tables
+
+def run_restore_job(job, upload_path: str, original_filename: str, current_user_data: Dict[str, Any]):
+    """업로드된 백업 파일로 시스템을 복원합니다. (작업 실행기에서 호출)"""
+    db = SessionLocal()
+    try:
+        total_size = os.path.getsize(upload_path) or 1
+        with open(upload_path, "rb") as raw:
+            stream = io.TextIOWrapper(raw, encoding='utf-8')
+            
+            def on_progress(table_name, restored_rows):
+                job_runner.report(
+                    job,
+                    progress=raw.tell() * 95 / total_size,
+                    message=f"{table_name} 복원 중 (누적 {restored_rows}건)"
+                )
+            
+            try:
+                backup_info, restored_tables = restore_from_stream(db, stream, current_user_data, on_progress=on_progress)
+            except (BackupFormatError, json.JSONDecodeError, UnicodeDecodeError) as e:
+                raise ValueError(f"Invalid backup file: {str(e)}")
+        
+        job.check_cancelled()
+        search_index.rebuild(db)
+        category_index.rebuild(db)
+        bump_all_content_versions(db)
+        db.commit()
+        table_stats_provider.invalidate()
+        invalidate_user_cache()
         
-        return StreamingResponse(
-            io.StringIO(json_str),
-            media_type="application/json",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        # 복원 완료 로그 기록
+        log_activity(
+            db=db,
+            action="시스템 복원 완료",
+            details=f"백업 파일에서 시스템이 복원되었습니다. 파일: {original_filename}, 복원된 테이블: {', '.join(restored_tables)}",
+            log_type="system",
+            log_level="success",
+            user_id=current_user_data['id'],
+            username=current_user_data['username']
         )
         
-    except Exception as e:
+        return {
+            "message": "System restored successfully",
+            "restored_tables": restored_tables,
+            "backup_info": backup_info
+        }
+    except BaseException:
         db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to create backup: {str(e)}")
+        raise
+    finally:
+        db.close()
+
+def _remove_file(path: str) -> None:
+    if os.path.exists(path):
+        os.remove(path)
 
 @router.post("/restore")
 async def restore_backup(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user)
 ):
-    """백업 파일을 업로드하여 시스템을 복원합니다. (관리자만)"""
-    
-    if current_user.role != 'admin':
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
+    """백업 파일을 업로드하여 시스템 복원 작업을 제출합니다. (관리자만)"""
+    _require_admin(current_user)
     
     if not file.filename.endswith('.json'):
         raise HTTPException(status_code=400, detail="Only JSON files are allowed")
     
+    # 현재 사용자 정보 백업 (복원 후 로그인 유지용)
+    current_user_data = {
+        'id': current_user.id,
+        'username': current_user.username,
+        'hashed_password': current_user.hashed_password
+    }
+    
+    # 요청이 끝나면 업로드 파일이 닫히므로 작업용 임시 파일로 옮겨 둠
+    os.makedirs(BACKUP_DIR, exist_ok=True)
+    fd, upload_path = tempfile.mkstemp(prefix="restore_", suffix=".json", dir=BACKUP_DIR)
     try:
-        # 파일 내용 읽기
-        content = await file.read()
-        backup_data = json.loads(content.decode('utf-8'))
-        
-        # 백업 파일 검증
-        if "backup_info" not in backup_data or "data" not in backup_data:
-            raise HTTPException(status_code=400, detail="Invalid backup file format")
-        
-        backup_info = backup_data["backup_info"]
-        data = backup_data["data"]
-        
-        # 트랜잭션 시작
-        try:
-            # 테이블 모델 매핑
-            table_models = {
-                'users': User,
-                'ai_info': AIInfo,
-                'user_progress': UserProgress,
-                'activity_logs': ActivityLog,
-                'quiz': Quiz,
-                'prompt': Prompt,
-                'base_content': BaseContent,
-                'term': Term,
-                'backup_history': BackupHistory
-            }
-            
-            restored_tables = []
-            
-            # 현재 사용자 정보 백업 (복원 후 로그인 유지용)
-            current_user_data = {
-                'id': current_user.id,
-                'username': current_user.username,
-                'hashed_password': current_user.hashed_password
-            }
-            
-            # 각 테이블 데이터 복원
-            for table_name, table_data in data.items():
-                if table_name in table_models and table_data:
-                    model = table_models[table_name]
-                    
-                    # 기존 데이터 삭제 (사용자는 제외하고 나중에 처리)
-                    if table_name != 'users':
-                        db.query(model).delete()
-                    
-                    # 새 데이터 삽입
-                    for record_data in table_data:
-                        # 날짜 필드 변환
-                        for key, value in record_data.items():
-                            if key.endswith('_at') and isinstance(value, str):
-                                try:
-                                    record_data[key] = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                                except:
-                                    pass
-                        
-                        new_record = model(**record_data)
-                        db.add(new_record)
-                    
-                    restored_tables.append(table_name)
-            
-            # 사용자 테이블 특별 처리 (현재 사용자 보존)
-            if 'users' in data:
-                db.query(User).delete()
-                
-                # 백업된 사용자들 복원
-                for user_data in data['users']:
-                    for key, value in user_data.items():
-                        if key.endswith('_at') and isinstance(value, str):
-                            try:
-                                user_data[key] = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                            except:
-                                pass
-                    
-                    new_user = User(**user_data)
-                    db.add(new_user)
-                
-                # 현재 관리자 사용자가 백업에 없으면 추가
-                backup_usernames = [u['username'] for u in data['users']]
-                if current_user.username not in backup_usernames:
-                    admin_user = User(**current_user_data)
-                    db.add(admin_user)
-            
-            db.commit()
-            
-            # 복원 완료 로그 기록
-            log_activity(
-                db=db,
-                action="시스템 복원 완료",
-                details=f"백업 파일에서 시스템이 복원되었습니다. 파일: {file.filename}, 복원된 테이블: {', '.join(restored_tables)}",
-                log_type="system",
-                log_level="success",
-                user_id=current_user.id,
-                username=current_user.username
-            )
-            
-            return {
-                "message": "System restored successfully",
-                "restored_tables": restored_tables,
-                "backup_info": backup_info
-            }
-            
-        except Exception as e:
-            db.rollback()
-            raise HTTPException(status_code=500, detail=f"Failed to restore data: {str(e)}")
-        
-    except json.JSONDecodeError:
-        raise HTTPException(status_code=400, detail="Invalid JSON file")
+        with os.fdopen(fd, "wb") as out:
+            await run_in_threadpool(shutil.copyfileobj, file.file, out)
     except Exception as e:
+        os.remove(upload_path)
         raise HTTPException(status_code=500, detail=f"Failed to process backup file: {str(e)}")
+    
+    job = job_runner.submit(
+        "restore", run_restore_job, upload_path, file.filename, current_user_data,
+        created_by=current_user.id, created_by_username=current_user.username,
+        cleanup=functools.partial(_remove_file, upload_path)
+    )
+    return _job_accepted(job)
+
+@router.get("/jobs")
+def list_jobs(
+    limit: int = 50,
+    current_user: User = Depends(get_current_active_user)
+):
+    """최근 백그라운드 작업 목록을 조회합니다. (관리자만)"""
+    _require_admin(current_user)
+    return {"jobs": job_runner.list(limit)}
+
+@router.get("/jobs/{job_id}")
+def get_job_status(
+    job_id: str,
+    current_user: User = Depends(get_current_active_user)
+):
+    """백그라운드 작업의 상태와 진행률을 조회합니다. (관리자만)"""
+    _require_admin(current_user)
+    
+    job = job_runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@router.post("/jobs/{job_id}/cancel")
+def cancel_job(
+    job_id: str,
+    current_user: User = Depends(get_current_active_user)
+):
+    """대기 중이거나 실행 중인 작업을 취소합니다. (관리자만)"""
+    _require_admin(current_user)
+    
+    if job_runner.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if not job_runner.cancel(job_id):
+        raise HTTPException(status_code=409, detail="Job is not running in this worker or already finished")
+    return job_runner.get(job_id)
+
+@router.get("/jobs/{job_id}/download")
+def download_job_artifact(
+    job_id: str,
+    current_user: User = Depends(get_current_active_user)
+):
+    """완료된 백업 작업의 파일을 내려받습니다. (관리자만)"""
+    _require_admin(current_user)
+    
+    artifact = job_runner.get_artifact(job_id)
+    if artifact is None or not os.path.exists(artifact["path"]):
+        raise HTTPException(status_code=404, detail="Backup file not found")
+    
+    return FileResponse(
+        artifact["path"],
+        media_type="application/json",
+        filename=artifact["result"].get("filename") or os.path.basename(artifact["path"])
+    )
 
 @router.get("/backup-history")
 def get_backup_history(
@@ -302,12 +442,22 @@ def delete_backup_history(
     
     return {"message": "Backup history deleted successfully"}
 
+SYSTEM_INFO_TABLES = [
+    'users', 'ai_info', 'user_progress', 'activity_logs', 'quiz',
+    'prompt', 'base_content', 'term', 'backup_history'
+]
+
 @router.get("/system-info")
 def get_system_info(
+    refresh: bool = False,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """시스템 정보를 조회합니다. (관리자만)"""
+    """시스템 정보를 조회합니다. (관리자만)
+    
+    테이블 통계는 Postgres에서는 추정치이며 SYSTEM_STATS_TTL_SECONDS 동안 캐시됩니다.
+    refresh=true 로 캐시를 무시하고 다시 계산할 수 있습니다.
+    """
     
     if current_user.role != 'admin':
         raise HTTPException(
@@ -315,18 +465,9 @@ def get_system_info(
             detail="Not enough permissions"
         )
     
-    # 테이블별 레코드 수 조회
-    stats = {
-        "users": db.query(User).count(),
-        "ai_info": db.query(AIInfo).count(),
-        "user_progress": db.query(UserProgress).count(),
-        "activity_logs": db.query(ActivityLog).count(),
-        "quiz": db.query(Quiz).count(),
-        "prompt": db.query(Prompt).count(),
-        "base_content": db.query(BaseContent).count(),
-        "term": db.query(Term).count(),
-        "backup_history": db.query(BackupHistory).count()
-    }
+    # 테이블별 레코드 수 및 크기 조회
+    table_info = table_stats_provider.get_stats(db, SYSTEM_INFO_TABLES, refresh=refresh)
+    stats = {table: info["rows"] for table, info in table_info["tables"].items()}
     
     # 최근 백업 정보
     latest_backup = db.query(BackupHistory).order_by(BackupHistory.created_at.desc()).first()
@@ -334,6 +475,9 @@ def get_system_info(
     return {
         "version": "1.0.0",
         "table_stats": stats,
+        "table_details": table_info["tables"],
+        "stats_estimated": any(info["estimated"] for info in table_info["tables"].values()),
+        "stats_generated_at": datetime.fromtimestamp(table_info["generated_at"]).isoformat(),
         "total_records": sum(stats.values()),
         "latest_backup": {
             "filename": latest_backup.filename if latest_backup else None,
@@ -342,50 +486,80 @@ def get_system_info(
         } if latest_backup else None
     }
 
-@router.delete("/clear-all-data")
-def clear_all_data(
-    confirm: bool = False,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+@router.get("/db-pool")
+def get_db_pool_status(
+    current_user: User = Depends(get_current_active_user)
 ):
-    """모든 시스템 데이터를 삭제합니다. (관리자만, 매우 위험)"""
+    """DB 커넥션 풀 설정과 체크아웃/대기 시간 통계를 조회합니다. (관리자만)"""
+    _require_admin(current_user)
     
-    if current_user.role != 'admin':
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
+    from ..database import engine, read_engine, read_pool_metrics, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING
     
-    if not confirm:
-        raise HTTPException(
-            status_code=400,
-            detail="Please set confirm=true to proceed with data deletion"
-        )
+    return {
+        "read_replica": read_pool_metrics.snapshot(read_engine) if read_engine is not engine else None,
+        "config": {
+            "pool_size": DB_POOL_SIZE,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "pool_timeout": DB_POOL_TIMEOUT,
+            "pool_recycle": DB_POOL_RECYCLE,
+            "pool_pre_ping": DB_POOL_PRE_PING
+        },
+        "pool": pool_metrics.snapshot(engine)
+    }
+
+@router.get("/auth-hashing")
+def get_password_hashing_stats(
+    current_user: User = Depends(get_current_active_user)
+):
+    """비밀번호 해싱 실행기의 대기열/처리 시간 통계를 조회합니다. (관리자만)"""
+    _require_admin(current_user)
+    return password_hasher.stats()
+
+@router.get("/profiles")
+def get_request_profiles(
+    limit: int = 0,
+    current_user: User = Depends(get_current_active_user)
+):
+    """느린 요청의 샘플링 프로파일을 최신순으로 조회합니다. (관리자만, PROFILING_ENABLED일 때 수집)"""
+    _require_admin(current_user)
+    
+    from ..utils.profiling import PROFILING_ENABLED, PROFILING_THRESHOLD_MS
     
+    return {
+        "enabled": PROFILING_ENABLED,
+        "threshold_ms": PROFILING_THRESHOLD_MS,
+        "profiles": request_profiler.list_profiles(limit)
+    }
+
+@router.delete("/profiles")
+def clear_request_profiles(
+    current_user: User = Depends(get_current_active_user)
+):
+    """저장된 프로파일을 모두 삭제합니다. (관리자만)"""
+    _require_admin(current_user)
+    request_profiler.clear()
+    return {"message": "Profiles cleared"}
+
+def run_clear_all_data_job(job, admin_data: Dict[str, Any]):
+    """관리자 계정만 남기고 모든 데이터를 삭제합니다. (작업 실행기에서 호출)"""
+    db = SessionLocal()
     try:
-        # 현재 관리자 사용자 정보 백업
-        admin_data = {
-            'username': current_user.username,
-            'hashed_password': current_user.hashed_password,
-            'role': current_user.role
-        }
-        
         # 모든 테이블 데이터 삭제
-        db.query(ActivityLog).delete()
-        db.query(UserProgress).delete()
-        db.query(BackupHistory).delete()
-        db.query(AIInfo).delete()
-        db.query(Quiz).delete()
-        db.query(Prompt).delete()
-        db.query(BaseContent).delete()
-        db.query(Term).delete()
-        db.query(User).delete()
+        models = [ActivityLog, UserProgress, BackupHistory, AIInfo, Quiz, Prompt, BaseContent, Term, User]
+        for index, model in enumerate(models):
+            job_runner.report(job, progress=index * 95 / len(models), message=f"{model.__tablename__} 삭제 중")
+            db.query(model).delete()
         
         # 관리자 계정 복원
         admin_user = User(**admin_data)
         db.add(admin_user)
+        search_index.rebuild(db)
+        category_index.rebuild(db)
+        bump_all_content_versions(db)
         db.commit()
         db.refresh(admin_user)
+        table_stats_provider.invalidate()
+        invalidate_user_cache()
         
         # 데이터 삭제 로그 기록
         log_activity(
@@ -399,10 +573,38 @@ def clear_all_data(
         )
         
         return {"message": "All data cleared successfully. Admin account preserved."}
-        
-    except Exception as e:
+    except BaseException:
         db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to clear data: {str(e)}")
+        raise
+    finally:
+        db.close()
+
+@router.delete("/clear-all-data")
+def clear_all_data(
+    confirm: bool = False,
+    current_user: User = Depends(get_current_active_user)
+):
+    """모든 시스템 데이터 삭제 작업을 제출합니다. (관리자만, 매우 위험)"""
+    _require_admin(current_user)
+    
+    if not confirm:
+        raise HTTPException(
+            status_code=400,
+            detail="Please set confirm=true to proceed with data deletion"
+        )
+    
+    # 현재 관리자 사용자 정보 백업
+    admin_data = {
+        'username': current_user.username,
+        'hashed_password': current_user.hashed_password,
+        'role': current_user.role
+    }
+    
+    job = job_runner.submit(
+        "clear_all_data", run_clear_all_data_job, admin_data,
+        created_by=current_user.id, created_by_username=current_user.username
+    )
+    return _job_accepted(job)
 
 @router.post("/init-database")
 async def init_database_tables(
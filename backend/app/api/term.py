@@ -1,20 +1,85 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
-from ..database import get_db
+from typing import List, Optional, Union
+from ..database import get_read_db
 from ..models import Term
-from ..schemas import TermResponse
-import random
+from ..schemas import TermResponse, TermPage, TermBucket
+from ..utils.etag import conditional_get
+from ..utils.ai_info_items import LANGUAGES
+from ..utils.glossary_index import glossary_index, BUCKET_ORDER
+from ..utils.payload_cache import payload_cache
+from ..utils.random_sampler import RandomIdSampler
+from ..utils.term_suggest import term_suggest_index, SUGGEST_DEFAULT_LIMIT, SUGGEST_MAX_LIMIT
 
 router = APIRouter()
 
-@router.get("/random", response_model=TermResponse)
-def get_random_term(db: Session = Depends(get_db)):
-    terms = db.query(Term).all()
+# 무작위 선택용 id 배열 (term 콘텐츠 버전이 바뀌면 다시 읽음)
+term_sampler = RandomIdSampler("term", lambda db, key: [row[0] for row in db.query(Term.id).all()])
+RANDOM_MAX_COUNT = 50
+TERM_PAGE_DEFAULT_LIMIT = 50
+TERM_PAGE_MAX_LIMIT = 200
+
+def _fetch_terms(db: Session, ids: List[int]) -> List[Term]:
+    """뽑은 순서대로 용어를 반환합니다."""
+    rows = {term.id: term for term in db.query(Term).filter(Term.id.in_(ids)).all()}
+    return [rows[term_id] for term_id in ids if term_id in rows]
+
+@router.get("/random", response_model=Union[TermResponse, List[TermResponse]])
+def get_random_term(n: Optional[int] = None, db: Session = Depends(get_read_db)):
+    """무작위 용어 하나를 반환합니다. n을 주면 중복 없이 최대 n개를 목록으로 반환합니다."""
+    count = 1 if n is None else max(1, min(n, RANDOM_MAX_COUNT))
+    ids = term_sampler.sample(db, count)
+    terms = _fetch_terms(db, ids)
+    if len(terms) < len(ids):
+        # 배열과 테이블이 어긋났으면(버전 없이 삭제된 행) 다시 읽고 한 번 더 시도
+        term_sampler.invalidate()
+        terms = _fetch_terms(db, term_sampler.sample(db, count))
     if not terms:
         raise HTTPException(status_code=404, detail="No terms found")
-    term = random.choice(terms)
-    return term
+    return terms[0] if n is None else terms
+
+@router.get("/all", response_model=Union[List[TermResponse], TermPage])
+def get_all_terms(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+    bucket: Optional[str] = None,
+    db: Session = Depends(get_read_db)
+):
+    """
+    용어 사전 목록 (용어 순 정렬)
+    - 파라미터가 없으면 전체 목록 (term 버전별로 인코딩된 응답을 캐시)
+    - limit을 주면 한 페이지({items, total, has_more, next_after}), 다음 페이지는 after=next_after
+    - bucket(A~Z, ㄱ~ㅎ, 0-9, #)을 주면 해당 첫 글자 버킷 안에서만 페이지를 나눔
+    """
+    if limit is None and after is None and bucket is None:
+        return payload_cache.response(request, db, "term", ("all",), lambda: glossary_index.all_terms(db))
+    
+    if bucket is not None and bucket not in BUCKET_ORDER:
+        raise HTTPException(status_code=400, detail=f"Unknown bucket: {bucket}")
+    not_modified = conditional_get(request, response, db, "term")
+    if not_modified:
+        return not_modified
+    limit = max(1, min(limit or TERM_PAGE_DEFAULT_LIMIT, TERM_PAGE_MAX_LIMIT))
+    return glossary_index.page(db, limit, after, bucket)
+
+@router.get("/buckets", response_model=List[TermBucket])
+def get_term_buckets(request: Request, response: Response, db: Session = Depends(get_read_db)):
+    """점프 바용 첫 글자 버킷별 용어 수와 첫 용어"""
+    not_modified = conditional_get(request, response, db, "term")
+    if not_modified:
+        return not_modified
+    return glossary_index.buckets(db)
 
-@router.get("/all", response_model=list[TermResponse])
-def get_all_terms(db: Session = Depends(get_db)):
-    return db.query(Term).all() 
\ No newline at end of file
+@router.get("/suggest")
+def suggest_terms(prefix: str, language: str = "ko", limit: int = SUGGEST_DEFAULT_LIMIT, db: Session = Depends(get_read_db)):
+    """입력 중인 접두사로 시작하는 용어를 순위가 높은 순으로 반환합니다. (용어 사전 우선, 그다음 AI 정보에 많이 나온 순)"""
+    if language not in LANGUAGES:
+        raise HTTPException(status_code=400, detail=f"language must be one of {', '.join(LANGUAGES)}")
+    limit = max(1, min(limit, SUGGEST_MAX_LIMIT))
+    return {
+        "prefix": prefix,
+        "language": language,
+        "suggestions": term_suggest_index.suggest(db, prefix, language, limit)
+    }
@@ -1,31 +1,37 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any
 import json
+import logging
 from datetime import datetime
 
-from ..database import get_db
+from ..database import get_db, get_async_db
 from ..models import UserProgress
 from ..schemas import UserProgressCreate, UserProgressResponse
 from .logs import log_activity
+from ..utils.rate_limit import client_ip
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 @router.get("/{session_id}", response_model=Dict[str, Any])
-def get_user_progress(session_id: str, db: Session = Depends(get_db)):
-    progress = db.query(UserProgress).filter(UserProgress.session_id == session_id).all()
+async def get_user_progress(session_id: str, db: AsyncSession = Depends(get_async_db)):
+    progress = (await db.execute(
+        select(UserProgress).where(UserProgress.session_id == session_id)
+    )).scalars().all()
     result = {}
     
     # AI 정보 학습 기록
+    stats_progress = None
     for p in progress:
         if p.learned_info and not p.date.startswith('__'):
             result[p.date] = json.loads(p.learned_info)
-    
-    # 통계 정보 추가
-    stats_progress = db.query(UserProgress).filter(
-        UserProgress.session_id == session_id,
-        UserProgress.date == '__stats__'
-    ).first()
+        elif p.date == '__stats__' and stats_progress is None:
+            # 통계 정보는 같은 결과에서 찾음 (추가 쿼리 없음)
+            stats_progress = p
     
     if stats_progress and stats_progress.stats:
         try:
@@ -74,7 +80,7 @@ def update_user_progress(session_id: str, date: str, info_index: int, request: R
         log_level="info",
         username=session_id,
         session_id=session_id,
-        ip_address=request.client.host if request.client else None
+        ip_address=client_ip(request)
     )
     
     return {"message": "Progress updated successfully", "achievement_gained": True}
@@ -120,7 +126,7 @@ def update_term_progress(session_id: str, term_data: dict, request: Request, db:
         log_level="info",
         username=session_id,
         session_id=session_id,
-        ip_address=request.client.host if request.client else None
+        ip_address=client_ip(request)
     )
     
     return {"message": "Term progress updated successfully", "achievement_gained": True}
@@ -232,11 +238,11 @@ def update_user_statistics(session_id: str, db: Session):
     db.commit()
 
 @router.get("/stats/{session_id}")
-def get_user_stats(session_id: str, db: Session = Depends(get_db)):
-    progress = db.query(UserProgress).filter(
+async def get_user_stats(session_id: str, db: AsyncSession = Depends(get_async_db)):
+    progress = (await db.execute(select(UserProgress).where(
         UserProgress.session_id == session_id, 
         UserProgress.date == '__stats__'
-    ).first()
+    ))).scalars().first()
     
     # 오늘 날짜
     from datetime import datetime
@@ -250,10 +256,10 @@ def get_user_stats(session_id: str, db: Session = Depends(get_db)):
     today_quiz_total = 0
     
     # 오늘 AI 정보 학습 수
-    today_progress = db.query(UserProgress).filter(
+    today_progress = (await db.execute(select(UserProgress).where(
         UserProgress.session_id == session_id,
         UserProgress.date == today
-    ).first()
+    ))).scalars().first()
     
     if today_progress and today_progress.learned_info:
         try:
@@ -262,10 +268,10 @@ def get_user_stats(session_id: str, db: Session = Depends(get_db)):
             today_ai_info = 0
     
     # 오늘 용어 학습 수
-    today_terms_progress = db.query(UserProgress).filter(
+    today_terms_progress = (await db.execute(select(UserProgress).where(
         UserProgress.session_id == session_id,
         UserProgress.date.like(f'__terms__{today}%')
-    ).all()
+    ))).scalars().all()
     
     for term_progress in today_terms_progress:
         if term_progress.learned_info:
@@ -280,10 +286,10 @@ def get_user_stats(session_id: str, db: Session = Depends(get_db)):
     today_quiz_score = 0
     
     # 오늘 날짜의 모든 퀴즈 기록 가져오기
-    today_quiz_progress_list = db.query(UserProgress).filter(
+    today_quiz_progress_list = (await db.execute(select(UserProgress).where(
         UserProgress.session_id == session_id,
         UserProgress.date.like(f'__quiz__{today}%')
-    ).all()
+    ))).scalars().all()
     
     for quiz_progress in today_quiz_progress_list:
         if quiz_progress.stats:
@@ -302,10 +308,10 @@ def get_user_stats(session_id: str, db: Session = Depends(get_db)):
     total_quiz_questions = 0
     
     # 모든 퀴즈 기록 가져오기
-    all_quiz_progress = db.query(UserProgress).filter(
+    all_quiz_progress = (await db.execute(select(UserProgress).where(
         UserProgress.session_id == session_id,
         UserProgress.date.like('__quiz__%')
-    ).all()
+    ))).scalars().all()
     
     for quiz_progress in all_quiz_progress:
         if quiz_progress.stats:
@@ -321,10 +327,10 @@ def get_user_stats(session_id: str, db: Session = Depends(get_db)):
     
     # 총 AI 정보 수 계산 (모든 날짜의 AI 정보 수)
     total_ai_info_available = 0
-    all_ai_progress = db.query(UserProgress).filter(
+    all_ai_progress = (await db.execute(select(UserProgress).where(
         UserProgress.session_id == session_id,
         ~UserProgress.date.like('__%')
-    ).all()
+    ))).scalars().all()
     
     for p in all_ai_progress:
         if p.learned_info:
@@ -336,10 +342,10 @@ def get_user_stats(session_id: str, db: Session = Depends(get_db)):
     
     # 총 용어 수 계산 (모든 날짜의 용어 수)
     total_terms_available = 0
-    all_terms_progress = db.query(UserProgress).filter(
+    all_terms_progress = (await db.execute(select(UserProgress).where(
         UserProgress.session_id == session_id,
         UserProgress.date.like('__terms__%')
-    ).all()
+    ))).scalars().all()
     
     for p in all_terms_progress:
         if p.learned_info:
@@ -497,7 +503,7 @@ def update_quiz_score(session_id: str, score_data: dict, request: Request, db: S
         log_level="success" if quiz_score >= 80 else "info",
         username=session_id,
         session_id=session_id,
-        ip_address=request.client.host if request.client else None
+        ip_address=client_ip(request)
     )
     
     return {"message": "Quiz score updated successfully", "quiz_score": quiz_score}
@@ -560,16 +566,17 @@ def check_achievements(session_id: str, db: Session = Depends(get_db)):
         new_achievements.append('two_week_streak')
         achievements.append('two_week_streak')
     
-    # 퀴즈 성취
-    if stats['quiz_score'] >= 60 and 'quiz_beginner' not in achievements:
+    # 퀴즈 성취 (대시보드용 get_user_stats에는 quiz_score 대신 today_quiz_score가 있음)
+    quiz_score = stats.get('quiz_score', stats.get('today_quiz_score', 0))
+    if quiz_score >= 60 and 'quiz_beginner' not in achievements:
         new_achievements.append('quiz_beginner')
         achievements.append('quiz_beginner')
     
-    if stats['quiz_score'] >= 80 and 'quiz_master' not in achievements:
+    if quiz_score >= 80 and 'quiz_master' not in achievements:
         new_achievements.append('quiz_master')
         achievements.append('quiz_master')
     
-    if stats['quiz_score'] >= 100 and 'perfect_quiz' not in achievements:
+    if quiz_score >= 100 and 'perfect_quiz' not in achievements:
         new_achievements.append('perfect_quiz')
         achievements.append('perfect_quiz')
     
@@ -725,7 +732,7 @@ def get_period_stats(session_id: str, start_date: str, end_date: str, db: Sessio
                 terms_count = learned_terms_count
             
         except Exception as e:
-            print(f"Error calculating terms count for date {date}: {e}")
+            logger.error("Error calculating terms count for date %s: %s", date, e)
             terms_count = 0
         
         # 퀴즈 점수
@@ -1002,7 +1009,7 @@ def get_total_terms_stats(session_id: str, db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        print(f"Error calculating total terms stats: {e}")
+        logger.error("Error calculating total terms stats: %s", e)
         return {
             "total_available_terms": 0,
             "total_learned_terms": 0,
@@ -1061,7 +1068,7 @@ def reset_all_user_progress(session_id: str, db: Session = Depends(get_db)):
         # 변경사항 커밋
         db.commit()
         
-        print(f"Successfully reset all progress for session: {session_id}")
+        logger.info("Successfully reset all progress for session: %s", session_id)
         
         return {
             "message": "All user progress has been reset successfully",
@@ -1071,7 +1078,7 @@ def reset_all_user_progress(session_id: str, db: Session = Depends(get_db)):
         
     except Exception as e:
         db.rollback()
-        print(f"Error resetting user progress: {e}")
+        logger.exception("Error resetting user progress: %s", e)
         raise HTTPException(
             status_code=500, 
             detail=f"Failed to reset user progress: {str(e)}"
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
+import time
 from typing import Optional
 from jose import JWTError, jwt
-import bcrypt
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
@@ -10,6 +10,8 @@ from dotenv import load_dotenv
 
 from .database import get_db
 from .models import User
+from .utils.password_hasher import password_hasher, PasswordHasherBusy
+from .utils.cache import TTLCache
 
 load_dotenv()
 
@@ -20,15 +22,47 @@ if not SECRET_KEY:
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30 * 24 * 60  # 30일
 
+# 인증 캐시 설정 (토큰 디코딩 결과와 사용자 정보를 짧게 재사용)
+AUTH_CACHE_TTL = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "30"))
+_token_cache = TTLCache(ttl=AUTH_CACHE_TTL, maxsize=4096)
+_user_cache = TTLCache(ttl=AUTH_CACHE_TTL, maxsize=1024)
+
 security = HTTPBearer()
 
+def _hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many authentication requests in progress. Please retry shortly.",
+        headers={"Retry-After": "1"},
+    )
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """비밀번호 검증"""
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+    """비밀번호 검증 (전용 bcrypt 실행기에서 실행)"""
+    try:
+        return password_hasher.verify(plain_password, hashed_password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
 
 def get_password_hash(password: str) -> str:
-    """비밀번호 해싱"""
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    """비밀번호 해싱 (전용 bcrypt 실행기에서 실행, 비용은 BCRYPT_ROUNDS)"""
+    try:
+        return password_hasher.hash(password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (async 핸들러용, 결과를 기다리는 동안 스레드를 잡지 않음)"""
+    try:
+        return await password_hasher.verify_async(plain_password, hashed_password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+
+async def get_password_hash_async(password: str) -> str:
+    """비밀번호 해싱 (async 핸들러용)"""
+    try:
+        return await password_hasher.hash_async(password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """JWT 액세스 토큰 생성"""
@@ -41,33 +75,64 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def _invalid_credentials() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid authentication credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    """JWT 토큰 검증"""
-    try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    """JWT 토큰 검증 (디코딩 결과는 짧게 캐시)"""
+    token = credentials.credentials
+    username = _token_cache.get(token)
+    if username is not None:
         return username
+    
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _invalid_credentials()
+    
+    username: str = payload.get("sub")
+    if username is None:
+        raise _invalid_credentials()
+    
+    # 만료 시각을 넘겨서 캐시하지 않도록 TTL을 줄임
+    ttl = AUTH_CACHE_TTL
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+    if ttl > 0:
+        _token_cache.set(token, username, ttl=ttl)
+    return username
+
+def _snapshot_user(user: User) -> User:
+    """세션과 분리된 사용자 사본을 만듭니다. (캐시에 ORM 인스턴스를 직접 보관하지 않음)"""
+    return User(**{column.name: getattr(user, column.name) for column in User.__table__.columns})
+
+def invalidate_user_cache(username: Optional[str] = None):
+    """사용자 정보가 바뀌면 캐시를 비웁니다. username이 없으면 전체를 비웁니다."""
+    if username is None:
+        _user_cache.clear()
+    else:
+        _user_cache.delete(username)
 
 def get_current_user(username: str = Depends(verify_token), db: Session = Depends(get_db)) -> User:
-    """현재 로그인한 사용자 정보 조회"""
+    """현재 로그인한 사용자 정보 조회 (AUTH_CACHE_TTL_SECONDS 동안 캐시)"""
+    user = _user_cache.get(username)
+    if user is not None:
+        return user
+    
     user = db.query(User).filter(User.username == username).first()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
+    
+    user = _snapshot_user(user)
+    _user_cache.set(username, user)
     return user
 
 def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
@@ -1,19 +1,68 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, Select
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, Session
 import os
 from dotenv import load_dotenv
 
+from .utils.pool_metrics import InstrumentedQueuePool, PoolMetrics, pool_metrics
+
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# 읽기 전용 복제본 (선택). 설정하지 않으면 모든 쿼리가 primary로 감
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
 
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL 환경변수가 설정되지 않았습니다. Railway 대시보드에서 환경변수를 설정해주세요.")
 
-engine = create_engine(DATABASE_URL)
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+# 커넥션 풀 설정 (환경변수로 조정)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = _env_bool("DB_POOL_PRE_PING", True)
+
+def engine_options(url: str) -> dict:
+    """URL에 맞는 create_engine 옵션을 반환합니다. (SQLite는 기본 풀 사용)"""
+    if url.startswith("sqlite"):
+        return {"pool_pre_ping": DB_POOL_PRE_PING}
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+pool_metrics.attach(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+if DATABASE_READ_URL:
+    read_engine = create_engine(DATABASE_READ_URL, **engine_options(DATABASE_READ_URL))
+    read_pool_metrics = PoolMetrics()
+    read_pool_metrics.attach(read_engine)
+else:
+    read_engine = engine
+    read_pool_metrics = pool_metrics
+
+class RoutingSession(Session):
+    """SELECT는 읽기 복제본으로, flush 및 그 외 문장(INSERT/UPDATE/DELETE/text)은 primary로 보냅니다."""
+    
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or not isinstance(clause, Select):
+            return engine
+        return read_engine
+
+ReadSessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -21,4 +70,61 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
+        db.close()
+
+# 비동기 엔진 (asyncpg / aiosqlite) - 처음 사용할 때 생성
+DB_ASYNC_DISABLE_PREPARED_STATEMENTS = _env_bool("DB_ASYNC_DISABLE_PREPARED_STATEMENTS", False)
+
+_async_engine = None
+_AsyncSessionLocal = None
+
+def async_database_url(url: str) -> str:
+    """동기 DB URL을 비동기 드라이버 URL로 변환합니다."""
+    scheme, sep, rest = url.partition("://")
+    if scheme in ("postgres", "postgresql", "postgresql+psycopg2"):
+        # asyncpg는 sslmode 파라미터를 받지 않으므로 제거 (ssl은 connect_args로 전달)
+        base, _, query = rest.partition("?")
+        params = [p for p in query.split("&") if p and not p.startswith("sslmode=")]
+        return "postgresql+asyncpg://" + base + ("?" + "&".join(params) if params else "")
+    if scheme == "sqlite":
+        return "sqlite+aiosqlite://" + rest
+    return url
+
+def async_engine_options(url: str) -> dict:
+    options = engine_options(url)
+    options.pop("poolclass", None)
+    
+    if url.startswith(("postgres://", "postgresql")):
+        connect_args = {}
+        if "sslmode=require" in url or "sslmode=verify" in url:
+            connect_args["ssl"] = "require"
+        # PgBouncer 트랜잭션 모드(Supabase pooler 6543 포트)에서는 prepared statement 캐시를 꺼야 함
+        if DB_ASYNC_DISABLE_PREPARED_STATEMENTS:
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+        if connect_args:
+            options["connect_args"] = connect_args
+    return options
+
+def get_async_engine():
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+        
+        _async_engine = create_async_engine(async_database_url(DATABASE_URL), **async_engine_options(DATABASE_URL))
+        _AsyncSessionLocal = async_sessionmaker(_async_engine, autoflush=False, expire_on_commit=False)
+    return _async_engine
+
+async def get_async_db():
+    """비동기 핸들러용 세션 (스레드 풀을 거치지 않음)"""
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
+
+def get_read_db():
+    """읽기 전용 핸들러용 세션 (DATABASE_READ_URL이 있으면 SELECT를 복제본에서 실행)"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
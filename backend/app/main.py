@@ -1,11 +1,23 @@
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 import os
 
-from .api import ai_info, quiz, prompt, base_content, term, auth, logs, system
+from .api import ai_info, quiz, prompt, base_content, term, auth, logs, system, feeds
+from .utils.metrics import metrics_middleware, metrics_endpoint
+from .utils.json_response import FastJSONResponse
+from .utils.query_diagnostics import query_diagnostics_middleware
+from .utils.profiling import install_profiling
+from .utils.category_index import category_index
+from .utils.jobs import job_runner
+from .utils.logging_config import configure_logging
 
-app = FastAPI()
+# 로깅 설정 (LOG_LEVEL, LOG_LEVELS, LOG_FORMAT, LOG_ASYNC)
+configure_logging()
+
+# 응답 직렬화는 orjson 사용
+app = FastAPI(default_response_class=FastJSONResponse)
 
 # Railway 배포 환경을 위한 CORS 설정
 origins = [
@@ -24,6 +36,25 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# 응답 압축 (GZIP_MINIMUM_SIZE 바이트 이상일 때만)
+app.add_middleware(GZipMiddleware, minimum_size=int(os.getenv("GZIP_MINIMUM_SIZE", "1024")))
+
+# 요청 계측 (라우트별 처리 시간, 상태 코드, DB 쿼리 수)
+app.middleware("http")(metrics_middleware)
+# 요청별 쿼리 진단 (QUERY_DIAGNOSTICS=true일 때만 동작)
+app.middleware("http")(query_diagnostics_middleware)
+app.add_route("/metrics", metrics_endpoint, methods=["GET"], include_in_schema=False)
+
+# 서버 시작 시 카테고리 색인을 미리 로드 (테이블이 비어 있으면 전체 색인)
+@app.on_event("startup")
+def warm_up_category_index():
+    category_index.warm_up()
+
+# 백그라운드 작업 heartbeat 갱신 시작 (heartbeat가 끊긴 다른 프로세스의 작업은 실패로 표시)
+@app.on_event("startup")
+def start_job_monitor():
+    job_runner.start()
+
 # 헬스체크 엔드포인트
 @app.get("/")
 async def root():
@@ -87,8 +118,12 @@ async def not_found_handler(request: Request, exc: HTTPException):
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(logs.router, prefix="/api/logs", tags=["Activity Logs"])
 app.include_router(system.router, prefix="/api/system", tags=["System Management"])
+app.include_router(feeds.router, prefix="/api/feeds", tags=["Feed Ingestion"])
 app.include_router(ai_info.router, prefix="/api/ai-info")
 app.include_router(quiz.router, prefix="/api/quiz")
 app.include_router(prompt.router, prefix="/api/prompt")
 app.include_router(base_content.router, prefix="/api/base-content")
-app.include_router(term.router, prefix="/api/term") 
\ No newline at end of file
+app.include_router(term.router, prefix="/api/term")
+
+# 느린 요청 프로파일링 (PROFILING_ENABLED=true일 때만, 라우터 등록 후 호출)
+install_profiling(app)
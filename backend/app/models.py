@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, BigInteger, Float, String, Text, DateTime, Boolean, DDL, event
 from sqlalchemy.sql import func
 from .database import Base
 
@@ -43,6 +43,26 @@ class BackupHistory(Base):
     created_by_username = Column(String, nullable=True)  # 사용자명 (빠른 조회용)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+# 백그라운드 작업 모델 추가 (백업/복원/데이터 정리 등)
+class BackgroundJob(Base):
+    __tablename__ = "background_jobs"
+    
+    id = Column(String, primary_key=True, index=True)  # UUID hex
+    job_type = Column(String, nullable=False)  # 'backup', 'restore', 'clear_all_data'
+    status = Column(String, default='queued')  # 'queued', 'running', 'succeeded', 'failed', 'cancelled'
+    progress = Column(Integer, default=0)  # 0 ~ 100
+    message = Column(Text, nullable=True)  # 현재 진행 단계 설명
+    result = Column(Text, nullable=True)  # JSON 직렬화된 결과
+    error = Column(Text, nullable=True)
+    artifact_path = Column(String, nullable=True)  # 백업 파일 등 산출물 경로 (API로 노출하지 않음)
+    owner = Column(String, nullable=True)  # 작업을 실행하는 프로세스 (호스트:pid:부팅 id)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)  # 실행 중인 프로세스가 주기적으로 갱신
+    created_by = Column(Integer, nullable=True)
+    created_by_username = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
 class AIInfo(Base):
     __tablename__ = "ai_info"
     
@@ -182,4 +202,105 @@ class Term(Base):
     id = Column(Integer, primary_key=True, index=True)
     term = Column(String, unique=True, index=True)
     description = Column(Text)
-    created_at = Column(DateTime(timezone=True), server_default=func.now()) 
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now()) 
+
+# 콘텐츠 버전 모델 (응답 캐시/ETag 무효화용 쓰기 카운터)
+class ContentVersion(Base):
+    __tablename__ = "content_versions"
+    
+    name = Column(String, primary_key=True)  # 'ai_info', 'term', 'prompt', 'base_content', 'quiz'
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+# AI 정보 검색 문서 (항목 x 언어별 한 행, 토큰은 search_index.tokenize 결과를 공백으로 연결)
+class AIInfoSearchDocument(Base):
+    __tablename__ = "ai_info_search"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    date = Column(String, index=True, nullable=False)
+    info_index = Column(Integer, nullable=False)
+    language = Column(String, nullable=False)
+    title = Column(Text)
+    category = Column(String)
+    title_tokens = Column(Text)
+    term_tokens = Column(Text)
+    content_tokens = Column(Text)
+
+# 검색 문서 테이블이 만들어질 때 DB별 전문 검색 인덱스도 함께 생성 (Postgres: GIN 식 인덱스, SQLite: FTS5)
+SEARCH_FTS_TABLE = "ai_info_search_fts"
+SEARCH_PG_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(title_tokens, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(term_tokens, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(content_tokens, '')), 'C')"
+)
+event.listen(
+    AIInfoSearchDocument.__table__, "after_create",
+    DDL(f"CREATE INDEX IF NOT EXISTS ix_ai_info_search_tsv ON ai_info_search USING GIN (({SEARCH_PG_VECTOR}))").execute_if(dialect="postgresql")
+)
+event.listen(
+    AIInfoSearchDocument.__table__, "after_create",
+    DDL(f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_FTS_TABLE} USING fts5(title_tokens, term_tokens, content_tokens, tokenize = 'unicode61')").execute_if(dialect="sqlite")
+)
+
+# AI 정보 카테고리 색인 (유효한 항목마다 한 행, category_index가 메모리 색인을 이 테이블에서 만듦)
+class AIInfoCategoryPosting(Base):
+    __tablename__ = "ai_info_category_index"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    category = Column(String, index=True, nullable=False)
+    date = Column(String, index=True, nullable=False)
+    info_index = Column(Integer, nullable=False)
+    ai_info_id = Column(Integer, index=True, nullable=False)  # date가 유일하지 않으므로 행 id도 저장
+    subcategory = Column(String)
+    confidence = Column(Float, default=1.0)
+
+# 퀴즈 세션 (서버에서 뽑은 문제 목록과 채점 결과, 정답은 채점 전까지 클라이언트에 보내지 않음)
+class QuizSession(Base):
+    __tablename__ = "quiz_sessions"
+    
+    id = Column(String, primary_key=True)  # 추측할 수 없는 토큰
+    session_id = Column(String, index=True, nullable=True)  # 사용자 진행 상황 세션 (user_progress.session_id)
+    topic = Column(String, nullable=False)
+    language = Column(String, nullable=False, default="ko")
+    question_ids = Column(Text, nullable=False)  # JSON 배열 (출제 순서)
+    answers = Column(Text)  # JSON {quiz_id: 선택한 보기 인덱스}
+    score = Column(Integer)
+    total = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    completed_at = Column(DateTime(timezone=True))
+
+# RSS/Atom 피드 소스 (관리자가 등록, 조건부 GET을 위해 마지막 ETag/Last-Modified 저장)
+class FeedSource(Base):
+    __tablename__ = "feed_sources"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    url = Column(String, unique=True, nullable=False)  # http(s):// 또는 file:// (로컬 픽스처)
+    language = Column(String, nullable=False, default="en")  # 피드 본문 언어 (ko, en, ja, zh)
+    enabled = Column(Boolean, nullable=False, default=True)
+    etag = Column(String)
+    last_modified = Column(String)
+    last_status = Column(Integer)  # 마지막 HTTP 상태 (304 = 변경 없음)
+    last_error = Column(Text)
+    last_fetched_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+# 피드에서 가져온 기사 후보 (내용 해시로 중복 제거, 날짜별로 모아서 관리자가 검토)
+class FeedEntry(Base):
+    __tablename__ = "feed_entries"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    source_id = Column(Integer, index=True, nullable=False)  # feed_sources.id
+    content_hash = Column(String(64), unique=True, index=True, nullable=False)  # 정규화한 제목+요약의 sha256
+    guid = Column(String)
+    link = Column(String)
+    title = Column(Text, nullable=False)
+    summary = Column(Text)
+    language = Column(String, nullable=False, default="en")
+    published_at = Column(DateTime(timezone=True))
+    target_date = Column(String, index=True, nullable=False)  # 후보로 올릴 AI 정보 날짜 (YYYY-MM-DD)
+    category = Column(String, index=True)
+    subcategory = Column(String)
+    confidence = Column(Float)
+    status = Column(String, index=True, nullable=False, default="candidate")  # candidate, published, rejected
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 from datetime import datetime
 
 # User Schemas (실제 Supabase 스키마에 맞춤)
@@ -149,6 +149,24 @@ class QuizCreate(BaseModel):
     option4: Optional[str] = None
     explanation: Optional[str] = None
 
+class QuizLocalizedResponse(BaseModel):
+    """요청한 언어로 채운 퀴즈 (해당 언어 값이 없으면 한국어 → 기존 단일 언어 필드 순으로 대체)"""
+    id: int
+    topic: str
+    language: str
+    question: str
+    option1: Optional[str] = None
+    option2: Optional[str] = None
+    option3: Optional[str] = None
+    option4: Optional[str] = None
+    explanation: Optional[str] = None
+    correct: int
+    created_at: Optional[datetime] = None
+
+class QuizTopicCount(BaseModel):
+    topic: str
+    count: int
+
 class QuizResponse(BaseModel):
     id: int
     topic: str
@@ -261,4 +279,95 @@ class TermResponse(BaseModel):
     created_at: datetime
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+class TermPage(BaseModel):
+    """용어 목록 한 페이지 (다음 페이지는 after=next_after 로 요청)"""
+    items: List[TermResponse]
+    total: int
+    has_more: bool
+    next_after: Optional[str] = None
+
+class TermBucket(BaseModel):
+    bucket: str  # A~Z, ㄱ~ㅎ, 0-9, #
+    count: int
+    first: str
+
+# 퀴즈 세션
+class QuizSessionCreate(BaseModel):
+    topic: str
+    count: int = 10
+    language: str = "ko"
+    session_id: Optional[str] = None  # 점수를 기록할 사용자 진행 상황 세션
+
+class QuizSessionQuestion(BaseModel):
+    id: int
+    question: str
+    options: List[Optional[str]]
+
+class QuizSessionResponse(BaseModel):
+    id: str
+    topic: str
+    language: str
+    total: int
+    questions: List[QuizSessionQuestion]
+
+class QuizSessionAnswer(BaseModel):
+    answers: Dict[int, int]  # {quiz_id: 선택한 보기 인덱스(0~3)}
+
+class QuizAnswerResult(BaseModel):
+    quiz_id: int
+    selected: Optional[int] = None
+    correct: int
+    is_correct: bool
+    explanation: Optional[str] = None
+
+class QuizSessionResult(BaseModel):
+    id: str
+    score: int
+    total: int
+    quiz_score: int  # 백분율
+    results: List[QuizAnswerResult]
+
+
+# 피드 수집
+class FeedSourceCreate(BaseModel):
+    name: str
+    url: str
+    language: str = "en"
+    enabled: bool = True
+
+class FeedSourceResponse(BaseModel):
+    id: int
+    name: str
+    url: str
+    language: str
+    enabled: bool
+    last_status: Optional[int] = None
+    last_error: Optional[str] = None
+    last_fetched_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class FeedEntryResponse(BaseModel):
+    id: int
+    source_id: int
+    link: Optional[str] = None
+    title: str
+    summary: Optional[str] = None
+    language: str
+    published_at: Optional[datetime] = None
+    target_date: str
+    category: Optional[str] = None
+    subcategory: Optional[str] = None
+    confidence: Optional[float] = None
+    status: str
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class FeedEntryStatusUpdate(BaseModel):
+    status: str  # candidate, published, rejected
@@ -0,0 +1,155 @@
+"""
+AI 정보 대량 가져오기 (여러 날짜를 한 트랜잭션으로)
+
+날짜 레코드({"date": ..., "infos": [...]}) 를 batch_size개씩 모아서
+- 배치에 든 날짜들의 기존 행을 SELECT 한 번으로 찾고
+- 새 날짜는 INSERT 한 번(executemany), 기존 날짜는 기본 키 기준 UPDATE 한 번(executemany)으로 쓰고
+- 검색/카테고리 색인도 배치 단위로 한 번에 다시 만듭니다. (항목마다 용어 직렬화와 분류는 한 번씩)
+커밋은 마지막에 한 번만 하며 ai_info 콘텐츠 버전도 그때 한 번 올립니다.
+
+ai_info.date 에는 유니크 제약이 없어 INSERT ... ON CONFLICT 를 쓸 수 없으므로, 같은 날짜의 행이
+여러 개 있으면 add_ai_info와 같이 가장 먼저 만든 행을 대상으로 합니다.
+
+mode
+- replace (기본): 레코드의 항목으로 해당 날짜의 info1~3을 덮어씀 (남는 칸은 비움)
+- append: add_ai_info와 같이 기존 행의 빈 칸에만 앞에서부터 채움
+"""
+
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from ..models import AIInfo
+from ..schemas import AIInfoCreate, AIInfoItem
+from .ai_info_items import ITEMS_PER_DAY, fill_empty_items, new_row_columns
+from .category_index import category_index
+from .content_version import bump_content_version
+from .search_index import search_index
+
+AI_INFO_IMPORT_MODES = ("replace", "append")
+AI_INFO_IMPORT_BATCH_SIZE = 200
+
+# append 모드에서 빈 칸을 판단하는 데 필요한 컬럼만 조회
+_SLOT_COLUMNS = [
+    f"info{info_index + 1}_{field}_ko"
+    for info_index in range(ITEMS_PER_DAY)
+    for field in ("title", "content")
+]
+
+
+def parse_record(data: Dict[str, Any]) -> AIInfoCreate:
+    """레코드를 검증합니다. 잘못된 레코드는 ValueError(pydantic ValidationError 포함)"""
+    record = AIInfoCreate.model_validate(data)
+    if not record.date.strip():
+        raise ValueError("date: must not be empty")
+    if len(record.infos) > ITEMS_PER_DAY:
+        raise ValueError(f"infos: at most {ITEMS_PER_DAY} items per date")
+    return record
+
+
+class AIInfoImporter:
+    """날짜 레코드를 모아서 배치 단위로 쓰는 가져오기 작업 하나 (세션과 트랜잭션은 호출하는 쪽 것을 사용)"""
+
+    def __init__(self, db: Session, mode: str = "replace", batch_size: int = AI_INFO_IMPORT_BATCH_SIZE, dry_run: bool = False):
+        if mode not in AI_INFO_IMPORT_MODES:
+            raise ValueError(f"mode must be one of {', '.join(AI_INFO_IMPORT_MODES)}")
+        self.db = db
+        self.mode = mode
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.inserted = 0
+        self.updated = 0
+        self.items = 0
+        self.started = time.perf_counter()
+        # 날짜 -> 들어온 순서대로의 항목 목록들 (같은 배치에 같은 날짜가 여러 번 올 수 있음)
+        self._pending: Dict[str, List[List[AIInfoItem]]] = {}
+        self._pending_records = 0
+
+    @property
+    def batch_full(self) -> bool:
+        return self._pending_records >= self.batch_size
+
+    def add(self, record: AIInfoCreate) -> None:
+        self._pending.setdefault(record.date, []).append(record.infos)
+        self._pending_records += 1
+
+    def flush(self) -> None:
+        """모아 둔 레코드를 씁니다. (커밋하지 않음)"""
+        pending, self._pending, self._pending_records = self._pending, {}, 0
+        if not pending or self.dry_run:
+            return
+
+        db = self.db
+        existing: Dict[str, Any] = {}
+        rows = (
+            db.query(AIInfo.id, AIInfo.date, *[getattr(AIInfo, column) for column in _SLOT_COLUMNS])
+            .filter(AIInfo.date.in_(list(pending)))
+            .order_by(AIInfo.id)
+        )
+        for row in rows:
+            existing.setdefault(row.date, row)
+
+        inserts: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
+        changed: List[str] = []
+        for date, infos_list in pending.items():
+            row = existing.get(date)
+            columns = self._merge(row, infos_list)
+            self.items += sum(len(infos) for infos in infos_list)
+            if row is None:
+                inserts.append({"date": date, **columns})
+            elif columns:
+                updates.append({"id": row.id, **columns})
+            else:
+                continue
+            changed.append(date)
+
+        if inserts:
+            db.execute(insert(AIInfo), inserts)
+        if updates:
+            db.execute(update(AIInfo), updates)
+        self.inserted += len(inserts)
+        self.updated += len(updates)
+
+        if changed:
+            search_index.reindex_dates(db, changed)
+            category_index.reindex_dates(db, changed)
+
+    def _merge(self, row, infos_list: List[List[AIInfoItem]]) -> Dict[str, Any]:
+        """한 날짜에 대해 배치 안의 레코드들을 순서대로 적용한 최종 컬럼 값"""
+        if self.mode == "replace":
+            return new_row_columns(infos_list[-1])
+
+        columns: Dict[str, Any] = {}
+        if row is None:
+            columns = new_row_columns(infos_list[0])
+            infos_list = infos_list[1:]
+        slots = SimpleNamespace(**{column: getattr(row, column) for column in _SLOT_COLUMNS} if row is not None else {})
+        for infos in infos_list:
+            # 앞 레코드가 채운 칸도 채워진 것으로 보도록 현재 값을 갱신하면서 적용
+            for column in _SLOT_COLUMNS:
+                if column in columns:
+                    setattr(slots, column, columns[column])
+            columns.update(fill_empty_items(slots, infos))
+        return columns
+
+    def commit(self) -> None:
+        self.flush()
+        if self.dry_run or not (self.inserted or self.updated):
+            self.db.rollback()
+            return
+        bump_content_version(self.db, "ai_info")
+        self.db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        dates = self.inserted + self.updated
+        return {
+            "mode": self.mode,
+            "items": self.items,
+            "elapsed_seconds": round(elapsed, 3),
+            "dates_per_second": round(dates / elapsed, 1) if elapsed > 0 else None
+        }
@@ -0,0 +1,90 @@
+"""
+AIInfo 행의 항목(info1~info3) 접근 헬퍼
+
+AIInfo 한 행에는 최대 세 개의 항목이 언어별 컬럼(info{n}_title_{lang} 등)으로 펼쳐져 있습니다.
+기존 핸들러와 같이 한국어 제목과 내용이 있는 항목만 유효한 항목으로 봅니다.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List
+
+LANGUAGES = ("ko", "en", "ja", "zh")
+ITEMS_PER_DAY = 3
+UNCATEGORIZED = "미분류"
+
+
+def item_value(ai_info, info_index: int, field: str, language: str = None) -> Any:
+    column = f"info{info_index + 1}_{field}" + (f"_{language}" if language else "")
+    return getattr(ai_info, column, None)
+
+
+def iter_item_indexes(ai_info) -> Iterator[int]:
+    """유효한 항목의 인덱스(0~2)를 순서대로 돌려줍니다."""
+    for info_index in range(ITEMS_PER_DAY):
+        if item_value(ai_info, info_index, "title", "ko") and item_value(ai_info, info_index, "content", "ko"):
+            yield info_index
+
+
+def parse_terms(raw: str) -> List[dict]:
+    if not raw:
+        return []
+    try:
+        terms = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return []
+    return terms if isinstance(terms, list) else []
+
+
+def serialize_terms(terms) -> str:
+    """TermItem(또는 dict) 목록을 저장용 JSON 문자열로 만듭니다."""
+    if not terms:
+        return "[]"
+    return json.dumps([
+        {"term": term["term"], "description": term["description"]} if isinstance(term, dict)
+        else {"term": term.term, "description": term.description}
+        for term in terms
+    ])
+
+
+def item_columns(info, info_index: int) -> Dict[str, Any]:
+    """입력 항목(AIInfoItem) 하나를 info{n}_* 컬럼 값으로 바꿉니다. 용어는 언어별로 한 번씩만 직렬화"""
+    prefix = f"info{info_index + 1}_"
+    columns = {f"{prefix}category": info.category or ""}
+    for language in LANGUAGES:
+        columns[f"{prefix}title_{language}"] = getattr(info, f"title_{language}") or ""
+        columns[f"{prefix}content_{language}"] = getattr(info, f"content_{language}") or ""
+        columns[f"{prefix}terms_{language}"] = serialize_terms(getattr(info, f"terms_{language}"))
+    return columns
+
+
+def empty_item_columns(info_index: int) -> Dict[str, Any]:
+    prefix = f"info{info_index + 1}_"
+    columns = {f"{prefix}category": ""}
+    for language in LANGUAGES:
+        columns[f"{prefix}title_{language}"] = ""
+        columns[f"{prefix}content_{language}"] = ""
+        columns[f"{prefix}terms_{language}"] = "[]"
+    return columns
+
+
+def new_row_columns(infos: List[Any]) -> Dict[str, Any]:
+    """새 날짜 행의 info1~3 컬럼 값 (입력 순서대로 채우고 남는 칸은 빈 값)"""
+    columns: Dict[str, Any] = {}
+    for info_index in range(ITEMS_PER_DAY):
+        if info_index < len(infos):
+            columns.update(item_columns(infos[info_index], info_index))
+        else:
+            columns.update(empty_item_columns(info_index))
+    return columns
+
+
+def fill_empty_items(ai_info, infos: Iterable[Any]) -> Dict[str, Any]:
+    """기존 날짜 행의 빈 칸(한국어 제목이나 내용이 없는 칸)에 유효한 입력 항목을 앞에서부터 채울 컬럼 값을 반환합니다."""
+    pending = [info for info in infos if info.title_ko and info.content_ko]
+    columns: Dict[str, Any] = {}
+    for info_index in range(ITEMS_PER_DAY):
+        if not pending:
+            break
+        if not item_value(ai_info, info_index, "title", "ko") or not item_value(ai_info, info_index, "content", "ko"):
+            columns.update(item_columns(pending.pop(0), info_index))
+    return columns
@@ -0,0 +1,202 @@
+"""
+백업 파일을 스트리밍 방식으로 읽고 복원하기 위한 유틸리티
+
+백업 JSON 전체를 메모리에 올리지 않고 청크 단위로 파싱하여
+(테이블명, 레코드) 단위로 넘겨주고, 모델 스키마를 기반으로
+컬럼별 타입 변환 함수를 한 번만 만들어 재사용합니다.
+"""
+
+import json
+from datetime import datetime, date
+from typing import Any, Callable, Dict, Iterator, Optional, TextIO, Tuple
+
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, Numeric
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class BackupFormatError(ValueError):
+    """백업 파일 구조가 올바르지 않을 때 발생하는 예외"""
+
+
+class _ChunkReader:
+    """텍스트 스트림을 청크 단위로 읽으면서 JSON 토큰을 꺼내는 리더"""
+
+    def __init__(self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """버퍼에 다음 청크를 추가합니다. 더 읽을 내용이 없으면 False"""
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # 이미 소비한 앞부분은 버려서 버퍼가 계속 커지지 않도록 함
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자를 반환합니다. (소비하지 않음)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                raise BackupFormatError("Unexpected end of backup file")
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise BackupFormatError(f"Expected '{char}' but found '{found}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """현재 위치의 JSON 값 하나를 디코딩합니다."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buffer, self.pos)
+                # 숫자처럼 구분자가 없는 값은 버퍼 끝에서 잘렸을 수 있으므로 더 읽어서 확인
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            if not self._fill():
+                obj, end = _decoder.raw_decode(self.buffer, self.pos)
+                self.pos = end
+                return obj
+
+
+def iter_backup_stream(
+    stream: TextIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Tuple[str, Any]]:
+    """
+    백업 JSON을 점진적으로 파싱하여 이벤트를 순서대로 반환합니다.
+
+    Yields:
+        ("backup_info", dict)      - 백업 메타 정보
+        ("table", table_name)      - 테이블 데이터 시작
+        ("record", record_dict)    - 직전 테이블의 레코드 한 건
+    """
+    reader = _ChunkReader(stream, chunk_size)
+    seen_data = False
+
+    reader.expect("{")
+    if reader.peek() == "}":
+        raise BackupFormatError("Invalid backup file format")
+
+    while True:
+        key = reader.value()
+        reader.expect(":")
+
+        if key == "data":
+            seen_data = True
+            reader.expect("{")
+            if reader.peek() == "}":
+                reader.pos += 1
+            else:
+                while True:
+                    table_name = reader.value()
+                    reader.expect(":")
+                    yield ("table", table_name)
+
+                    reader.expect("[")
+                    if reader.peek() == "]":
+                        reader.pos += 1
+                    else:
+                        while True:
+                            yield ("record", reader.value())
+                            if reader.peek() == ",":
+                                reader.pos += 1
+                                continue
+                            reader.expect("]")
+                            break
+
+                    if reader.peek() == ",":
+                        reader.pos += 1
+                        continue
+                    reader.expect("}")
+                    break
+        elif key == "backup_info":
+            yield ("backup_info", reader.value())
+        else:
+            # 알 수 없는 최상위 키는 건너뜀
+            reader.value()
+
+        if reader.peek() == ",":
+            reader.pos += 1
+            continue
+        reader.expect("}")
+        break
+
+    if not seen_data:
+        raise BackupFormatError("Invalid backup file format")
+
+
+def _parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _parse_date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+def _parse_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "t", "yes", "y")
+    return bool(value)
+
+
+def build_column_coercers(model) -> Dict[str, Optional[Callable[[Any], Any]]]:
+    """
+    모델 스키마를 보고 컬럼별 변환 함수를 한 번만 만들어 둡니다.
+
+    Returns:
+        {컬럼명: 변환 함수 또는 None(그대로 사용)}
+    """
+    coercers = {}
+    for column in model.__table__.columns:
+        column_type = column.type
+        if isinstance(column_type, DateTime):
+            coercers[column.name] = _parse_datetime
+        elif isinstance(column_type, Date):
+            coercers[column.name] = _parse_date
+        elif isinstance(column_type, Boolean):
+            coercers[column.name] = _parse_bool
+        elif isinstance(column_type, Integer):
+            coercers[column.name] = int
+        elif isinstance(column_type, (Float, Numeric)):
+            coercers[column.name] = float
+        else:
+            coercers[column.name] = None
+    return coercers
+
+
+def coerce_record(record: Dict[str, Any], coercers: Dict[str, Optional[Callable[[Any], Any]]]) -> Dict[str, Any]:
+    """모델에 없는 키는 버리고, 변환이 필요한 컬럼만 변환합니다."""
+    row = {}
+    for key, value in record.items():
+        if key not in coercers:
+            continue
+        convert = coercers[key]
+        if convert is not None and value is not None and value != "":
+            try:
+                value = convert(value)
+            except (TypeError, ValueError):
+                pass
+        row[key] = value
+    return row
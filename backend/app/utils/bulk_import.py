@@ -0,0 +1,192 @@
+"""
+대량 가져오기/내보내기 (NDJSON, CSV) 유틸리티
+
+요청 본문을 한 번에 메모리에 올리지 않고 청크 단위로 받아 레코드(dict)를 하나씩 넘겨줍니다.
+    async for record in iter_records(request.stream(), "ndjson"):
+        record.line, record.data, record.error
+
+- NDJSON: 한 줄에 JSON 객체 하나 (빈 줄은 건너뜀)
+- CSV: 첫 줄이 헤더(필드명), 따옴표로 감싼 값 안의 줄바꿈 허용, 빈 값은 필드가 없는 것으로 처리
+잘못된 줄은 예외 대신 error가 채워진 레코드로 넘겨서 호출하는 쪽이 행 단위 오류로 보고할 수 있게 합니다.
+"""
+
+import codecs
+import csv
+import io
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+import orjson
+
+BULK_FORMATS = ("ndjson", "csv")
+BULK_MAX_REPORTED_ERRORS = 100
+
+_CONTENT_TYPES = {
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "text/csv": "csv"
+}
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+class BulkRecord(NamedTuple):
+    line: int                         # 레코드가 시작하는 줄 번호 (1부터, CSV 헤더 포함)
+    data: Optional[Dict[str, Any]]
+    error: Optional[str] = None
+
+
+def detect_format(content_type: Optional[str], requested: Optional[str] = None) -> Optional[str]:
+    """format 파라미터가 있으면 그것을, 없으면 Content-Type으로 형식을 정합니다."""
+    if requested:
+        requested = requested.lower()
+        return requested if requested in BULK_FORMATS else None
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    return _CONTENT_TYPES.get(media_type)
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """바이트 청크를 UTF-8 줄 단위로 나눕니다. (줄 끝 문자 제외, 첫 줄의 BOM 제거)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        lines = pending.split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_records(chunks: AsyncIterator[bytes], fmt: str) -> AsyncIterator[BulkRecord]:
+    lines = iter_lines(chunks)
+    if fmt == "csv":
+        async for record in _iter_csv(lines):
+            yield record
+    else:
+        async for record in _iter_ndjson(lines):
+            yield record
+
+
+def parse_ndjson_line(line_no: int, line: str) -> Optional[BulkRecord]:
+    """NDJSON 한 줄을 레코드로 바꿉니다. 빈 줄이면 None (파일을 직접 읽는 CLI에서도 사용)"""
+    if not line.strip():
+        return None
+    try:
+        data = orjson.loads(line)
+    except orjson.JSONDecodeError as e:
+        return BulkRecord(line_no, None, f"Invalid JSON: {e}")
+    if not isinstance(data, dict):
+        return BulkRecord(line_no, None, "Each line must be a JSON object")
+    return BulkRecord(line_no, data)
+
+
+async def _iter_ndjson(lines: AsyncIterator[str]) -> AsyncIterator[BulkRecord]:
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        record = parse_ndjson_line(line_no, line)
+        if record is not None:
+            yield record
+
+
+async def _iter_csv(lines: AsyncIterator[str]) -> AsyncIterator[BulkRecord]:
+    header: Optional[List[str]] = None
+    line_no = 0
+    start_line = 0
+    buffered: List[str] = []
+    quotes = 0
+    async for line in lines:
+        line_no += 1
+        if not buffered:
+            start_line = line_no
+        buffered.append(line)
+        quotes += line.count('"')
+        # 따옴표 개수가 홀수면 값 안의 줄바꿈이므로 다음 줄까지 모아서 한 레코드로 파싱
+        if quotes % 2:
+            continue
+        text = "\n".join(buffered)
+        buffered = []
+        quotes = 0
+        if not text.strip():
+            continue
+        try:
+            values = next(csv.reader([text]))
+        except csv.Error as e:
+            yield BulkRecord(start_line, None, f"Invalid CSV: {e}")
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) > len(header):
+            yield BulkRecord(start_line, None, f"Expected {len(header)} columns, got {len(values)}")
+            continue
+        yield BulkRecord(start_line, {name: value for name, value in zip(header, values) if name and value != ""})
+    if buffered:
+        yield BulkRecord(start_line, None, "Invalid CSV: unterminated quoted value")
+
+
+class BulkReport:
+    """가져오기 결과 집계 (오류는 BULK_MAX_REPORTED_ERRORS개까지만 상세 기록)"""
+
+    def __init__(self, fmt: str, dry_run: bool = False):
+        self.format = fmt
+        self.dry_run = dry_run
+        self.received = 0
+        self.inserted = 0
+        self.updated = 0
+        self.failed = 0
+        self.errors: List[Dict[str, Any]] = []
+
+    def error(self, line: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < BULK_MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "format": self.format,
+            "dry_run": self.dry_run,
+            "received": self.received,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors)
+        }
+
+
+def validation_message(exc: Exception) -> str:
+    """pydantic ValidationError를 "필드: 메시지; ..." 한 줄로 줄입니다."""
+    errors = getattr(exc, "errors", None)
+    if not callable(errors):
+        return str(exc)
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error.get('loc', ())) or 'row'}: {error.get('msg')}"
+        for error in errors()
+    )
+
+
+def iter_ndjson_bytes(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    for row in rows:
+        yield orjson.dumps(row, default=str) + b"\n"
+
+
+def iter_csv_bytes(fields: List[str], rows: Iterable[Dict[str, Any]], batch_size: int = 500) -> Iterator[bytes]:
+    """헤더 + 행을 batch_size개씩 묶어 인코딩합니다. (엑셀에서 한글이 깨지지 않도록 BOM 포함)"""
+    yield codecs.BOM_UTF8
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore", lineterminator="\n")
+    writer.writeheader()
+    pending = 1
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue().encode("utf-8")
+
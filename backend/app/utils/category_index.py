@@ -0,0 +1,181 @@
+"""
+AI 정보 카테고리 색인
+
+유효한 항목(info1~3)마다 ai_info_category_index 테이블에 (카테고리, 날짜, 항목 인덱스, AIInfo id) 한 행을 둡니다.
+저장된 카테고리가 없는 항목은 색인할 때 한 번만 ai_classifier로 분류하므로 요청 처리 중에는 분류하지 않습니다.
+
+프로세스 안에는 카테고리 -> (날짜 내림차순) 항목 목록과 카테고리별 통계를 메모리에 두고,
+ai_info 콘텐츠 버전이 바뀌면(다른 워커의 쓰기 포함) 테이블에서 한 번에 다시 읽습니다.
+쓰기 핸들러는 mark_ai_info_changed()를 통해 같은 트랜잭션 안에서 해당 날짜의 행을 다시 만듭니다.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from ..models import AIInfo, AIInfoCategoryPosting
+from .ai_classifier import ai_classifier
+from .ai_info_items import LANGUAGES, item_value, iter_item_indexes
+from .content_version import bump_content_version, get_content_version
+
+logger = logging.getLogger(__name__)
+
+# content_versions에 두는 전체 색인 횟수 (0이면 기존 AI 정보를 아직 한 번도 전체 색인하지 않은 것)
+CATEGORY_INDEX_MARKER = "category_index"
+
+
+class Posting(NamedTuple):
+    date: str
+    info_index: int
+    ai_info_id: int
+    subcategory: Optional[str]
+    confidence: float
+
+
+def classify_item(ai_info, info_index: int) -> Dict[str, Any]:
+    """
+    저장된 카테고리가 있으면 그대로, 없으면 제목/내용이 있는 첫 언어(LANGUAGES 순서)로 분류합니다.
+    색인은 항목마다 카테고리 하나를 두므로 요청 언어와 관계없이 같은 항목은 같은 카테고리에 속합니다.
+    """
+    stored_category = item_value(ai_info, info_index, "category")
+    if stored_category and stored_category.strip():
+        return {"category": stored_category, "subcategory": None, "confidence": 1.0}
+    language = next(
+        (lang for lang in LANGUAGES
+         if item_value(ai_info, info_index, "title", lang) and item_value(ai_info, info_index, "content", lang)),
+        LANGUAGES[0]
+    )
+    classification = ai_classifier.classify_content(
+        item_value(ai_info, info_index, "title", language),
+        item_value(ai_info, info_index, "content", language)
+    )
+    return {
+        "category": classification["category"],
+        "subcategory": classification.get("subcategory"),
+        "confidence": classification.get("confidence", 0.0)
+    }
+
+
+def build_postings(ai_info) -> List[AIInfoCategoryPosting]:
+    return [
+        AIInfoCategoryPosting(date=ai_info.date, info_index=info_index, ai_info_id=ai_info.id, **classify_item(ai_info, info_index))
+        for info_index in iter_item_indexes(ai_info)
+    ]
+
+
+class CategoryIndex:
+    """카테고리 색인 테이블과 프로세스 내 메모리 색인을 관리합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._postings: Dict[str, List[Posting]] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._backfilled = False
+
+    # ---- 쓰기 (호출한 세션의 트랜잭션 안에서 실행, 커밋은 호출하는 쪽에서) ----
+
+    def reindex_date(self, db: Session, date: str) -> None:
+        """해당 날짜의 색인 행을 현재 AIInfo 내용으로 다시 만듭니다."""
+        self.reindex_dates(db, [date])
+
+    def reindex_dates(self, db: Session, dates: List[str]) -> None:
+        """여러 날짜를 한 번의 삭제/조회로 다시 색인합니다. (항목마다 분류는 한 번)"""
+        db.flush()
+        db.query(AIInfoCategoryPosting).filter(AIInfoCategoryPosting.date.in_(dates)).delete(synchronize_session=False)
+        for ai_info in db.query(AIInfo).filter(AIInfo.date.in_(dates)).all():
+            db.add_all(build_postings(ai_info))
+
+    def rebuild(self, db: Session) -> int:
+        """모든 색인 행을 다시 만듭니다. (복원/전체 삭제 후, 또는 테이블이 비어 있을 때)"""
+        db.flush()
+        db.query(AIInfoCategoryPosting).delete(synchronize_session=False)
+        count = 0
+        for ai_info in db.query(AIInfo).all():
+            postings = build_postings(ai_info)
+            db.add_all(postings)
+            count += len(postings)
+        bump_content_version(db, CATEGORY_INDEX_MARKER)
+        return count
+
+    # ---- 읽기 ----
+
+    def ensure_loaded(self, db: Session) -> None:
+        """ai_info 버전이 바뀌었으면 색인 테이블에서 메모리 색인을 다시 만듭니다."""
+        version = get_content_version(db, "ai_info")
+        if version == self._version:
+            return
+        with self._lock:
+            if version == self._version:
+                return
+            self._ensure_backfilled(db)
+            rows = db.query(
+                AIInfoCategoryPosting.category,
+                AIInfoCategoryPosting.date,
+                AIInfoCategoryPosting.info_index,
+                AIInfoCategoryPosting.ai_info_id,
+                AIInfoCategoryPosting.subcategory,
+                AIInfoCategoryPosting.confidence
+            ).order_by(AIInfoCategoryPosting.date.desc(), AIInfoCategoryPosting.info_index).all()
+
+            postings: Dict[str, List[Posting]] = {}
+            dates: Dict[str, Dict[str, None]] = {}
+            for row in rows:
+                postings.setdefault(row.category, []).append(
+                    Posting(row.date, row.info_index, row.ai_info_id, row.subcategory, row.confidence if row.confidence is not None else 1.0)
+                )
+                # 날짜 내림차순으로 읽으므로 dict 키 순서가 곧 정렬 순서 (중복 제거는 O(1))
+                dates.setdefault(row.category, {})[row.date] = None
+
+            self._postings = postings
+            self._stats = {
+                category: {"count": len(items), "dates": list(dates[category])}
+                for category, items in postings.items()
+            }
+            self._version = version
+            logger.info("카테고리 색인 로드: %d개 항목, %d개 카테고리 (버전 %s)", len(rows), len(postings), version)
+
+    def _ensure_backfilled(self, db: Session) -> None:
+        """전체 색인을 한 번도 하지 않았으면 한 번 전체 색인합니다. (날짜 단위 쓰기가 먼저 들어와도 기존 자료를 놓치지 않도록 표시로 판단)"""
+        if self._backfilled:
+            return
+        if get_content_version(db, CATEGORY_INDEX_MARKER) == 0:
+            from ..database import SessionLocal
+
+            # 읽기 세션(복제본)일 수 있으므로 primary 세션에서 색인
+            write_db = SessionLocal()
+            try:
+                count = self.rebuild(write_db)
+                write_db.commit()
+                logger.info("카테고리 색인 생성 완료: %d개 항목", count)
+            finally:
+                write_db.close()
+        self._backfilled = True
+
+    def postings(self, db: Session, category: str) -> List[Posting]:
+        """카테고리에 속한 항목 (날짜 내림차순, 같은 날짜는 항목 순서)"""
+        self.ensure_loaded(db)
+        return self._postings.get(category, [])
+
+    def stats(self, db: Session) -> Dict[str, Dict[str, Any]]:
+        """{카테고리: {"count": 항목 수, "dates": 날짜 목록(내림차순)}}"""
+        self.ensure_loaded(db)
+        return self._stats
+
+    def warm_up(self) -> None:
+        """서버 시작 시 색인을 미리 만들어 둡니다. (실패해도 첫 요청에서 다시 시도)"""
+        from ..database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            self.ensure_loaded(db)
+        except Exception:
+            logger.exception("카테고리 색인 미리 로드 실패")
+        finally:
+            db.close()
+
+
+# 전역 인스턴스
+category_index = CategoryIndex()
@@ -0,0 +1,100 @@
+"""
+콘텐츠 버전 (쓰기 카운터)
+
+콘텐츠 종류(ai_info, term, prompt, base_content, quiz)마다 정수 버전을 DB에 두고, 쓰기 핸들러가
+같은 트랜잭션 안에서 bump_content_version()으로 올립니다. 응답 캐시는 (종류, 버전, 파라미터)를 키로
+사용하므로 버전이 바뀌면 이전 캐시는 자연히 쓰이지 않습니다. 여러 워커가 떠 있어도 DB 값을 기준으로
+맞춰지며, 읽기 쪽은 버전을 CONTENT_VERSION_TTL_SECONDS 동안만 프로세스 안에 캐시합니다.
+"""
+
+import os
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..models import ContentVersion
+from .cache import TTLCache
+
+CONTENT_VERSION_TTL = float(os.getenv("CONTENT_VERSION_TTL_SECONDS", "2"))
+CONTENT_NAMES = ("ai_info", "term", "prompt", "base_content", "quiz")
+
+_version_cache = TTLCache(ttl=CONTENT_VERSION_TTL, maxsize=64)
+_BUMPED_KEY = "content_versions_bumped"
+
+
+def get_content_version(db: Session, name: str) -> int:
+    """현재 버전을 반환합니다. (한 번도 쓰기가 없었으면 0)"""
+    version = _version_cache.get(name)
+    if version is None:
+        version = db.query(ContentVersion.version).filter(ContentVersion.name == name).scalar() or 0
+        _version_cache.set(name, version)
+    return version
+
+
+async def get_content_version_async(db: AsyncSession, name: str) -> int:
+    """get_content_version의 async 세션용 버전"""
+    version = _version_cache.get(name)
+    if version is None:
+        result = await db.execute(select(ContentVersion.version).where(ContentVersion.name == name))
+        version = result.scalar() or 0
+        _version_cache.set(name, version)
+    return version
+
+
+def _increment_statement(db: Session, name: str):
+    """이름이 없으면 1로 만들고 있으면 1 올리는 upsert (처음 쓰는 두 요청이 동시에 INSERT해도 충돌하지 않음)"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    return insert(ContentVersion).values(name=name, version=1).on_conflict_do_update(
+        index_elements=[ContentVersion.name],
+        set_={"version": ContentVersion.version + 1, "updated_at": func.now()}
+    )
+
+
+def bump_content_version(db: Session, name: str) -> None:
+    """호출한 세션의 트랜잭션 안에서 버전을 1 올립니다. (커밋은 호출하는 쪽에서)"""
+    statement = _increment_statement(db, name)
+    if statement is not None:
+        db.execute(statement)
+    else:
+        updated = db.query(ContentVersion).filter(ContentVersion.name == name).update(
+            {ContentVersion.version: ContentVersion.version + 1},
+            synchronize_session=False
+        )
+        if not updated:
+            db.add(ContentVersion(name=name, version=1))
+    
+    # 커밋된 뒤에 이 프로세스의 버전 캐시를 비워서 바로 새 버전이 보이도록 함
+    # (세션마다 리스너는 한 번만 등록하고, 올린 이름은 db.info에 모아 둠)
+    bumped = db.info.get(_BUMPED_KEY)
+    if bumped is None:
+        bumped = db.info[_BUMPED_KEY] = set()
+        event.listen(db, "after_commit", _clear_bumped_versions)
+        event.listen(db, "after_rollback", _forget_bumped_versions)
+    bumped.add(name)
+
+
+def _clear_bumped_versions(session: Session) -> None:
+    bumped = session.info.get(_BUMPED_KEY)
+    if bumped:
+        for name in bumped:
+            _version_cache.delete(name)
+        bumped.clear()
+
+
+def _forget_bumped_versions(session: Session) -> None:
+    bumped = session.info.get(_BUMPED_KEY)
+    if bumped:
+        bumped.clear()
+
+
+def bump_all_content_versions(db: Session) -> None:
+    """복원/전체 삭제처럼 여러 테이블이 한꺼번에 바뀐 경우에 사용합니다."""
+    for name in CONTENT_NAMES:
+        bump_content_version(db, name)
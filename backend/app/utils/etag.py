@@ -0,0 +1,72 @@
+"""
+콘텐츠 버전 기반 조건부 GET (ETag / If-None-Match)
+
+ETag는 콘텐츠 버전(쓰기 카운터)으로 만들기 때문에, 버전을 확인하는 작은 쿼리(또는 프로세스 내 캐시)만으로
+304 Not Modified를 돌려줄 수 있고 본문을 만드는 무거운 쿼리는 실행하지 않습니다.
+ETag는 URL별로 비교되므로 같은 콘텐츠 종류를 쓰는 여러 엔드포인트가 같은 버전 값을 공유해도 됩니다.
+GZip 미들웨어가 본문을 바꾸므로 weak ETag(W/)를 사용합니다.
+"""
+
+import os
+from typing import Optional
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .content_version import get_content_version, get_content_version_async
+
+# 배포마다 응답 형식이 바뀔 수 있으므로 커밋 해시를 ETag에 섞음
+ETAG_SALT = os.getenv("ETAG_SALT") or os.getenv("RAILWAY_GIT_COMMIT_SHA", "")[:8]
+CACHE_CONTROL = "no-cache"
+
+
+def content_etag(name: str, version: int) -> str:
+    suffix = f"-{ETAG_SALT}" if ETAG_SALT else ""
+    return f'W/"{name}-{version}{suffix}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더에 etag가 있는지 확인합니다. (weak 비교)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def _apply(request: Request, response: Response, etag: str) -> Optional[Response]:
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return None
+
+
+def conditional_get(request: Request, response: Response, db: Session, name: str) -> Optional[Response]:
+    """
+    콘텐츠 버전이 클라이언트가 가진 것과 같으면 304 응답을 반환하고, 아니면 응답에 ETag를 달고 None을 반환합니다.
+
+    사용 예:
+        not_modified = conditional_get(request, response, db, "ai_info")
+        if not_modified:
+            return not_modified
+    """
+    return _apply(request, response, content_etag(name, get_content_version(db, name)))
+
+
+async def conditional_get_async(request: Request, response: Response, db: AsyncSession, name: str) -> Optional[Response]:
+    """conditional_get의 async 핸들러용 버전"""
+    return _apply(request, response, content_etag(name, await get_content_version_async(db, name)))
@@ -0,0 +1,242 @@
+"""
+RSS/Atom 피드 수집
+
+1) 가져오기: 등록된 피드를 asyncio로 동시에(FEED_FETCH_CONCURRENCY개씩) 요청합니다. 요청 자체는 urllib를
+   asyncio.to_thread로 실행하고, 저장해 둔 ETag/Last-Modified로 조건부 GET을 보내 변경이 없으면(304) 본문을 받지 않습니다.
+   file:// 주소도 받으므로 로컬 픽스처 피드로 시험할 수 있습니다. (파일 수정 시각이 같으면 304로 처리)
+2) 파싱/중복 제거: feedparser로 항목을 읽고, 정규화한 제목+요약의 sha256을 content_hash로 씁니다.
+   이미 저장된 해시는 SELECT 한 번으로 걸러내고, 같은 실행 안에서 여러 피드에 실린 같은 기사도 한 번만 저장합니다.
+3) 분류/스테이징: 새 항목만 ai_classifier로 분류해서 target_date의 후보(status=candidate)로 feed_entries에 넣습니다.
+   INSERT는 content_hash 충돌 시 건너뛰므로(ON CONFLICT DO NOTHING) 동시에 돈 수집과 겹쳐도 실패하지 않고 중복으로 셉니다.
+ETag/Last-Modified는 가져오기와 파싱이 모두 성공했을 때만 갱신하므로, 파싱에 실패한 피드는 다음 실행에서 다시 받습니다.
+
+    report = asyncio.run(ingest_feeds(db, target_date="2025-01-01"))
+"""
+
+import asyncio
+import hashlib
+import html
+import os
+import re
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+import feedparser
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from ..models import FeedEntry, FeedSource
+from .ai_classifier import ai_classifier
+
+FEED_FETCH_CONCURRENCY = int(os.getenv("FEED_FETCH_CONCURRENCY", "5"))
+FEED_FETCH_TIMEOUT_SECONDS = float(os.getenv("FEED_FETCH_TIMEOUT_SECONDS", "15"))
+FEED_MAX_ENTRIES_PER_FEED = int(os.getenv("FEED_MAX_ENTRIES_PER_FEED", "50"))
+FEED_MAX_BYTES = int(os.getenv("FEED_MAX_BYTES", str(5 * 1024 * 1024)))
+FEED_USER_AGENT = os.getenv("FEED_USER_AGENT", "AIMasteryHub-FeedIngest/1.0")
+# 관리자 API로 file:// 피드를 등록할 수 있는지 (기본: http/https만, CLI와 픽스처는 항상 허용)
+FEED_ALLOW_FILE_URLS = os.getenv("FEED_ALLOW_FILE_URLS", "false").strip().lower() in ("1", "true", "yes", "on")
+
+FEED_ENTRY_STATUSES = ("candidate", "published", "rejected")
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_HASH_IN_CHUNK = 500
+
+
+class FetchResult(NamedTuple):
+    status: Optional[int]           # HTTP 상태 (304 = 변경 없음, None = 연결 실패)
+    body: Optional[bytes]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    error: Optional[str] = None
+
+
+def fetch_feed(url: str, etag: Optional[str] = None, last_modified: Optional[str] = None,
+               timeout: float = FEED_FETCH_TIMEOUT_SECONDS) -> FetchResult:
+    """피드 하나를 조건부 GET으로 가져옵니다. (블로킹, 스레드에서 실행)"""
+    request = urllib.request.Request(url, headers={
+        "User-Agent": FEED_USER_AGENT,
+        "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8"
+    })
+    if etag:
+        request.add_header("If-None-Match", etag)
+    if last_modified:
+        request.add_header("If-Modified-Since", last_modified)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            new_etag = response.headers.get("ETag")
+            new_last_modified = response.headers.get("Last-Modified")
+            # file:// 은 조건부 요청을 처리하지 않으므로 수정 시각이 같으면 304로 간주
+            if url.startswith("file:") and last_modified and new_last_modified == last_modified:
+                return FetchResult(304, None, etag, last_modified)
+            body = response.read(FEED_MAX_BYTES + 1)
+            if len(body) > FEED_MAX_BYTES:
+                return FetchResult(413, None, etag, last_modified, f"Feed larger than {FEED_MAX_BYTES} bytes")
+            return FetchResult(getattr(response, "status", None) or 200, body, new_etag, new_last_modified)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return FetchResult(304, None, etag, last_modified)
+        return FetchResult(e.code, None, etag, last_modified, f"HTTP {e.code}: {e.reason}")
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        return FetchResult(None, None, etag, last_modified, str(getattr(e, "reason", e)))
+
+
+async def fetch_all(sources: Sequence[FeedSource], concurrency: int = FEED_FETCH_CONCURRENCY) -> List[FetchResult]:
+    """여러 피드를 동시에 가져옵니다. 결과는 sources와 같은 순서"""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch(source: FeedSource) -> FetchResult:
+        async with semaphore:
+            return await asyncio.to_thread(fetch_feed, source.url, source.etag, source.last_modified)
+
+    return await asyncio.gather(*(fetch(source) for source in sources))
+
+
+def clean_text(value: Optional[str]) -> str:
+    """HTML 태그와 엔티티를 걷어내고 공백을 하나로 줄입니다."""
+    if not value:
+        return ""
+    return " ".join(html.unescape(_TAG_RE.sub(" ", value)).split())
+
+
+def content_hash(title: str, summary: str) -> str:
+    """주소나 피드가 달라도 같은 기사면 같은 값이 되도록 정규화한 제목+요약으로 해시합니다."""
+    normalized = "\n".join(" ".join(part.casefold().split()) for part in (title, summary))
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _published_at(entry) -> Optional[datetime]:
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if not parsed:
+        return None
+    return datetime(*parsed[:6], tzinfo=timezone.utc)
+
+
+def parse_entries(body: bytes, limit: int = FEED_MAX_ENTRIES_PER_FEED) -> List[Dict[str, Any]]:
+    """피드 본문에서 제목이 있는 항목을 최대 limit개 꺼냅니다."""
+    parsed = feedparser.parse(body)
+    entries = []
+    for entry in parsed.entries[:limit]:
+        title = clean_text(entry.get("title"))
+        if not title:
+            continue
+        summary = clean_text(entry.get("summary") or entry.get("description"))
+        entries.append({
+            "guid": entry.get("id") or entry.get("link"),
+            "link": entry.get("link"),
+            "title": title,
+            "summary": summary,
+            "published_at": _published_at(entry),
+            "content_hash": content_hash(title, summary)
+        })
+    return entries
+
+
+def _existing_hashes(db: Session, hashes: List[str]) -> set:
+    existing = set()
+    for start in range(0, len(hashes), _HASH_IN_CHUNK):
+        chunk = hashes[start:start + _HASH_IN_CHUNK]
+        existing.update(row[0] for row in db.query(FeedEntry.content_hash).filter(FeedEntry.content_hash.in_(chunk)))
+    return existing
+
+
+def _insert_entries(db: Session, rows: List[Dict[str, Any]]) -> set:
+    """content_hash가 이미 있으면 건너뛰며 INSERT하고, 실제로 들어간 해시를 반환합니다."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        db.execute(insert(FeedEntry), rows)
+        return {row["content_hash"] for row in rows}
+    statement = dialect_insert(FeedEntry).on_conflict_do_nothing(index_elements=["content_hash"]) \
+        .returning(FeedEntry.content_hash)
+    return set(db.scalars(statement, rows))
+
+
+def store_results(db: Session, sources: Sequence[FeedSource], results: Sequence[FetchResult], target_date: str) -> List[Dict[str, Any]]:
+    """가져온 결과를 파싱/중복 제거/분류해서 후보로 저장하고 소스별 결과를 반환합니다. (커밋 포함)"""
+    now = datetime.now(timezone.utc)
+    parsed: List[List[Dict[str, Any]]] = []
+    reports: List[Dict[str, Any]] = []
+    for source, result in zip(sources, results):
+        report = {"source_id": source.id, "name": source.name, "status": result.status, "error": result.error,
+                  "entries": 0, "new": 0, "duplicates": 0}
+        entries: List[Dict[str, Any]] = []
+        if result.body is not None:
+            try:
+                entries = parse_entries(result.body)
+            except Exception as e:
+                report["error"] = f"Parse error: {e}"
+        report["entries"] = len(entries)
+        parsed.append(entries)
+        reports.append(report)
+
+        source.last_status = result.status
+        source.last_error = report["error"]
+        source.last_fetched_at = now
+        if report["error"] is None:
+            source.etag = result.etag
+            source.last_modified = result.last_modified
+
+    seen = _existing_hashes(db, [entry["content_hash"] for entries in parsed for entry in entries])
+    rows: List[Dict[str, Any]] = []
+    row_reports: List[Dict[str, Any]] = []
+    for source, entries, report in zip(sources, parsed, reports):
+        for entry in entries:
+            if entry["content_hash"] in seen:
+                report["duplicates"] += 1
+                continue
+            seen.add(entry["content_hash"])
+            # 새 항목만 분류 (이미 저장된 기사는 다시 분류하지 않음)
+            classification = ai_classifier.classify_content(entry["title"], entry["summary"])
+            rows.append({
+                **entry,
+                "source_id": source.id,
+                "language": source.language,
+                "target_date": target_date,
+                "category": classification["category"],
+                "subcategory": classification.get("subcategory"),
+                "confidence": classification.get("confidence"),
+                "status": "candidate"
+            })
+            row_reports.append(report)
+            report["new"] += 1
+
+    if rows:
+        inserted = _insert_entries(db, rows)
+        # 조회 후 다른 수집이 먼저 넣은 기사는 중복으로 옮겨 셈
+        for row, report in zip(rows, row_reports):
+            if row["content_hash"] not in inserted:
+                report["new"] -= 1
+                report["duplicates"] += 1
+    db.commit()
+    return reports
+
+
+async def ingest_feeds(db: Session, target_date: Optional[str] = None, source_ids: Optional[Sequence[int]] = None,
+                       concurrency: int = FEED_FETCH_CONCURRENCY) -> Dict[str, Any]:
+    """활성화된 피드(또는 source_ids)를 가져와 target_date(기본 오늘)의 후보로 저장합니다."""
+    target_date = target_date or datetime.now().strftime("%Y-%m-%d")
+    query = db.query(FeedSource).filter(FeedSource.enabled.is_(True))
+    if source_ids:
+        query = query.filter(FeedSource.id.in_(list(source_ids)))
+    sources = await asyncio.to_thread(lambda: query.order_by(FeedSource.id).all())
+
+    started = datetime.now(timezone.utc)
+    results = await fetch_all(sources, concurrency)
+    fetched = datetime.now(timezone.utc)
+    reports = await asyncio.to_thread(store_results, db, sources, results, target_date)
+
+    return {
+        "target_date": target_date,
+        "sources": reports,
+        "new": sum(report["new"] for report in reports),
+        "duplicates": sum(report["duplicates"] for report in reports),
+        "not_modified": sum(1 for report in reports if report["status"] == 304),
+        "failed": sum(1 for report in reports if report["error"]),
+        "fetch_seconds": round((fetched - started).total_seconds(), 3),
+        "total_seconds": round((datetime.now(timezone.utc) - started).total_seconds(), 3)
+    }
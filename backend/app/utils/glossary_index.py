@@ -0,0 +1,144 @@
+"""
+용어 사전 목록 색인 (정렬, 키셋 페이지네이션, 첫 글자 버킷)
+
+term 콘텐츠 버전마다 Term 전체를 한 번 읽어 정규화한 용어 순으로 정렬해 두고,
+- 페이지 요청은 after(이전 페이지 마지막 용어)의 위치를 bisect로 찾아 limit개만 잘라 반환하고
+- 첫 글자 버킷(A~Z, ㄱ~ㅎ, 0-9, #)별로도 같은 정렬 배열을 두어 점프 바에서 버킷 단위로 읽을 수 있게 합니다.
+DB별 정렬 규칙(collation) 차이 없이 항상 같은 순서를 보장하기 위해 정렬은 파이썬에서 합니다.
+"""
+
+import threading
+import unicodedata
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..models import Term
+from .content_version import get_content_version
+from .term_suggest import normalize_term
+
+DIGIT_BUCKET = "0-9"
+OTHER_BUCKET = "#"
+LATIN_BUCKETS = tuple(chr(code) for code in range(ord("A"), ord("Z") + 1))
+HANGUL_BUCKETS = ("ㄱ", "ㄴ", "ㄷ", "ㄹ", "ㅁ", "ㅂ", "ㅅ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+BUCKET_ORDER = LATIN_BUCKETS + HANGUL_BUCKETS + (DIGIT_BUCKET, OTHER_BUCKET)
+
+# 한글 음절의 초성 19개 (된소리는 점프 바에서 예사소리 버킷으로 묶음)
+_CHOSEONG = ("ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+_TENSE_TO_PLAIN = {"ㄲ": "ㄱ", "ㄸ": "ㄷ", "ㅃ": "ㅂ", "ㅆ": "ㅅ", "ㅉ": "ㅈ"}
+
+SortKey = Tuple[str, str]
+
+
+def term_bucket(term: str) -> str:
+    """용어의 첫 글자로 버킷을 정합니다."""
+    stripped = (term or "").strip()
+    if not stripped:
+        return OTHER_BUCKET
+    # 호환용 자모(ㄱ 등)는 NFKC에서 조합형 자모로 바뀌므로 정규화 전에 확인
+    if stripped[0] in _TENSE_TO_PLAIN or stripped[0] in HANGUL_BUCKETS:
+        return _TENSE_TO_PLAIN.get(stripped[0], stripped[0])
+    first = unicodedata.normalize("NFKC", stripped[0])[:1]
+    if "a" <= first.lower() <= "z":
+        return first.upper()
+    if first.isdigit():
+        return DIGIT_BUCKET
+    code = ord(first)
+    if 0xAC00 <= code <= 0xD7A3:
+        initial = _CHOSEONG[(code - 0xAC00) // 588]
+        return _TENSE_TO_PLAIN.get(initial, initial)
+    return OTHER_BUCKET
+
+
+def sort_key(term: str) -> SortKey:
+    # 정규화 키가 같으면 원래 문자열로 순서를 고정 (키셋 커서가 항상 한 위치를 가리키도록)
+    return normalize_term(term), term or ""
+
+
+class _Listing:
+    __slots__ = ("keys", "entries")
+
+    def __init__(self):
+        self.keys: List[SortKey] = []
+        self.entries: List[Dict[str, Any]] = []
+
+
+class _Snapshot:
+    __slots__ = ("version", "all", "buckets")
+
+    def __init__(self, version: int):
+        self.version = version
+        self.all = _Listing()
+        self.buckets: Dict[str, _Listing] = {}
+
+
+class GlossaryIndex:
+    """term 버전별 정렬 목록과 버킷 색인"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+
+    def snapshot(self, db: Session) -> _Snapshot:
+        version = get_content_version(db, "term")
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != version:
+                self._snapshot = self._build(db, version)
+            return self._snapshot
+
+    def _build(self, db: Session, version: int) -> _Snapshot:
+        rows = db.query(Term.id, Term.term, Term.description, Term.created_at).all()
+        entries = sorted(
+            (
+                {"id": row.id, "term": row.term, "description": row.description or "", "created_at": row.created_at}
+                for row in rows
+            ),
+            key=lambda entry: sort_key(entry["term"])
+        )
+
+        snapshot = _Snapshot(version)
+        for entry in entries:
+            key = sort_key(entry["term"])
+            snapshot.all.keys.append(key)
+            snapshot.all.entries.append(entry)
+            bucket = term_bucket(entry["term"])
+            listing = snapshot.buckets.get(bucket)
+            if listing is None:
+                listing = snapshot.buckets[bucket] = _Listing()
+            listing.keys.append(key)
+            listing.entries.append(entry)
+        return snapshot
+
+    def all_terms(self, db: Session) -> List[Dict[str, Any]]:
+        return self.snapshot(db).all.entries
+
+    def page(self, db: Session, limit: int, after: Optional[str] = None, bucket: Optional[str] = None) -> Dict[str, Any]:
+        """after 다음부터 limit개. bucket을 주면 해당 첫 글자 버킷 안에서만 페이지를 나눕니다."""
+        snapshot = self.snapshot(db)
+        listing = snapshot.all if bucket is None else snapshot.buckets.get(bucket, _Listing())
+        start = bisect_right(listing.keys, sort_key(after)) if after is not None else 0
+        items = listing.entries[start:start + limit]
+        has_more = start + limit < len(listing.entries)
+        return {
+            "items": items,
+            "total": len(listing.entries),
+            "has_more": has_more,
+            "next_after": items[-1]["term"] if has_more and items else None
+        }
+
+    def buckets(self, db: Session) -> List[Dict[str, Any]]:
+        """점프 바용 버킷 목록 (용어가 있는 버킷만, A~Z → ㄱ~ㅎ → 0-9 → # 순)"""
+        snapshot = self.snapshot(db)
+        return [
+            {"bucket": bucket, "count": len(snapshot.buckets[bucket].entries), "first": snapshot.buckets[bucket].entries[0]["term"]}
+            for bucket in BUCKET_ORDER
+            if bucket in snapshot.buckets
+        ]
+
+
+# 전역 인스턴스
+glossary_index = GlossaryIndex()
@@ -0,0 +1,366 @@
+"""
+백업/복원/대량 정리 같은 오래 걸리는 작업을 요청 밖에서 실행하는 작업 실행기
+
+작업 상태는 메모리 레지스트리에 보관하고, 상태가 바뀔 때마다
+background_jobs 테이블에 저장하여 다른 워커나 재시작 후에도 조회할 수 있습니다.
+submit(..., cleanup=fn)으로 넘긴 정리 함수는 작업이 성공/실패/취소(대기 중 취소 포함) 중
+어떻게 끝나든 한 번 호출됩니다.
+
+각 작업 행에는 실행 중인 프로세스(owner)와 heartbeat_at을 기록하고, start()로 띄운 감시 스레드가
+JOB_HEARTBEAT_INTERVAL마다 이 프로세스의 진행 중 작업 heartbeat를 갱신합니다. 같은 스레드가
+heartbeat가 JOB_HEARTBEAT_TIMEOUT보다 오래된 다른 프로세스의 대기/실행 중 작업을 실패로 표시하므로,
+배포 중인 이전 인스턴스나 다른 워커가 아직 실행 중인 작업은 건드리지 않습니다.
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import func, or_
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+# 진행률은 너무 자주 DB에 쓰지 않도록 최소 간격을 둠 (초)
+JOB_PROGRESS_PERSIST_INTERVAL = float(os.getenv("JOB_PROGRESS_PERSIST_INTERVAL", "1.0"))
+# heartbeat 갱신 간격과, 이보다 오래 갱신되지 않은 작업을 중단된 것으로 보는 기준 (초)
+JOB_HEARTBEAT_INTERVAL = float(os.getenv("JOB_HEARTBEAT_INTERVAL", "15"))
+JOB_HEARTBEAT_TIMEOUT = float(os.getenv("JOB_HEARTBEAT_TIMEOUT", "120"))
+
+FINISHED_STATUSES = ("succeeded", "failed", "cancelled")
+ACTIVE_STATUSES = ("queued", "running")
+
+logger = logging.getLogger(__name__)
+
+
+class JobCancelled(Exception):
+    """작업 취소 요청이 들어왔을 때 작업 함수 안에서 발생하는 예외"""
+
+
+class Job:
+    """실행 중인 작업 한 건의 상태"""
+
+    def __init__(self, job_type: str, created_by: Optional[int] = None, created_by_username: Optional[str] = None,
+                 cleanup: Optional[Callable[[], None]] = None):
+        self.id = uuid.uuid4().hex
+        self.job_type = job_type
+        self.status = "queued"
+        self.progress = 0
+        self.message = None
+        self.result = None
+        self.error = None
+        self.created_by = created_by
+        self.created_by_username = created_by_username
+        self.created_at = datetime.now(timezone.utc)
+        self.started_at = None
+        self.finished_at = None
+        # 다운로드 파일 등 API로 노출하지 않는 산출물 경로
+        self.artifact_path = None
+
+        self._cancel_event = threading.Event()
+        self._cleanup = cleanup
+        self._future = None
+        self._last_persist = 0.0
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self) -> None:
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+
+    def update(self, progress: Optional[float] = None, message: Optional[str] = None) -> None:
+        """진행 상황을 갱신하고, 취소 요청이 있으면 JobCancelled를 발생시킵니다."""
+        if progress is not None:
+            self.progress = max(0, min(100, int(progress)))
+        if message is not None:
+            self.message = message
+        self.check_cancelled()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "job_type": self.job_type,
+            "status": self.status,
+            "progress": self.progress,
+            "message": self.message,
+            "result": self.result,
+            "error": self.error,
+            "cancel_requested": self.cancel_requested,
+            "created_by": self.created_by_username,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class JobRunner:
+    """작업 레지스트리 + 워커 풀"""
+
+    def __init__(self, max_workers: int = JOB_WORKERS, max_jobs_in_memory: int = 200):
+        self.max_workers = max_workers
+        self.max_jobs_in_memory = max_jobs_in_memory
+        self._executor = None
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        # 같은 호스트에서 pid가 재사용되어도 구분되도록 부팅마다 임의 값을 붙임
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._monitor: Optional[threading.Thread] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job-worker")
+            return self._executor
+
+    def submit(
+        self,
+        job_type: str,
+        func: Callable[..., Optional[Dict[str, Any]]],
+        *args,
+        created_by: Optional[int] = None,
+        created_by_username: Optional[str] = None,
+        cleanup: Optional[Callable[[], None]] = None,
+        **kwargs
+    ) -> Job:
+        """
+        작업을 큐에 넣고 바로 반환합니다.
+        func(job, *args, **kwargs)의 반환값(dict)이 작업 결과가 됩니다.
+        cleanup은 작업이 끝나면(대기 중 취소되어 func가 실행되지 않은 경우 포함) 항상 호출됩니다.
+        """
+        job = Job(job_type, created_by=created_by, created_by_username=created_by_username, cleanup=cleanup)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._evict_finished()
+        self._persist(job, force=True)
+        job._future = self._get_executor().submit(self._run, job, func, args, kwargs)
+        return job
+
+    def _run(self, job: Job, func, args, kwargs) -> None:
+        if job.cancel_requested:
+            self._finish(job, "cancelled")
+            return
+
+        job.status = "running"
+        job.started_at = datetime.now(timezone.utc)
+        self._persist(job, force=True)
+
+        try:
+            job.result = func(job, *args, **kwargs)
+            job.progress = 100
+            self._finish(job, "succeeded")
+        except JobCancelled:
+            self._finish(job, "cancelled")
+        except Exception as e:
+            job.error = str(e)
+            self._finish(job, "failed")
+
+    def _finish(self, job: Job, status: str) -> None:
+        job.status = status
+        job.finished_at = datetime.now(timezone.utc)
+        self._persist(job, force=True)
+        self._run_cleanup(job)
+
+    def _run_cleanup(self, job: Job) -> None:
+        with self._lock:
+            cleanup, job._cleanup = job._cleanup, None
+        if cleanup is None:
+            return
+        try:
+            cleanup()
+        except Exception:
+            logger.exception("작업 정리 실패 (%s)", job.id)
+
+    def report(self, job: Job, progress: Optional[float] = None, message: Optional[str] = None) -> None:
+        """작업 함수에서 진행률을 보고할 때 사용합니다. (취소 시 JobCancelled)"""
+        job.update(progress, message)
+        self._persist(job)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job.to_dict()
+        return self._load(job_id)
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def get_artifact(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """성공한 작업의 산출물 경로와 결과를 DB에서 찾습니다. (어느 워커에서 실행했든, 재시작 후에도)"""
+        from ..database import SessionLocal
+        from ..models import BackgroundJob
+
+        db = SessionLocal()
+        try:
+            row = db.query(BackgroundJob.status, BackgroundJob.artifact_path, BackgroundJob.result) \
+                .filter(BackgroundJob.id == job_id).first()
+            if row is None or row.status != "succeeded" or not row.artifact_path:
+                return None
+            return {"path": row.artifact_path, "result": json.loads(row.result) if row.result else {}}
+        finally:
+            db.close()
+
+    def start(self) -> None:
+        """heartbeat 갱신 + 중단된 작업 정리 스레드를 시작합니다. (서버 시작 시 한 번, 여러 번 불러도 하나만 실행)"""
+        with self._lock:
+            if self._monitor is not None:
+                return
+            self._monitor = threading.Thread(target=self._monitor_loop, name="job-heartbeat", daemon=True)
+        self._monitor.start()
+
+    def _monitor_loop(self) -> None:
+        while True:
+            self.heartbeat()
+            self.mark_interrupted()
+            time.sleep(JOB_HEARTBEAT_INTERVAL)
+
+    def heartbeat(self) -> None:
+        """이 프로세스에서 대기/실행 중인 작업의 heartbeat_at을 갱신합니다."""
+        job_ids = [job.id for job in list(self._jobs.values()) if job.status in ACTIVE_STATUSES]
+        if not job_ids:
+            return
+
+        from ..database import SessionLocal
+        from ..models import BackgroundJob
+
+        db = SessionLocal()
+        try:
+            db.query(BackgroundJob) \
+                .filter(BackgroundJob.id.in_(job_ids), BackgroundJob.owner == self.owner) \
+                .update({BackgroundJob.heartbeat_at: datetime.now(timezone.utc)}, synchronize_session=False)
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("작업 heartbeat 갱신 실패")
+        finally:
+            db.close()
+
+    def mark_interrupted(self) -> int:
+        """
+        다른 프로세스 소유의 대기/실행 중 작업 중 heartbeat가 JOB_HEARTBEAT_TIMEOUT보다 오래된 것을 실패로 표시합니다.
+        (heartbeat가 없는 예전 행은 시작/생성 시각으로 판단)
+        """
+        from ..database import SessionLocal
+        from ..models import BackgroundJob
+
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(seconds=JOB_HEARTBEAT_TIMEOUT)
+        db = SessionLocal()
+        try:
+            count = db.query(BackgroundJob) \
+                .filter(
+                    BackgroundJob.status.in_(ACTIVE_STATUSES),
+                    or_(BackgroundJob.owner.is_(None), BackgroundJob.owner != self.owner),
+                    func.coalesce(BackgroundJob.heartbeat_at, BackgroundJob.started_at, BackgroundJob.created_at) < cutoff
+                ) \
+                .update({
+                    BackgroundJob.status: "failed",
+                    BackgroundJob.error: "Interrupted: worker stopped reporting",
+                    BackgroundJob.finished_at: now
+                }, synchronize_session=False)
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("중단된 작업 정리 실패")
+            return 0
+        finally:
+            db.close()
+        if count:
+            logger.warning("heartbeat가 끊긴 작업 %d건을 실패로 표시했습니다.", count)
+        return count
+
+    def list(self, limit: int = 50) -> List[Dict[str, Any]]:
+        jobs = sorted(self._jobs.values(), key=lambda j: j.created_at, reverse=True)
+        return [job.to_dict() for job in jobs[:limit]]
+
+    def cancel(self, job_id: str) -> bool:
+        """취소를 요청합니다. 대기 중이면 바로 취소되고, 실행 중이면 다음 진행 보고 때 중단됩니다."""
+        job = self._jobs.get(job_id)
+        if job is None or job.status in FINISHED_STATUSES:
+            return False
+        job._cancel_event.set()
+        if job._future is not None and job._future.cancel():
+            self._finish(job, "cancelled")
+        return True
+
+    def _evict_finished(self) -> None:
+        """메모리에 남는 완료 작업 수를 제한합니다. (DB에는 계속 남음)"""
+        if len(self._jobs) <= self.max_jobs_in_memory:
+            return
+        finished = sorted(
+            (j for j in self._jobs.values() if j.status in FINISHED_STATUSES),
+            key=lambda j: j.created_at
+        )
+        for job in finished[:len(self._jobs) - self.max_jobs_in_memory]:
+            del self._jobs[job.id]
+
+    def _persist(self, job: Job, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - job._last_persist < JOB_PROGRESS_PERSIST_INTERVAL:
+            return
+        job._last_persist = now
+
+        from ..database import SessionLocal
+        from ..models import BackgroundJob
+
+        db = SessionLocal()
+        try:
+            row = db.query(BackgroundJob).filter(BackgroundJob.id == job.id).first()
+            if row is None:
+                row = BackgroundJob(id=job.id, job_type=job.job_type, created_at=job.created_at)
+                db.add(row)
+            row.status = job.status
+            row.progress = job.progress
+            row.message = job.message
+            row.result = json.dumps(job.result, ensure_ascii=False, default=str) if job.result is not None else None
+            row.error = job.error
+            row.artifact_path = job.artifact_path
+            row.owner = self.owner
+            row.heartbeat_at = datetime.now(timezone.utc)
+            row.created_by = job.created_by
+            row.created_by_username = job.created_by_username
+            row.started_at = job.started_at
+            row.finished_at = job.finished_at
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("작업 상태 저장 실패 (%s)", job.id)
+        finally:
+            db.close()
+
+    def _load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """메모리에 없는 작업은 DB에서 조회합니다. (다른 워커 또는 재시작 이전 작업)"""
+        from ..database import SessionLocal
+        from ..models import BackgroundJob
+
+        db = SessionLocal()
+        try:
+            row = db.query(BackgroundJob).filter(BackgroundJob.id == job_id).first()
+            if row is None:
+                return None
+            return {
+                "id": row.id,
+                "job_type": row.job_type,
+                "status": row.status,
+                "progress": row.progress,
+                "message": row.message,
+                "result": json.loads(row.result) if row.result else None,
+                "error": row.error,
+                "cancel_requested": False,
+                "created_by": row.created_by_username,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+                "started_at": row.started_at.isoformat() if row.started_at else None,
+                "finished_at": row.finished_at.isoformat() if row.finished_at else None,
+            }
+        finally:
+            db.close()
+
+
+# 전역 인스턴스
+job_runner = JobRunner()
@@ -0,0 +1,26 @@
+"""
+orjson 기반 JSON 응답
+
+FastAPI 기본 JSONResponse(표준 json 모듈)보다 직렬화가 훨씬 빠릅니다.
+앱의 default_response_class로 사용하고, 미리 인코딩해 둔 바이트를 그대로 보낼 때는 dumps()로 만든
+값을 Response(content=..., media_type="application/json")에 담아 반환합니다.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+# 정수 키 딕셔너리도 표준 json과 같이 문자열 키로 직렬화
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 JSONResponse"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
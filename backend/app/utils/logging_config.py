@@ -0,0 +1,123 @@
+"""
+로깅 설정
+
+각 모듈은 logger = logging.getLogger(__name__) 로 로거를 만들고, 메시지는 지연 포맷으로 남깁니다.
+    logger.debug("date=%s items=%d", date, count)          # 레벨이 꺼져 있으면 문자열을 만들지 않음
+    if logger.isEnabledFor(logging.DEBUG):                  # 인자 계산 자체가 비싼 경우
+        logger.debug("payload=%s", expensive_dump())
+
+환경 변수
+- LOG_LEVEL: 루트 레벨 (기본 INFO)
+- LOG_LEVELS: 모듈별 레벨, 예) "app.api.ai_info=DEBUG,sqlalchemy.engine=WARNING"
+- LOG_FORMAT: text(기본) 또는 json (한 줄에 JSON 객체 하나, extra로 넘긴 필드 포함)
+- LOG_ASYNC: true(기본)이면 QueueHandler로 큐에 넣고 별도 스레드(QueueListener)가 stdout에 씀
+
+요청 스레드에서는 큐에 레코드를 넣기만 하므로 stdout 쓰기가 응답 시간에 포함되지 않습니다.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+from typing import Dict, Optional
+
+import orjson
+
+from .json_response import ORJSON_OPTIONS
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+LOG_ASYNC = _env_bool("LOG_ASYNC", True)
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+# LogRecord 기본 속성 (JSON 포맷에서 extra 필드를 구분하는 데 사용)
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+
+class JSONFormatter(logging.Formatter):
+    """레코드 하나를 JSON 한 줄로 출력합니다. logger.info("...", extra={"date": date}) 의 필드도 포함"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload, default=str, option=ORJSON_OPTIONS).decode()
+
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    """ "모듈=레벨,모듈=레벨" 형식을 {모듈: 레벨} 로 바꿉니다. 잘못된 항목은 무시"""
+    levels = {}
+    for part in spec.split(","):
+        name, sep, level = part.partition("=")
+        name, level = name.strip(), level.strip().upper()
+        if not sep or not name:
+            continue
+        value = logging.getLevelName(level)
+        if isinstance(value, int):
+            levels[name] = value
+    return levels
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_logging() -> None:
+    """루트 로거 핸들러를 설정합니다. 여러 번 호출해도 한 번만 적용됩니다."""
+    global _listener
+    root = logging.getLogger()
+    if getattr(root, "_app_logging_configured", False):
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JSONFormatter() if LOG_FORMAT == "json" else logging.Formatter(TEXT_FORMAT))
+
+    if LOG_ASYNC:
+        log_queue: queue.Queue = queue.Queue(LOG_QUEUE_SIZE)
+        handler: logging.Handler = _DroppingQueueHandler(log_queue)
+        _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+    else:
+        handler = stream_handler
+
+    # 다른 곳에서 basicConfig 등으로 붙인 핸들러는 교체
+    root.handlers[:] = [handler]
+    root.setLevel(LOG_LEVEL if isinstance(logging.getLevelName(LOG_LEVEL), int) else logging.INFO)
+    for name, level in parse_levels(LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(level)
+
+    root._app_logging_configured = True
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 요청 스레드를 막지 않고 레코드를 버립니다."""
+
+    dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _DroppingQueueHandler.dropped += 1
@@ -0,0 +1,256 @@
+"""
+요청 계측과 Prometheus 텍스트 포맷 내보내기
+
+미들웨어가 라우트(경로 템플릿)별로 처리 시간 히스토그램, 처리 중인 요청 수, 상태 코드별 횟수,
+요청당 DB 쿼리 수를 집계하고 /metrics 에서 Prometheus 텍스트 포맷으로 내보냅니다.
+DB 쿼리 수는 SQLAlchemy before_cursor_execute / after_cursor_execute 이벤트로 셉니다.
+"""
+
+import hmac
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+# 설정하면 /metrics 요청에 "Authorization: Bearer <토큰>"이 필요
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestStats:
+    """요청 하나 동안 실행된 DB 쿼리 집계"""
+
+    __slots__ = ("queries", "query_seconds", "_started")
+
+    def __init__(self):
+        self.queries = 0
+        self.query_seconds = 0.0
+        self._started: List[float] = []
+
+
+# 현재 요청의 RequestStats (요청 밖에서 실행된 쿼리는 집계하지 않음)
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        # 누적 분포는 출력할 때 계산하고, 여기서는 해당 구간만 증가시킴
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """HTTP 요청과 DB 쿼리 지표 저장소"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests: Dict[Tuple[str, str, int], int] = {}
+            self.latency: Dict[Tuple[str, str], _Histogram] = {}
+            self.query_counts: Dict[Tuple[str, str], _Histogram] = {}
+            self.in_progress: Dict[str, int] = {}
+            self.db_queries_total = 0
+            self.db_query_seconds_total = 0.0
+            self.started_at = time.time()
+
+    def request_started(self, method: str) -> None:
+        # 라우트는 처리가 끝나야 알 수 있으므로 진행 중 요청은 메서드 기준으로 셈
+        with self._lock:
+            self.in_progress[method] = self.in_progress.get(method, 0) + 1
+
+    def request_finished(self, method: str, route: str, status_code: int, seconds: float, stats: RequestStats) -> None:
+        with self._lock:
+            self.in_progress[method] = self.in_progress.get(method, 1) - 1
+
+            request_key = (method, route, status_code)
+            self.requests[request_key] = self.requests.get(request_key, 0) + 1
+
+            route_key = (method, route)
+            latency = self.latency.get(route_key)
+            if latency is None:
+                latency = self.latency[route_key] = _Histogram(LATENCY_BUCKETS)
+            latency.observe(seconds)
+
+            query_count = self.query_counts.get(route_key)
+            if query_count is None:
+                query_count = self.query_counts[route_key] = _Histogram(QUERY_COUNT_BUCKETS)
+            query_count.observe(stats.queries)
+
+            self.db_queries_total += stats.queries
+            self.db_query_seconds_total += stats.query_seconds
+
+    def render(self, extra: Optional[Dict[str, Tuple[str, str, float]]] = None) -> str:
+        """Prometheus 텍스트 포맷 문자열을 만듭니다."""
+        lines: List[str] = []
+        with self._lock:
+            lines.append("# HELP http_requests_total Total HTTP requests by route and status code.")
+            lines.append("# TYPE http_requests_total counter")
+            for (method, route, status_code), value in sorted(self.requests.items()):
+                lines.append(f'http_requests_total{{method="{method}",route="{_escape(route)}",status="{status_code}"}} {value}')
+
+            lines.append("# HELP http_requests_in_progress HTTP requests currently being processed.")
+            lines.append("# TYPE http_requests_in_progress gauge")
+            for method, value in sorted(self.in_progress.items()):
+                lines.append(f'http_requests_in_progress{{method="{method}"}} {value}')
+
+            _render_histograms(
+                lines, "http_request_duration_seconds",
+                "HTTP request latency in seconds by route.", self.latency
+            )
+            _render_histograms(
+                lines, "http_request_db_queries",
+                "Number of DB queries executed per HTTP request by route.", self.query_counts
+            )
+
+            lines.append("# HELP db_queries_total DB queries executed while handling HTTP requests.")
+            lines.append("# TYPE db_queries_total counter")
+            lines.append(f"db_queries_total {self.db_queries_total}")
+            lines.append("# HELP db_query_duration_seconds_total Time spent executing DB queries during HTTP requests.")
+            lines.append("# TYPE db_query_duration_seconds_total counter")
+            lines.append(f"db_query_duration_seconds_total {_format(self.db_query_seconds_total)}")
+            lines.append("# HELP process_start_time_seconds Start time of the metrics registry since unix epoch.")
+            lines.append("# TYPE process_start_time_seconds gauge")
+            lines.append(f"process_start_time_seconds {_format(self.started_at)}")
+
+        # 다른 모듈에서 수집한 값: {이름: (타입, 설명, 값)}
+        for name, (metric_type, help_text, value) in sorted((extra or {}).items()):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(f"{name} {_format(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _render_histograms(lines: List[str], name: str, help_text: str, histograms: Dict[Tuple[str, str], _Histogram]) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for (method, route), histogram in sorted(histograms.items()):
+        labels = f'method="{method}",route="{_escape(route)}"'
+        cumulative = 0
+        for bound, count in zip(histogram.buckets, histogram.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{_format(bound)}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+        lines.append(f"{name}_sum{{{labels}}} {_format(histogram.sum)}")
+        lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# SQLAlchemy 이벤트: 모든 엔진(읽기 복제본, 비동기 엔진의 sync_engine 포함)에 적용
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats._started.append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_request_stats.get()
+    if stats is not None and stats._started:
+        stats.queries += 1
+        stats.query_seconds += time.perf_counter() - stats._started.pop()
+
+
+def route_label(request) -> str:
+    """매칭된 라우트의 경로 템플릿 (/api/ai-info/{date} 등). 매칭되지 않은 경로는 하나로 묶음"""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+async def metrics_middleware(request, call_next):
+    """요청별 처리 시간, 상태 코드, DB 쿼리 수를 기록하는 미들웨어"""
+    stats = RequestStats()
+    token = current_request_stats.set(stats)
+    method = request.method
+    metrics_registry.request_started(method)
+    start = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        metrics_registry.request_finished(method, route_label(request), status_code, time.perf_counter() - start, stats)
+        current_request_stats.reset(token)
+
+
+def collect_runtime_metrics() -> Dict[str, Tuple[str, str, float]]:
+    """커넥션 풀과 bcrypt 실행기 상태를 모읍니다."""
+    from ..database import engine, read_engine, read_pool_metrics
+    from .password_hasher import password_hasher
+    from .pool_metrics import pool_metrics
+
+    collected: Dict[str, Tuple[str, str, float]] = {}
+
+    def add_pool(prefix: str, snapshot: Dict[str, Any]) -> None:
+        for key in ("size", "checked_in", "checked_out", "overflow"):
+            if key in snapshot:
+                collected[f"{prefix}_{key}"] = ("gauge", f"Connection pool {key.replace('_', ' ')}.", snapshot[key])
+        collected[f"{prefix}_checkouts_total"] = ("counter", "Connection pool checkouts.", snapshot["checkouts"])
+        collected[f"{prefix}_wait_seconds_total"] = ("counter", "Time spent waiting for a pooled connection.", snapshot["wait"]["total_seconds"])
+        collected[f"{prefix}_timeouts_total"] = ("counter", "Connection pool checkout timeouts.", snapshot["wait"]["timeouts"])
+
+    add_pool("db_pool", pool_metrics.snapshot(engine))
+    if read_engine is not engine:
+        add_pool("db_read_pool", read_pool_metrics.snapshot(read_engine))
+
+    hasher = password_hasher.stats()
+    collected["password_hash_pending"] = ("gauge", "bcrypt operations waiting or running.", hasher["pending"])
+    collected["password_hash_rejected_total"] = ("counter", "bcrypt operations rejected because the queue was full.", hasher["rejected"])
+    collected["password_hash_seconds_total"] = ("counter", "Time spent in bcrypt.", hasher["hash_seconds_total"])
+    return collected
+
+
+def render_metrics() -> str:
+    return metrics_registry.render(collect_runtime_metrics())
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """GET /metrics 핸들러 (METRICS_TOKEN이 설정된 경우 Bearer 토큰 확인)"""
+    if METRICS_TOKEN:
+        authorization = request.headers.get("authorization", "")
+        if not hmac.compare_digest(authorization, f"Bearer {METRICS_TOKEN}"):
+            return PlainTextResponse("Unauthorized\n", status_code=401)
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+# 전역 인스턴스
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,137 @@
+"""
+bcrypt 해싱/검증 전용 실행기
+
+bcrypt는 호출 한 번에 수백 ms의 CPU를 사용하므로, 일반 요청이 쓰는 스레드 풀과 분리된
+작은 전용 스레드 풀에서 실행합니다. 대기 중인 작업 수에 상한을 두어 로그인 폭주 시
+다른 API가 굶지 않도록 하고, 큐 대기 시간과 해싱 시간을 집계합니다.
+async 핸들러는 hash_async/verify_async를 await 하면 결과를 기다리는 동안 스레드를 잡지 않습니다.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+import bcrypt
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "8"))
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+
+class PasswordHasherBusy(Exception):
+    """대기 중인 해싱 작업이 상한에 도달했을 때 발생하는 예외"""
+
+
+class PasswordHasher:
+    """동시 실행 수와 대기열 길이가 제한된 bcrypt 실행기"""
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_pending: int = PASSWORD_HASH_MAX_PENDING, rounds: int = BCRYPT_ROUNDS):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.rounds = rounds
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+
+        self.pending = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_seconds_total = 0.0
+        self.queue_seconds_max = 0.0
+        self.run_seconds_total = 0.0
+        self.run_seconds_max = 0.0
+
+    def _submit(self, func: Callable[..., Any], args: tuple) -> Future:
+        """대기열 자리를 잡고 전용 스레드에 작업을 넣습니다. 자리는 작업이 끝나거나 취소되면 반납됩니다."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHasherBusy("Password hashing queue is full")
+
+        enqueued_at = time.perf_counter()
+        with self._lock:
+            self.pending += 1
+            self.submitted += 1
+
+        def task():
+            started_at = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                finished_at = time.perf_counter()
+                self._record(started_at - enqueued_at, finished_at - started_at)
+
+        try:
+            future = self._executor.submit(task)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def _release(self) -> None:
+        with self._lock:
+            self.pending -= 1
+        self._slots.release()
+
+    def _run(self, func: Callable[..., Any], args: tuple) -> Any:
+        """호출한 스레드는 결과를 기다리고, 실제 bcrypt 연산은 전용 스레드에서 실행됩니다."""
+        return self._submit(func, args).result()
+
+    async def _run_async(self, func: Callable[..., Any], args: tuple) -> Any:
+        """이벤트 루프에서 결과를 await 합니다. (요청 스레드 풀을 쓰지 않음)"""
+        return await asyncio.wrap_future(self._submit(func, args))
+
+    def _record(self, queue_seconds: float, run_seconds: float) -> None:
+        with self._lock:
+            self.completed += 1
+            self.queue_seconds_total += queue_seconds
+            self.run_seconds_total += run_seconds
+            self.queue_seconds_max = max(self.queue_seconds_max, queue_seconds)
+            self.run_seconds_max = max(self.run_seconds_max, run_seconds)
+
+    def _hash(self, password: str) -> str:
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=self.rounds)).decode('utf-8')
+
+    @staticmethod
+    def _verify(plain_password: str, hashed_password: str) -> bool:
+        return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+    def hash(self, password: str) -> str:
+        return self._run(self._hash, (password,))
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._run(self._verify, (plain_password, hashed_password))
+
+    async def hash_async(self, password: str) -> str:
+        return await self._run_async(self._hash, (password,))
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run_async(self._verify, (plain_password, hashed_password))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            completed = self.completed
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "bcrypt_rounds": self.rounds,
+                "pending": self.pending,
+                "submitted": self.submitted,
+                "completed": completed,
+                "rejected": self.rejected,
+                "queue_seconds_avg": round(self.queue_seconds_total / completed, 6) if completed else 0.0,
+                "queue_seconds_max": round(self.queue_seconds_max, 6),
+                "queue_seconds_total": round(self.queue_seconds_total, 6),
+                "hash_seconds_avg": round(self.run_seconds_total / completed, 6) if completed else 0.0,
+                "hash_seconds_max": round(self.run_seconds_max, 6),
+                "hash_seconds_total": round(self.run_seconds_total, 6)
+            }
+
+
+# 전역 인스턴스
+password_hasher = PasswordHasher()
@@ -0,0 +1,62 @@
+"""
+인코딩된 응답 캐시
+
+큰 목록 응답을 (콘텐츠 종류, 버전, 파라미터)별로 JSON 바이트로 한 번만 만들어 두고,
+같은 버전 동안에는 DB 조회와 직렬화 없이 그대로 돌려줍니다.
+"""
+
+import os
+from typing import Any, Callable, Hashable
+
+from fastapi import Request, Response
+from sqlalchemy.orm import Session
+
+from .cache import TTLCache
+from .content_version import get_content_version
+from .etag import CACHE_CONTROL, content_etag, etag_matches, not_modified_response
+from .json_response import dumps
+
+PAYLOAD_CACHE_TTL = float(os.getenv("PAYLOAD_CACHE_TTL_SECONDS", "3600"))
+PAYLOAD_CACHE_MAX_ENTRIES = int(os.getenv("PAYLOAD_CACHE_MAX_ENTRIES", "64"))
+
+
+class PayloadCache:
+    """콘텐츠 버전을 키에 포함하는 JSON 바이트 캐시"""
+
+    def __init__(self, ttl: float = PAYLOAD_CACHE_TTL, maxsize: int = PAYLOAD_CACHE_MAX_ENTRIES):
+        self._cache = TTLCache(ttl=ttl, maxsize=maxsize)
+
+    def get_or_build(self, name: str, version: int, params: Hashable, builder: Callable[[], Any]) -> bytes:
+        key = (name, version, params)
+        body = self._cache.get(key)
+        if body is None:
+            body = dumps(builder())
+            self._cache.set(key, body)
+        return body
+
+    def response(self, request: Request, db: Session, name: str, params: Hashable, builder: Callable[[], Any]) -> Response:
+        """
+        캐시된 바이트로 응답을 만듭니다. 없으면 builder()의 결과를 인코딩해서 저장합니다.
+        클라이언트의 If-None-Match가 현재 버전과 같으면 본문 없이 304를 반환합니다.
+        """
+        version = get_content_version(db, name)
+        etag = content_etag(name, version)
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        
+        body = self.get_or_build(name, version, params, builder)
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        )
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+# 전역 인스턴스
+payload_cache = PayloadCache()
@@ -0,0 +1,116 @@
+"""
+DB 커넥션 풀 계측
+
+체크아웃/체크인/신규 연결/무효화 횟수와 풀에서 커넥션을 얻기까지 기다린 시간을 집계합니다.
+"""
+
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """커넥션 풀 이벤트 카운터"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.soft_invalidations = 0
+            self.wait_count = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+            self.timeouts = 0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_count += 1
+            self.wait_seconds_total += seconds
+            if seconds > self.wait_seconds_max:
+                self.wait_seconds_max = seconds
+            if timed_out:
+                self.timeouts += 1
+
+    def _incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def attach(self, engine) -> None:
+        """엔진의 풀 이벤트에 카운터를 연결합니다."""
+        pool = engine.pool
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.metrics = self
+
+        event.listen(pool, "checkout", lambda *args: self._incr("checkouts"))
+        event.listen(pool, "checkin", lambda *args: self._incr("checkins"))
+        event.listen(pool, "connect", lambda *args: self._incr("connects"))
+        event.listen(pool, "invalidate", lambda *args: self._incr("invalidations"))
+        event.listen(pool, "soft_invalidate", lambda *args: self._incr("soft_invalidations"))
+
+    def snapshot(self, engine) -> Dict[str, Any]:
+        """현재 카운터와 풀 상태를 딕셔너리로 반환합니다."""
+        pool = engine.pool
+        with self._lock:
+            data = {
+                "pool_class": type(pool).__name__,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "soft_invalidations": self.soft_invalidations,
+                "wait": {
+                    "count": self.wait_count,
+                    "total_seconds": round(self.wait_seconds_total, 6),
+                    "avg_seconds": round(self.wait_seconds_total / self.wait_count, 6) if self.wait_count else 0.0,
+                    "max_seconds": round(self.wait_seconds_max, 6),
+                    "timeouts": self.timeouts
+                }
+            }
+
+        if isinstance(pool, QueuePool):
+            data.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "max_overflow": pool._max_overflow,
+                "timeout": pool.timeout()
+            })
+        return data
+
+
+class InstrumentedQueuePool(QueuePool):
+    """커넥션을 얻을 때까지 걸린 시간을 PoolMetrics에 기록하는 QueuePool"""
+
+    metrics = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - start)
+        return conn
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+# 전역 인스턴스
+pool_metrics = PoolMetrics()
@@ -0,0 +1,244 @@
+"""
+느린 요청용 샘플링 프로파일러 (선택 기능)
+
+PROFILING_ENABLED=true 일 때만 동작합니다. 요청을 처리하는 동안 핸들러가 실행되는 스레드의 스택을
+PROFILING_INTERVAL_MS 간격으로 sys._current_frames()에서 샘플링하고, 요청이
+PROFILING_THRESHOLD_MS 보다 오래 걸렸거나 관리자 헤더(X-Profile-Token: <PROFILING_ADMIN_TOKEN>)가
+있으면 가장 많이 잡힌 함수 상위 PROFILING_TOP_N 개를 링 버퍼에 저장합니다.
+저장된 결과는 /api/system/profiles 에서 조회합니다.
+
+핸들러 스레드는 라우트의 endpoint 호출을 감싸서 등록합니다. 동기 핸들러는 스레드 풀의 작업 스레드,
+async 핸들러는 이벤트 루프 스레드가 샘플링 대상이므로 async 핸들러의 결과에는 같은 시간에 처리 중이던
+다른 요청의 프레임이 섞일 수 있습니다.
+"""
+
+import functools
+import hmac
+import inspect
+import itertools
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+PROFILING_ENABLED = _env_bool("PROFILING_ENABLED", False)
+PROFILING_THRESHOLD_MS = float(os.getenv("PROFILING_THRESHOLD_MS", "1000"))
+PROFILING_INTERVAL_MS = float(os.getenv("PROFILING_INTERVAL_MS", "5"))
+PROFILING_TOP_N = int(os.getenv("PROFILING_TOP_N", "25"))
+PROFILING_BUFFER_SIZE = int(os.getenv("PROFILING_BUFFER_SIZE", "50"))
+PROFILING_ADMIN_TOKEN = os.getenv("PROFILING_ADMIN_TOKEN")
+PROFILE_HEADER = "x-profile-token"
+
+logger = logging.getLogger(__name__)
+
+FrameKey = Tuple[str, int, str]
+
+
+class RequestProfile:
+    """요청 하나에 대한 샘플 집계"""
+
+    __slots__ = ("threads", "samples", "self_counts", "total_counts")
+
+    def __init__(self):
+        self.threads: Set[int] = set()
+        self.samples = 0
+        self.self_counts: Counter = Counter()
+        self.total_counts: Counter = Counter()
+
+
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("current_profile", default=None)
+
+
+class SamplingProfiler:
+    """활성 요청의 스레드 스택을 주기적으로 샘플링하고 느린 요청의 결과를 보관합니다."""
+
+    def __init__(self, interval_ms: float = PROFILING_INTERVAL_MS, top_n: int = PROFILING_TOP_N, buffer_size: int = PROFILING_BUFFER_SIZE):
+        self.interval = interval_ms / 1000.0
+        self.top_n = top_n
+        self.profiles: deque = deque(maxlen=buffer_size)
+        self._ids = itertools.count(1)
+        self._active: Dict[int, RequestProfile] = {}
+        self._lock = threading.Lock()
+        self._has_active = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def begin(self) -> RequestProfile:
+        profile = RequestProfile()
+        with self._lock:
+            self._active[id(profile)] = profile
+            self._has_active.set()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+        return profile
+
+    def end(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._active.pop(id(profile), None)
+            if not self._active:
+                self._has_active.clear()
+
+    def _run(self) -> None:
+        own_file = __file__
+        while True:
+            self._has_active.wait()
+            time.sleep(self.interval)
+
+            with self._lock:
+                active = [(profile, tuple(profile.threads)) for profile in self._active.values()]
+            if not active:
+                continue
+
+            frames = sys._current_frames()
+            for profile, threads in active:
+                for ident in threads:
+                    frame = frames.get(ident)
+                    if frame is None:
+                        continue
+                    self._sample(profile, frame, own_file)
+
+    @staticmethod
+    def _sample(profile: RequestProfile, frame, own_file: str) -> None:
+        seen = set()
+        leaf = True
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename != own_file:
+                key = (code.co_filename, code.co_firstlineno, code.co_name)
+                if leaf:
+                    profile.self_counts[key] += 1
+                    leaf = False
+                if key not in seen:
+                    seen.add(key)
+                    profile.total_counts[key] += 1
+            frame = frame.f_back
+        profile.samples += 1
+
+    def record(self, profile: RequestProfile, request, route: str, status_code: int, duration_ms: float, reason: str) -> None:
+        """요청 결과를 링 버퍼에 저장합니다."""
+        self.profiles.append({
+            "id": next(self._ids),
+            "method": request.method,
+            "path": request.url.path,
+            "route": route,
+            "status_code": status_code,
+            "duration_ms": round(duration_ms, 3),
+            "reason": reason,
+            "captured_at": time.time(),
+            "interval_ms": self.interval * 1000.0,
+            "samples": profile.samples,
+            "top_self": self._top(profile.self_counts, profile.samples),
+            "top_cumulative": self._top(profile.total_counts, profile.samples)
+        })
+
+    def _top(self, counts: Counter, samples: int) -> List[Dict[str, Any]]:
+        return [
+            {
+                "function": name,
+                "file": filename,
+                "line": lineno,
+                "samples": count,
+                "percent": round(count * 100.0 / samples, 1) if samples else 0.0
+            }
+            for (filename, lineno, name), count in counts.most_common(self.top_n)
+        ]
+
+    def list_profiles(self, limit: int = 0) -> List[Dict[str, Any]]:
+        profiles = list(self.profiles)
+        profiles.reverse()
+        return profiles[:limit] if limit else profiles
+
+    def clear(self) -> None:
+        self.profiles.clear()
+
+
+def _wrap_endpoint(func):
+    """endpoint 호출을 실행하는 스레드를 현재 요청의 프로파일에 등록합니다."""
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            profile = _current_profile.get()
+            if profile is None:
+                return await func(*args, **kwargs)
+            ident = threading.get_ident()
+            profile.threads.add(ident)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                profile.threads.discard(ident)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def sync_wrapper(*args, **kwargs):
+        profile = _current_profile.get()
+        if profile is None:
+            return func(*args, **kwargs)
+        ident = threading.get_ident()
+        profile.threads.add(ident)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.threads.discard(ident)
+    return sync_wrapper
+
+
+def _forced(request) -> bool:
+    if not PROFILING_ADMIN_TOKEN:
+        return False
+    token = request.headers.get(PROFILE_HEADER)
+    return token is not None and hmac.compare_digest(token, PROFILING_ADMIN_TOKEN)
+
+
+async def profiling_middleware(request, call_next):
+    profile = request_profiler.begin()
+    token = _current_profile.set(profile)
+    start = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        duration_ms = (time.perf_counter() - start) * 1000.0
+        _current_profile.reset(token)
+        request_profiler.end(profile)
+
+        reason = None
+        if _forced(request):
+            reason = "header"
+        elif duration_ms >= PROFILING_THRESHOLD_MS:
+            reason = "slow"
+        if reason:
+            route = getattr(request.scope.get("route"), "path", None) or request.url.path
+            request_profiler.record(profile, request, route, status_code, duration_ms, reason)
+
+
+def install_profiling(app) -> bool:
+    """PROFILING_ENABLED일 때 라우트 endpoint를 감싸고 미들웨어를 등록합니다. (라우터 등록 후 호출)"""
+    if not PROFILING_ENABLED:
+        return False
+
+    for route in app.routes:
+        dependant = getattr(route, "dependant", None)
+        if dependant is not None and dependant.call is not None:
+            dependant.call = _wrap_endpoint(dependant.call)
+
+    app.middleware("http")(profiling_middleware)
+    logger.info("요청 프로파일링 활성화: %.0fms 이상 요청 기록, 샘플 간격 %sms", PROFILING_THRESHOLD_MS, PROFILING_INTERVAL_MS)
+    return True
+
+
+# 전역 인스턴스
+request_profiler = SamplingProfiler()
@@ -0,0 +1,152 @@
+"""
+요청별 SQL 쿼리 진단 (N+1 탐지)
+
+QUERY_DIAGNOSTICS=true 로 켜면 요청마다 실행된 문장을 모양(리터럴과 IN 목록을 정규화한 SQL)별로 세고,
+같은 모양이 QUERY_REPEAT_THRESHOLD 번 이상 반복되면 N+1 의심으로 표시합니다.
+결과는 응답 헤더(X-DB-Query-Count, X-DB-Repeated-Queries)와 로그 한 줄로 알려줍니다.
+
+QUERY_BUDGET_STRICT=true 이면 QUERY_BUDGET(요청당 최대 쿼리 수)을 넘거나 반복 쿼리가 있는 요청을
+500으로 실패시킵니다. 테스트/CI 전용 설정입니다.
+
+스크립트나 테스트 코드에서는 query_budget() 컨텍스트 매니저로 같은 검사를 할 수 있습니다.
+    with query_budget(max_queries=5):
+        get_learned_terms(...)
+"""
+
+import logging
+import os
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.responses import JSONResponse
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+QUERY_DIAGNOSTICS = _env_bool("QUERY_DIAGNOSTICS", False)
+QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", "3"))
+QUERY_BUDGET = int(os.getenv("QUERY_BUDGET", "0"))  # 0이면 쿼리 수 제한 없음
+QUERY_BUDGET_STRICT = _env_bool("QUERY_BUDGET_STRICT", False)
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s|:\w+|\$\d+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+|\$\d+))*\s*\)")
+_POSTCOMPILE = re.compile(r"\(\s*\[POSTCOMPILE_\w+\]\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """리터럴과 바인드 파라미터 목록을 정규화해서 같은 모양의 문장을 하나로 묶습니다."""
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _POSTCOMPILE.sub("(?...)", shape)
+    shape = _PLACEHOLDER_LIST.sub("(?...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryBudgetExceeded(Exception):
+    """쿼리 수 예산을 넘었거나 반복 쿼리가 발견되었을 때 발생하는 예외"""
+
+
+class QueryDiagnostics:
+    """요청(또는 블록) 하나 동안의 문장 모양별 실행 횟수"""
+
+    def __init__(self, repeat_threshold: int = QUERY_REPEAT_THRESHOLD):
+        self.repeat_threshold = repeat_threshold
+        self.shapes: Counter = Counter()
+        self.total = 0
+
+    def record(self, statement: str) -> None:
+        self.total += 1
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self) -> Dict[str, int]:
+        """repeat_threshold 번 이상 실행된 문장 모양 (많이 실행된 순)"""
+        return {
+            shape: count for shape, count in self.shapes.most_common()
+            if count >= self.repeat_threshold
+        }
+
+    def violations(self, budget: int, allow_repeats: bool = False) -> List[str]:
+        problems = []
+        if budget and self.total > budget:
+            problems.append(f"{self.total} queries (budget {budget})")
+        if not allow_repeats:
+            for shape, count in self.repeated().items():
+                problems.append(f"{count}x {shape[:200]}")
+        return problems
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "queries": self.total,
+            "distinct_statements": len(self.shapes),
+            "repeated": self.repeated()
+        }
+
+
+current_query_diagnostics: ContextVar[Optional[QueryDiagnostics]] = ContextVar("current_query_diagnostics", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    diagnostics = current_query_diagnostics.get()
+    if diagnostics is not None:
+        diagnostics.record(statement)
+
+
+@contextmanager
+def query_budget(max_queries: int = 0, repeat_threshold: int = QUERY_REPEAT_THRESHOLD, allow_repeats: bool = False):
+    """블록 안에서 실행된 쿼리가 예산을 넘거나 같은 모양이 반복되면 QueryBudgetExceeded를 발생시킵니다."""
+    diagnostics = QueryDiagnostics(repeat_threshold)
+    token = current_query_diagnostics.set(diagnostics)
+    try:
+        yield diagnostics
+    finally:
+        current_query_diagnostics.reset(token)
+
+    problems = diagnostics.violations(max_queries, allow_repeats)
+    if problems:
+        raise QueryBudgetExceeded("; ".join(problems))
+
+
+async def query_diagnostics_middleware(request, call_next):
+    """QUERY_DIAGNOSTICS가 켜져 있으면 요청별 쿼리 수와 반복 쿼리를 헤더와 로그로 알립니다."""
+    if not QUERY_DIAGNOSTICS:
+        return await call_next(request)
+
+    diagnostics = QueryDiagnostics()
+    token = current_query_diagnostics.set(diagnostics)
+    try:
+        response = await call_next(request)
+    finally:
+        current_query_diagnostics.reset(token)
+
+    repeated = diagnostics.repeated()
+    if repeated or (QUERY_BUDGET and diagnostics.total > QUERY_BUDGET):
+        # 반복 쿼리 목록까지 한 레코드로 남겨 JSON 형식에서도 요청 단위로 묶이게 함
+        logger.warning("쿼리 진단: %s %s - 쿼리 %d개, 반복 %d종%s", request.method, request.url.path, diagnostics.total,
+                       len(repeated), "".join(f"\n   {count}회: {shape[:200]}" for shape, count in repeated.items()))
+
+    if QUERY_BUDGET_STRICT:
+        problems = diagnostics.violations(QUERY_BUDGET)
+        if problems:
+            response = JSONResponse(
+                status_code=500,
+                content={"error": "Query budget exceeded", "path": request.url.path, "problems": problems}
+            )
+
+    response.headers["X-DB-Query-Count"] = str(diagnostics.total)
+    response.headers["X-DB-Repeated-Queries"] = str(sum(repeated.values()))
+    return response
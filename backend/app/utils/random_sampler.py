@@ -0,0 +1,52 @@
+"""
+무작위 행 선택용 id 배열 캐시
+
+테이블 전체를 읽고 random.choice 하는 대신, 조건(key)별 id 배열을 콘텐츠 버전과 함께 메모리에 두고
+id만 뽑은 뒤 기본 키로 필요한 행만 조회합니다. 버전이 바뀌면(쓰기 발생) 다음 호출에서 id 배열을 다시 읽습니다.
+
+    sampler = RandomIdSampler("term", lambda db, key: [row[0] for row in db.query(Term.id)])
+    ids = sampler.sample(db, 5)            # 중복 없이 5개
+"""
+
+import random
+import threading
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from .content_version import get_content_version
+
+
+class RandomIdSampler:
+    """콘텐츠 버전으로 무효화되는 id 배열에서 무작위로 id를 뽑습니다."""
+
+    def __init__(self, content_name: str, load_ids: Callable[[Session, Optional[Hashable]], List[int]], rng: Optional[random.Random] = None):
+        self.content_name = content_name
+        self.load_ids = load_ids
+        self.rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._pools: Dict[Optional[Hashable], Tuple[int, List[int]]] = {}
+
+    def ids(self, db: Session, key: Optional[Hashable] = None) -> List[int]:
+        version = get_content_version(db, self.content_name)
+        cached = self._pools.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        ids = list(self.load_ids(db, key))
+        with self._lock:
+            self._pools[key] = (version, ids)
+        return ids
+
+    def sample(self, db: Session, n: int = 1, key: Optional[Hashable] = None) -> List[int]:
+        """중복 없이 최대 n개의 id를 뽑습니다. (후보가 n개보다 적으면 전부를 섞어서 반환)"""
+        ids = self.ids(db, key)
+        if not ids or n <= 0:
+            return []
+        if n == 1:
+            return [ids[self.rng.randrange(len(ids))]]
+        return self.rng.sample(ids, min(n, len(ids)))
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """DB와 배열이 어긋난 것을 발견했을 때(버전 없이 삭제된 행 등) 다시 읽도록 합니다."""
+        with self._lock:
+            self._pools.pop(key, None)
@@ -0,0 +1,243 @@
+"""
+요청 속도 제한 (sliding window counter)
+
+키(IP 또는 사용자명)마다 현재/직전 윈도우의 카운터 두 개만 저장하므로 키당 메모리가 일정하고,
+키 수가 max_keys를 넘으면 가장 오래 사용하지 않은 키부터 제거합니다. (LRU)
+저장소는 RateLimitBackend 인터페이스를 따르므로 Redis 같은 공유 저장소로 교체할 수 있습니다.
+
+제한은 라우트별 환경변수로 조정합니다. 형식은 "<요청 수>/<초>" 입니다.
+    RATE_LIMIT_LOGIN=10/60
+    RATE_LIMIT_ENABLED=false  (전체 비활성화)
+
+리버스 프록시(Railway 등) 뒤에서는 request.client.host가 프록시 주소이므로 TRUSTED_PROXIES에
+프록시 주소(IP/CIDR, 쉼표 구분)를 지정해야 X-Forwarded-For에서 실제 클라이언트 IP를 읽습니다.
+"*"는 바로 앞 프록시를 신뢰한다는 뜻으로, X-Forwarded-For의 가장 오른쪽(프록시가 붙인) 주소를 사용합니다.
+    TRUSTED_PROXIES=10.0.0.0/8,100.64.0.0/10
+"""
+
+import ipaddress
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").strip().lower() in ("1", "true", "yes", "on")
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+TRUSTED_PROXIES = os.getenv("TRUSTED_PROXIES", "")
+
+logger = logging.getLogger(__name__)
+
+
+def parse_limit(value: str) -> Tuple[int, float]:
+    """"10/60" 형식의 문자열을 (요청 수, 윈도우 초)로 변환합니다."""
+    count, _, window = value.partition("/")
+    limit = int(count)
+    seconds = float(window) if window else 60.0
+    if limit <= 0 or seconds <= 0:
+        raise ValueError(f"잘못된 속도 제한 설정: {value}")
+    return limit, seconds
+
+
+class RateLimitBackend:
+    """속도 제한 저장소 인터페이스"""
+
+    def hit(self, key: Hashable, limit: int, window: float) -> Tuple[bool, float]:
+        """
+        요청 한 건을 기록합니다.
+
+        Returns:
+            (허용 여부, 거부된 경우 다시 시도할 수 있을 때까지의 초)
+        """
+        raise NotImplementedError
+
+    def peek(self, key: Hashable, limit: int, window: float) -> Tuple[bool, float]:
+        """기록하지 않고 지금 요청하면 허용되는지만 확인합니다."""
+        raise NotImplementedError
+
+    def reset(self, key: Optional[Hashable] = None) -> None:
+        raise NotImplementedError
+
+
+class InMemorySlidingWindowBackend(RateLimitBackend):
+    """
+    프로세스 내 sliding window counter 저장소
+
+    직전 윈도우 카운트를 현재 윈도우에서 지난 비율만큼 줄여 더하는 방식으로
+    최근 window 초 동안의 요청 수를 근사합니다.
+    """
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self._clock = clock
+        # key -> [윈도우 번호, 현재 윈도우 카운트, 직전 윈도우 카운트]
+        self._entries: "OrderedDict[Hashable, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: Hashable, limit: int, window: float) -> Tuple[bool, float]:
+        now = self._clock()
+        current_window = int(now // window)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = [current_window, 0, 0]
+                self._entries[key] = entry
+                if len(self._entries) > self.max_keys:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(key)
+                if entry[0] != current_window:
+                    entry[2] = entry[1] if entry[0] == current_window - 1 else 0
+                    entry[1] = 0
+                    entry[0] = current_window
+
+            elapsed = (now - current_window * window) / window
+            previous, current = entry[2], entry[1]
+            if previous * (1.0 - elapsed) + current < limit:
+                entry[1] = current + 1
+                return True, 0.0
+
+        return False, self._retry_after(previous, current, limit, window, elapsed)
+
+    def peek(self, key: Hashable, limit: int, window: float) -> Tuple[bool, float]:
+        now = self._clock()
+        current_window = int(now // window)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return True, 0.0
+            if entry[0] == current_window:
+                previous, current = entry[2], entry[1]
+            elif entry[0] == current_window - 1:
+                previous, current = entry[1], 0
+            else:
+                return True, 0.0
+
+        elapsed = (now - current_window * window) / window
+        if previous * (1.0 - elapsed) + current < limit:
+            return True, 0.0
+        return False, self._retry_after(previous, current, limit, window, elapsed)
+
+    @staticmethod
+    def _retry_after(previous: int, current: int, limit: int, window: float, elapsed: float) -> float:
+        remaining = (1.0 - elapsed) * window
+        if current >= limit or previous == 0:
+            # 현재 윈도우만으로 한도를 채웠으면 다음 윈도우까지 기다려야 함
+            return remaining
+        # 직전 윈도우의 가중치가 (limit - current) 아래로 내려가는 시점
+        needed = 1.0 - (limit - current) / previous
+        return min(max((needed - elapsed) * window, 0.0), remaining)
+
+    def reset(self, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RateLimiter:
+    """라우트 하나에 대한 속도 제한 규칙"""
+
+    def __init__(self, name: str, default: str, backend: Optional[RateLimitBackend] = None):
+        self.name = name
+        self.limit, self.window = parse_limit(os.getenv(f"RATE_LIMIT_{name.upper()}", default))
+        self.backend = backend if backend is not None else rate_limit_backend
+
+    def check(self, key: Optional[Hashable]) -> None:
+        """요청 한 건을 기록하고, 한도를 넘으면 429 예외를 발생시킵니다."""
+        if not RATE_LIMIT_ENABLED or key is None:
+            return
+        allowed, retry_after = self.backend.hit((self.name, key), self.limit, self.window)
+        if not allowed:
+            self._reject(retry_after)
+
+    def ensure_allowed(self, key: Optional[Hashable]) -> None:
+        """기록하지 않고 이미 한도에 도달했는지만 확인합니다. (실패한 시도만 세는 경우)"""
+        if not RATE_LIMIT_ENABLED or key is None:
+            return
+        allowed, retry_after = self.backend.peek((self.name, key), self.limit, self.window)
+        if not allowed:
+            self._reject(retry_after)
+
+    def record(self, key: Optional[Hashable]) -> None:
+        """한도 초과 여부와 관계없이 한 건을 기록합니다."""
+        if not RATE_LIMIT_ENABLED or key is None:
+            return
+        self.backend.hit((self.name, key), self.limit, self.window)
+
+    @staticmethod
+    def _reject(retry_after: float) -> None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests. Please try again later.",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+        )
+
+    def by_ip(self) -> Callable[[Request], None]:
+        """클라이언트 IP 기준으로 제한하는 FastAPI 의존성을 반환합니다."""
+        # async 의존성은 스레드 풀을 거치지 않고 이벤트 루프에서 바로 실행됨
+        async def dependency(request: Request) -> None:
+            self.check(client_ip(request))
+        return dependency
+
+
+def parse_trusted_proxies(spec: str) -> Tuple[bool, Tuple[ipaddress._BaseNetwork, ...]]:
+    """TRUSTED_PROXIES 값을 (바로 앞 프록시를 무조건 신뢰하는지, 신뢰하는 네트워크 목록)으로 바꿉니다."""
+    trust_peer = False
+    networks = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if part == "*":
+            trust_peer = True
+            continue
+        try:
+            networks.append(ipaddress.ip_network(part, strict=False))
+        except ValueError:
+            logger.warning("Ignoring invalid TRUSTED_PROXIES entry: %s", part)
+    return trust_peer, tuple(networks)
+
+
+_trust_peer, _trusted_networks = parse_trusted_proxies(TRUSTED_PROXIES)
+
+
+def _is_trusted(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in _trusted_networks)
+
+
+def client_ip(request: Request) -> Optional[str]:
+    """
+    실제 클라이언트 IP.
+    연결한 쪽이 신뢰하는 프록시일 때만 X-Forwarded-For를 오른쪽부터 읽어, 신뢰하는 프록시가 아닌 첫 주소를 사용합니다.
+    (클라이언트가 직접 보낸 X-Forwarded-For 앞부분은 위조될 수 있으므로 사용하지 않음)
+    """
+    peer = request.client.host if request.client else None
+    if peer is None or not (_trust_peer or _is_trusted(peer)):
+        return peer
+    forwarded = request.headers.get("x-forwarded-for")
+    if not forwarded:
+        return peer
+    hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted(hop):
+            return hop
+    return hops[0] if hops else peer
+
+
+# 전역 인스턴스
+rate_limit_backend = InMemorySlidingWindowBackend()
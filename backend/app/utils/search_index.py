@@ -0,0 +1,265 @@
+"""
+AI 정보 전문 검색 인덱스
+
+항목(info1~3) x 언어마다 검색 문서 한 행(ai_info_search)을 두고, 제목/용어/내용을 토큰화해서 저장합니다.
+- Postgres: to_tsvector('simple', ...) 식에 GIN 인덱스를 걸고 ts_rank로 정렬 (제목 A, 용어 B, 내용 C 가중치)
+- SQLite: FTS5 가상 테이블(ai_info_search_fts, rowid = 문서 id)을 함께 유지하고 bm25로 정렬
+
+한국어/일본어/중국어는 띄어쓰기나 형태소 분석에 기대지 않고 글자 bigram으로 토큰화하므로
+"트랜스포머"는 "트랜 랜스 스포 포머"로 색인되고, 검색어도 같은 방식으로 나뉘어 모두 포함된 문서를 찾습니다.
+쓰기 핸들러는 mark_ai_info_changed()를 통해 같은 트랜잭션 안에서 해당 날짜의 문서를 다시 만듭니다.
+"""
+
+import logging
+import re
+import unicodedata
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..models import AIInfo, AIInfoSearchDocument, SEARCH_FTS_TABLE as FTS_TABLE, SEARCH_PG_VECTOR as PG_VECTOR
+from .ai_info_items import LANGUAGES, UNCATEGORIZED, item_value, iter_item_indexes, parse_terms
+from .content_version import bump_content_version, get_content_version
+
+logger = logging.getLogger(__name__)
+
+# content_versions에 두는 전체 색인 횟수 (0이면 기존 AI 정보를 아직 한 번도 전체 색인하지 않은 것)
+SEARCH_INDEX_MARKER = "search_index"
+
+# 히라가나/가타카나, CJK 통합 한자(확장 A 포함), 한글 음절, CJK 호환 한자
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_TOKEN_RE = re.compile(rf"[0-9a-z\u00c0-\u024f]+|[{_CJK}]+")
+_CJK_RE = re.compile(rf"[{_CJK}]")
+
+SNIPPET_RADIUS = 60
+
+
+def tokenize(value: Optional[str]) -> List[str]:
+    """소문자/NFKC 정규화 후 영문·숫자는 단어 단위, CJK 문자열은 글자 bigram으로 나눕니다."""
+    if not value:
+        return []
+    tokens = []
+    for match in _TOKEN_RE.finditer(unicodedata.normalize("NFKC", value).lower()):
+        run = match.group()
+        if _CJK_RE.match(run):
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def query_terms(query: str) -> List[Tuple[str, bool]]:
+    """
+    검색어를 (토큰, 접두사 검색 여부) 목록으로 바꿉니다.
+    한 글자 CJK 검색어와 마지막 영문 단어는 입력 중인 단어로 보고 접두사 검색합니다.
+    """
+    tokens = []
+    words = unicodedata.normalize("NFKC", query).lower()
+    matches = list(_TOKEN_RE.finditer(words))
+    for position, match in enumerate(matches):
+        run = match.group()
+        if _CJK_RE.match(run):
+            if len(run) == 1:
+                tokens.append((run, True))
+            else:
+                tokens.extend((run[i:i + 2], False) for i in range(len(run) - 1))
+        else:
+            tokens.append((run, position == len(matches) - 1))
+
+    # 같은 토큰은 한 번만
+    seen = set()
+    unique = []
+    for token in tokens:
+        if token not in seen:
+            seen.add(token)
+            unique.append(token)
+    return unique
+
+
+def build_documents(ai_info) -> Iterator[Dict[str, Any]]:
+    """AIInfo 한 행에서 (항목, 언어)별 검색 문서를 만듭니다."""
+    for info_index in iter_item_indexes(ai_info):
+        category = item_value(ai_info, info_index, "category") or UNCATEGORIZED
+        for language in LANGUAGES:
+            title = item_value(ai_info, info_index, "title", language)
+            content = item_value(ai_info, info_index, "content", language)
+            if not title and not content:
+                continue
+            terms = parse_terms(item_value(ai_info, info_index, "terms", language))
+            term_names = " ".join(str(term.get("term", "")) for term in terms if isinstance(term, dict))
+            yield {
+                "date": ai_info.date,
+                "info_index": info_index,
+                "language": language,
+                "title": title or "",
+                "category": category,
+                "title_tokens": " ".join(tokenize(title)),
+                "term_tokens": " ".join(tokenize(term_names)),
+                "content_tokens": " ".join(tokenize(content))
+            }
+
+
+class SearchIndex:
+    """검색 문서 테이블과 DB별 전문 검색 인덱스를 관리합니다."""
+
+    def __init__(self):
+        self._backfilled = False
+
+    def _dialect(self, db: Session) -> str:
+        return db.get_bind().dialect.name
+
+    def reindex_date(self, db: Session, date: str) -> None:
+        """해당 날짜의 문서를 현재 AIInfo 내용으로 다시 만듭니다. (호출한 세션의 트랜잭션 안에서 실행)"""
+        self.reindex_dates(db, [date])
+
+    def reindex_dates(self, db: Session, dates: List[str]) -> None:
+        """여러 날짜를 한 번의 삭제/조회로 다시 색인합니다. (대량 가져오기용)"""
+        db.flush()
+        self._delete(db, dates)
+        for ai_info in db.query(AIInfo).filter(AIInfo.date.in_(dates)).all():
+            self._insert(db, build_documents(ai_info))
+
+    def rebuild(self, db: Session) -> int:
+        """모든 문서를 다시 만듭니다. (복원/전체 삭제 후, 또는 처음 검색할 때)"""
+        db.flush()
+        db.query(AIInfoSearchDocument).delete(synchronize_session=False)
+        if self._dialect(db) == "sqlite":
+            db.execute(text(f"DELETE FROM {FTS_TABLE}"))
+        count = 0
+        for ai_info in db.query(AIInfo).all():
+            count += self._insert(db, build_documents(ai_info))
+        bump_content_version(db, SEARCH_INDEX_MARKER)
+        return count
+
+    def ensure_backfilled(self, db: Session) -> None:
+        """
+        전체 색인을 한 번도 하지 않았으면 한 번 전체 색인합니다.
+        테이블이 비었는지로 판단하면 업그레이드 직후 첫 검색 전에 들어온 쓰기(날짜 단위 색인) 때문에
+        기존 자료가 영영 색인되지 않으므로, rebuild()가 남기는 content_versions 표시로 판단합니다.
+        """
+        if self._backfilled:
+            return
+        if get_content_version(db, SEARCH_INDEX_MARKER) == 0:
+            from ..database import SessionLocal
+
+            # 읽기 세션(복제본)일 수 있으므로 primary 세션에서 색인
+            write_db = SessionLocal()
+            try:
+                count = self.rebuild(write_db)
+                write_db.commit()
+                logger.info("검색 인덱스 생성 완료: %d개 문서", count)
+            finally:
+                write_db.close()
+        self._backfilled = True
+
+    def _delete(self, db: Session, dates: List[str]) -> None:
+        if self._dialect(db) == "sqlite":
+            ids = [row[0] for row in db.query(AIInfoSearchDocument.id).filter(AIInfoSearchDocument.date.in_(dates))]
+            for doc_id in ids:
+                db.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), {"id": doc_id})
+        db.query(AIInfoSearchDocument).filter(AIInfoSearchDocument.date.in_(dates)).delete(synchronize_session=False)
+
+    def _insert(self, db: Session, documents) -> int:
+        count = 0
+        sqlite = self._dialect(db) == "sqlite"
+        for document in documents:
+            row = AIInfoSearchDocument(**document)
+            db.add(row)
+            count += 1
+            if sqlite:
+                db.flush()
+                db.execute(
+                    text(f"INSERT INTO {FTS_TABLE} (rowid, title_tokens, term_tokens, content_tokens) VALUES (:id, :title, :terms, :content)"),
+                    {"id": row.id, "title": document["title_tokens"], "terms": document["term_tokens"], "content": document["content_tokens"]}
+                )
+        return count
+
+    def search(self, db: Session, query: str, language: Optional[str], limit: int, offset: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Returns:
+            (전체 결과 수, [{"date", "info_index", "language", "title", "category", "score"}])
+        """
+        terms = query_terms(query)
+        if not terms:
+            return 0, []
+        self.ensure_backfilled(db)
+
+        params: Dict[str, Any] = {"limit": limit, "offset": offset}
+        language_filter = ""
+        if language:
+            language_filter = "AND d.language = :language"
+            params["language"] = language
+
+        if self._dialect(db) == "postgresql":
+            params["query"] = " & ".join(f"'{token}'" + (":*" if prefix else "") for token, prefix in terms)
+            # GIN 식 인덱스를 타도록 인덱스와 같은 식을 사용
+            source = f"FROM ai_info_search d, to_tsquery('simple', :query) q WHERE ({PG_VECTOR}) @@ q {language_filter}"
+            score = f"ts_rank({PG_VECTOR}, q)"
+            order = "score DESC"
+        else:
+            params["query"] = " ".join(f'"{token}"' + ("*" if prefix else "") for token, prefix in terms)
+            source = f"FROM {FTS_TABLE} f JOIN ai_info_search d ON d.id = f.rowid WHERE {FTS_TABLE} MATCH :query {language_filter}"
+            score = f"-bm25({FTS_TABLE}, 10.0, 5.0, 1.0)"
+            order = "score DESC"
+
+        total = db.execute(text(f"SELECT COUNT(*) {source}"), params).scalar() or 0
+        if not total:
+            return 0, []
+
+        rows = db.execute(
+            text(f"SELECT d.date, d.info_index, d.language, d.title, d.category, {score} AS score {source} ORDER BY {order}, d.date DESC, d.info_index LIMIT :limit OFFSET :offset"),
+            params
+        ).all()
+        return total, [
+            {
+                "date": row.date,
+                "info_index": row.info_index,
+                "language": row.language,
+                "title": row.title,
+                "category": row.category,
+                "score": float(row.score or 0.0)
+            }
+            for row in rows
+        ]
+
+
+def make_snippet(content: Optional[str], query: str, radius: int = SNIPPET_RADIUS) -> Dict[str, Any]:
+    """
+    내용에서 검색어가 처음 나오는 부분 앞뒤를 잘라 돌려줍니다.
+    highlights는 snippet 안에서 검색어와 일치하는 [시작, 끝) 위치 목록입니다.
+    """
+    if not content:
+        return {"snippet": "", "highlights": []}
+
+    words = [word for word in re.split(r"\s+", query.strip()) if word]
+    lowered = content.lower()
+    first = min((lowered.find(word.lower()) for word in words if lowered.find(word.lower()) >= 0), default=-1)
+
+    if first < 0:
+        start = 0
+    else:
+        start = max(0, first - radius)
+    end = min(len(content), (first if first >= 0 else 0) + radius * 2)
+    snippet = content[start:end]
+
+    highlights = []
+    lowered_snippet = snippet.lower()
+    for word in words:
+        position = lowered_snippet.find(word.lower())
+        while position >= 0:
+            highlights.append([position, position + len(word)])
+            position = lowered_snippet.find(word.lower(), position + len(word))
+    highlights.sort()
+
+    return {
+        "snippet": ("…" if start > 0 else "") + snippet + ("…" if end < len(content) else ""),
+        "highlights": [[s + (1 if start > 0 else 0), e + (1 if start > 0 else 0)] for s, e in highlights]
+    }
+
+
+# 전역 인스턴스
+search_index = SearchIndex()
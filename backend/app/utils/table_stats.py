@@ -0,0 +1,136 @@
+"""
+테이블 통계 제공자
+
+Postgres에서는 pg_class.reltuples 추정치와 테이블/인덱스 크기를 한 번의 쿼리로 가져오고,
+SQLite에서는 정확한 COUNT(*)를 사용합니다. 결과는 TTL 동안 캐시합니다.
+Postgres라도 추정치를 믿을 수 없는 테이블(한 번도 ANALYZE되지 않음)은 COUNT(*)로 대체합니다.
+"""
+
+import os
+import time
+from typing import Any, Dict, List
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from .cache import TTLCache
+
+SYSTEM_STATS_TTL = float(os.getenv("SYSTEM_STATS_TTL_SECONDS", "60"))
+
+
+class TableStatsProvider:
+    """테이블별 행 수와 크기를 조회하고 캐시하는 클래스"""
+
+    def __init__(self, ttl: float = SYSTEM_STATS_TTL):
+        self._cache = TTLCache(ttl=ttl, maxsize=16)
+
+    def get_stats(self, db: Session, tables: List[str], refresh: bool = False) -> Dict[str, Any]:
+        """
+        Returns:
+            {
+                "tables": {테이블명: {"rows", "estimated", "table_bytes", "index_bytes", "total_bytes"}},
+                "generated_at": 생성 시각 (epoch 초)
+            }
+        """
+        key = tuple(tables)
+        if not refresh:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        if db.get_bind().dialect.name == "postgresql":
+            table_stats = self._postgres_stats(db, tables)
+        else:
+            table_stats = self._exact_stats(db, tables)
+
+        result = {"tables": table_stats, "generated_at": time.time()}
+        self._cache.set(key, result)
+        return result
+
+    def invalidate(self) -> None:
+        self._cache.clear()
+
+    def _postgres_stats(self, db: Session, tables: List[str]) -> Dict[str, Dict[str, Any]]:
+        rows = db.execute(
+            text("""
+                SELECT c.relname,
+                       c.reltuples::bigint AS estimated_rows,
+                       c.relpages,
+                       (s.last_analyze IS NOT NULL OR s.last_autoanalyze IS NOT NULL) AS analyzed,
+                       pg_table_size(c.oid) AS table_bytes,
+                       pg_indexes_size(c.oid) AS index_bytes,
+                       pg_total_relation_size(c.oid) AS total_bytes
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+                WHERE c.relkind = 'r'
+                  AND n.nspname = current_schema()
+                  AND c.relname IN :tables
+            """).bindparams(bindparam("tables", expanding=True)),
+            {"tables": tables}
+        ).all()
+
+        stats = {}
+        for relname, estimated_rows, relpages, analyzed, table_bytes, index_bytes, total_bytes in rows:
+            entry = {
+                "rows": estimated_rows,
+                "estimated": True,
+                "table_bytes": table_bytes,
+                "index_bytes": index_bytes,
+                "total_bytes": total_bytes
+            }
+            # 한 번도 ANALYZE되지 않은 테이블은 추정치가 없으므로 정확한 값으로 대체
+            # (PG 14+는 reltuples = -1, 그 이전 버전은 reltuples = 0 / relpages = 0)
+            if (estimated_rows is None or estimated_rows < 0
+                    or (estimated_rows == 0 and not relpages)
+                    or not analyzed):
+                entry["rows"] = self._count(db, relname)
+                entry["estimated"] = False
+            stats[relname] = entry
+
+        for table in tables:
+            if table not in stats:
+                stats[table] = {"rows": 0, "estimated": False, "table_bytes": None, "index_bytes": None, "total_bytes": None}
+        return stats
+
+    def _exact_stats(self, db: Session, tables: List[str]) -> Dict[str, Dict[str, Any]]:
+        sizes = self._sqlite_sizes(db) if db.get_bind().dialect.name == "sqlite" else {}
+
+        stats = {}
+        for table in tables:
+            table_bytes, index_bytes = sizes.get(table, (None, None))
+            stats[table] = {
+                "rows": self._count(db, table),
+                "estimated": False,
+                "table_bytes": table_bytes,
+                "index_bytes": index_bytes,
+                "total_bytes": (table_bytes or 0) + (index_bytes or 0) if table_bytes is not None else None
+            }
+        return stats
+
+    def _count(self, db: Session, table: str) -> int:
+        # 테이블명은 호출하는 쪽의 고정 목록에서만 전달됨
+        return db.execute(text(f'SELECT COUNT(*) FROM "{table}"')).scalar() or 0
+
+    def _sqlite_sizes(self, db: Session) -> Dict[str, tuple]:
+        """dbstat 가상 테이블이 있으면 테이블/인덱스 크기를 계산합니다."""
+        try:
+            page_sizes = dict(db.execute(text("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")).all())
+            index_owner = dict(db.execute(text("SELECT name, tbl_name FROM sqlite_master WHERE type = 'index'")).all())
+        except Exception:
+            db.rollback()
+            return {}
+
+        sizes = {}
+        for name, size in page_sizes.items():
+            if name in index_owner:
+                table_bytes, index_bytes = sizes.get(index_owner[name], (0, 0))
+                sizes[index_owner[name]] = (table_bytes, index_bytes + size)
+            else:
+                table_bytes, index_bytes = sizes.get(name, (0, 0))
+                sizes[name] = (table_bytes + size, index_bytes)
+        return sizes
+
+
+# 전역 인스턴스
+table_stats_provider = TableStatsProvider()
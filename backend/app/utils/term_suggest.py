@@ -0,0 +1,145 @@
+"""
+용어 자동완성 (접두사 검색) 인덱스
+
+Term 테이블의 용어와 AIInfo 항목에 들어 있는 언어별 용어(info{n}_terms_{lang})를 합쳐서
+정규화한 키 순으로 정렬된 배열을 언어별로 만들어 두고, 접두사 검색은 bisect로 일치 구간을 찾습니다.
+구간 안에서는 미리 계산한 순위(용어 사전 우선 → AI 정보에 나온 횟수 많은 순 → 짧은 용어 순)로
+상위 limit개를 고릅니다. (검색 비용은 O(log N + M log limit), M = 일치 개수)
+일치 개수가 많은 짧은 접두사는 상위 SUGGEST_MAX_LIMIT개를 기억해 두어 다음 입력부터 바로 반환합니다.
+
+term / ai_info 콘텐츠 버전이 바뀌면 다음 요청에서 해당 언어의 배열을 다시 만듭니다.
+"""
+
+import heapq
+import logging
+import threading
+import unicodedata
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..models import AIInfo, Term
+from .ai_info_items import ITEMS_PER_DAY, parse_terms
+from .content_version import get_content_version
+
+logger = logging.getLogger(__name__)
+
+SUGGEST_DEFAULT_LIMIT = 10
+SUGGEST_MAX_LIMIT = 50
+# 일치 개수가 이보다 많은 접두사의 상위 결과는 색인마다 기억 (최대 _TOP_CACHE_SIZE개 접두사)
+_TOP_CACHE_MIN_MATCHES = 256
+_TOP_CACHE_SIZE = 1024
+
+
+def normalize_term(value: Optional[str]) -> str:
+    """대소문자/전각·반각 차이와 앞뒤 공백을 무시하도록 정규화합니다."""
+    if not value:
+        return ""
+    return " ".join(unicodedata.normalize("NFKC", value).casefold().split())
+
+
+def _rank_key(key: str, entry: Dict[str, Any]) -> Tuple[bool, int, int, str]:
+    """작을수록 먼저: 용어 사전 용어, AI 정보에 많이 나온 용어, 짧은 용어 순"""
+    return entry["source"] != "glossary", -entry["count"], len(key), key
+
+
+class _LanguageIndex:
+    __slots__ = ("version", "keys", "entries", "ranks", "top_cache")
+
+    def __init__(self, version: Tuple[int, int], keys: List[str], entries: List[Dict[str, Any]]):
+        self.version = version
+        self.keys = keys          # 정렬된 정규화 키 (bisect 대상)
+        self.entries = entries    # keys와 같은 순서의 응답용 항목
+        # keys와 같은 순서의 전체 순위 (정수 비교만으로 상위 K개를 고르기 위해 미리 계산)
+        self.ranks = [0] * len(keys)
+        for rank, position in enumerate(sorted(range(len(keys)), key=lambda i: _rank_key(keys[i], entries[i]))):
+            self.ranks[position] = rank
+        self.top_cache: Dict[str, List[int]] = {}
+
+    def top(self, prefix: str, limit: int) -> List[int]:
+        """prefix로 시작하는 키 중 순위가 높은 limit개의 위치"""
+        start = bisect_left(self.keys, prefix)
+        # prefix로 시작하는 키는 prefix 이상, prefix + U+10FFFF 미만 구간에 모여 있음
+        end = bisect_left(self.keys, prefix + "\U0010ffff", start)
+        if end - start <= limit:
+            return sorted(range(start, end), key=self.ranks.__getitem__)
+        if end - start < _TOP_CACHE_MIN_MATCHES:
+            return heapq.nsmallest(limit, range(start, end), key=self.ranks.__getitem__)
+        cached = self.top_cache.get(prefix)
+        if cached is None:
+            cached = heapq.nsmallest(SUGGEST_MAX_LIMIT, range(start, end), key=self.ranks.__getitem__)
+            if len(self.top_cache) >= _TOP_CACHE_SIZE:
+                self.top_cache.clear()
+            self.top_cache[prefix] = cached
+        return cached[:limit]
+
+
+class TermSuggestIndex:
+    """언어별 정렬 배열 기반 접두사 검색"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, _LanguageIndex] = {}
+
+    def _current_version(self, db: Session) -> Tuple[int, int]:
+        return get_content_version(db, "term"), get_content_version(db, "ai_info")
+
+    def _get_index(self, db: Session, language: str) -> _LanguageIndex:
+        version = self._current_version(db)
+        index = self._indexes.get(language)
+        if index is not None and index.version == version:
+            return index
+        with self._lock:
+            index = self._indexes.get(language)
+            if index is None or index.version != version:
+                index = self._build(db, language, version)
+                self._indexes[language] = index
+        return index
+
+    def _build(self, db: Session, language: str, version: Tuple[int, int]) -> _LanguageIndex:
+        merged: Dict[str, Dict[str, Any]] = {}
+
+        # 1) 용어 사전 (설명이 있으므로 우선)
+        for term, description in db.query(Term.term, Term.description).all():
+            key = normalize_term(term)
+            if key:
+                merged[key] = {"term": term, "description": description or "", "source": "glossary", "count": 0}
+
+        # 2) AI 정보 항목의 용어 (해당 언어 컬럼만 조회)
+        columns = [getattr(AIInfo, f"info{i + 1}_terms_{language}") for i in range(ITEMS_PER_DAY)]
+        for row in db.query(*columns).all():
+            for raw in row:
+                for item in parse_terms(raw):
+                    if not isinstance(item, dict):
+                        continue
+                    term = str(item.get("term") or "").strip()
+                    key = normalize_term(term)
+                    if not key:
+                        continue
+                    entry = merged.get(key)
+                    if entry is None:
+                        entry = merged[key] = {"term": term, "description": item.get("description") or "", "source": "ai_info", "count": 0}
+                    elif not entry["description"] and item.get("description"):
+                        entry["description"] = item["description"]
+                    entry["count"] += 1
+
+        keys = sorted(merged)
+        logger.info("용어 자동완성 인덱스 생성: %s %d개", language, len(keys))
+        return _LanguageIndex(version, keys, [merged[key] for key in keys])
+
+    def suggest(self, db: Session, prefix: str, language: str = "ko", limit: int = SUGGEST_DEFAULT_LIMIT) -> List[Dict[str, Any]]:
+        """prefix로 시작하는 용어 중 순위가 높은 limit개를 반환합니다. (용어 사전 → 많이 나온 순 → 짧은 순)"""
+        key = normalize_term(prefix)
+        if not key:
+            return []
+        index = self._get_index(db, language)
+        return [index.entries[position] for position in index.top(key, limit)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+
+
+# 전역 인스턴스
+term_suggest_index = TermSuggestIndex()
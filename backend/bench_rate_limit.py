@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+속도 제한기 오버헤드 측정 스크립트
+
+사용법:
+    python bench_rate_limit.py [요청 수] [키 수]
+
+DB나 서버 없이 InMemorySlidingWindowBackend.hit()과 RateLimiter.check()의
+요청당 평균 소요 시간을 측정합니다.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi import HTTPException
+
+from app.utils.rate_limit import InMemorySlidingWindowBackend, RateLimiter
+
+
+def bench(label, func, iterations):
+    start = time.perf_counter()
+    func(iterations)
+    elapsed = time.perf_counter() - start
+    per_call_us = elapsed / iterations * 1_000_000
+    print(f"  {label:<40} {per_call_us:8.3f} µs/요청  ({iterations:,}회, {elapsed:.3f}초)")
+    return per_call_us
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    key_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+
+    print("⏱️ 속도 제한기 오버헤드 측정")
+    print("=" * 70)
+
+    keys = [f"10.0.{i // 256}.{i % 256}" for i in range(key_count)]
+
+    backend = InMemorySlidingWindowBackend(max_keys=key_count)
+
+    def hit_single_key(n):
+        hit = backend.hit
+        for _ in range(n):
+            hit("127.0.0.1", 1_000_000_000, 60.0)
+
+    def hit_many_keys(n):
+        hit = backend.hit
+        for i in range(n):
+            hit(keys[i % key_count], 1_000_000_000, 60.0)
+
+    small_backend = InMemorySlidingWindowBackend(max_keys=key_count // 10 or 1)
+
+    def hit_with_eviction(n):
+        hit = small_backend.hit
+        for i in range(n):
+            hit(keys[i % key_count], 1_000_000_000, 60.0)
+
+    limiter = RateLimiter("bench", "1000000000/60", backend=InMemorySlidingWindowBackend(max_keys=key_count))
+
+    def limiter_check(n):
+        check = limiter.check
+        for i in range(n):
+            check(keys[i % key_count])
+
+    blocked = RateLimiter("bench_blocked", "1/3600", backend=InMemorySlidingWindowBackend(max_keys=key_count))
+    blocked.check("127.0.0.1")
+
+    def limiter_rejected(n):
+        check = blocked.check
+        for _ in range(n):
+            try:
+                check("127.0.0.1")
+            except HTTPException:
+                pass
+
+    def baseline(n):
+        for i in range(n):
+            keys[i % key_count]
+
+    results = [
+        bench("루프 기준선", baseline, iterations),
+        bench("backend.hit (단일 키)", hit_single_key, iterations),
+        bench(f"backend.hit ({key_count:,}개 키)", hit_many_keys, iterations),
+        bench(f"backend.hit (LRU 제거 발생)", hit_with_eviction, iterations),
+        bench("RateLimiter.check (허용)", limiter_check, iterations),
+        bench("RateLimiter.check (429 거부)", limiter_rejected, iterations // 10),
+    ]
+
+    print("=" * 70)
+    print(f"📦 저장된 키 수: {len(backend):,} (max_keys={backend.max_keys:,})")
+    worst_allowed = max(results[1:5])
+    print(f"✅ 허용 경로 최대 오버헤드: {worst_allowed:.3f} µs/요청")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+AI 정보 대량 가져오기 스크립트
+
+사용법:
+    python import_ai_info.py ai_info.ndjson [--mode replace|append] [--batch-size 200] [--dry-run] [--atomic]
+    cat ai_info.ndjson | python import_ai_info.py -
+
+한 줄에 {"date": "2025-01-01", "infos": [{...}, ...]} 레코드 하나씩 들어 있는 NDJSON 파일을 읽어
+POST /api/ai-info/bulk 와 같은 방식(배치 단위 INSERT/UPDATE, 한 트랜잭션)으로 DATABASE_URL 의 DB에 씁니다.
+잘못된 줄은 줄 번호와 함께 출력하고, 끝나면 처리 시간과 초당 처리 날짜 수를 출력합니다.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal
+from app.utils.ai_info_import import AI_INFO_IMPORT_BATCH_SIZE, AI_INFO_IMPORT_MODES, AIInfoImporter, parse_record
+from app.utils.bulk_import import BulkReport, parse_ndjson_line, validation_message
+
+
+def run_import(stream, mode: str, batch_size: int, dry_run: bool, atomic: bool) -> int:
+    db = SessionLocal()
+    report = BulkReport("ndjson", dry_run)
+    importer = AIInfoImporter(db, mode=mode, batch_size=batch_size, dry_run=dry_run)
+    try:
+        for line_no, line in enumerate(stream, start=1):
+            record = parse_ndjson_line(line_no, line.rstrip("\r\n"))
+            if record is None:
+                continue
+            report.received += 1
+            if record.error:
+                report.error(record.line, record.error)
+                continue
+            try:
+                importer.add(parse_record(record.data))
+            except ValueError as e:
+                report.error(record.line, validation_message(e))
+                continue
+            if importer.batch_full:
+                importer.flush()
+                print(f"  ... {report.received:,}줄 처리 (추가 {importer.inserted:,}, 수정 {importer.updated:,})")
+
+        if atomic and report.failed:
+            db.rollback()
+            print(f"❌ 잘못된 레코드 {report.failed}개가 있어 저장하지 않았습니다. (--atomic)")
+        else:
+            importer.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    for error in report.errors:
+        print(f"⚠️ {error['line']}번째 줄: {error['error']}")
+    if report.failed > len(report.errors):
+        print(f"⚠️ ... 외 {report.failed - len(report.errors)}개 오류")
+
+    stats = importer.stats()
+    print("=" * 60)
+    print(f"📥 읽은 레코드: {report.received:,}개 (오류 {report.failed:,}개)")
+    if dry_run:
+        print("🔍 --dry-run: 검증만 하고 저장하지 않았습니다.")
+    else:
+        print(f"✅ 추가된 날짜: {importer.inserted:,}개, 수정된 날짜: {importer.updated:,}개 (항목 {stats['items']:,}개)")
+    print(f"⏱️ {stats['elapsed_seconds']}초, {stats['dates_per_second']} 날짜/초")
+    return 1 if report.failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NDJSON 파일에서 AI 정보를 한꺼번에 가져옵니다.")
+    parser.add_argument("path", help="NDJSON 파일 경로 (- 이면 표준 입력)")
+    parser.add_argument("--mode", choices=AI_INFO_IMPORT_MODES, default="replace",
+                        help="replace: 날짜의 항목을 덮어씀 (기본), append: 기존 행의 빈 칸에만 채움")
+    parser.add_argument("--batch-size", type=int, default=AI_INFO_IMPORT_BATCH_SIZE, help="한 번에 쓰는 날짜 레코드 수")
+    parser.add_argument("--dry-run", action="store_true", help="검증만 하고 저장하지 않음")
+    parser.add_argument("--atomic", action="store_true", help="잘못된 레코드가 있으면 아무것도 저장하지 않음")
+    args = parser.parse_args()
+
+    print("🗂️ AI 정보 대량 가져오기")
+    if args.path == "-":
+        return run_import(sys.stdin, args.mode, args.batch_size, args.dry_run, args.atomic)
+    with open(args.path, encoding="utf-8-sig") as stream:
+        return run_import(stream, args.mode, args.batch_size, args.dry_run, args.atomic)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
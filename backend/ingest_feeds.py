@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+RSS/Atom 피드 수집 스크립트 (크론 등에서 실행)
+
+사용법:
+    python ingest_feeds.py [--date 2025-01-06] [--source-id 3] [--concurrency 5]
+    python ingest_feeds.py --add "AI News" https://example.com/feed.xml [--language en]
+    python ingest_feeds.py --add-fixtures        # fixtures/feeds/ 의 로컬 피드를 file:// 로 등록
+
+등록된(활성화된) 피드를 동시에 가져와 새 기사를 해당 날짜의 후보로 저장하고, 피드별 결과를 출력합니다.
+관리자 API(POST /api/feeds/ingest)와 같은 코드를 사용합니다.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal
+from app.models import FeedSource
+from app.utils.ai_info_items import LANGUAGES
+from app.utils.feed_ingest import FEED_FETCH_CONCURRENCY, ingest_feeds
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures" / "feeds"
+
+
+def add_source(db, name: str, url: str, language: str) -> None:
+    if db.query(FeedSource.id).filter(FeedSource.url == url).first():
+        print(f"ℹ️ 이미 등록된 피드: {url}")
+        return
+    db.add(FeedSource(name=name, url=url, language=language))
+    db.commit()
+    print(f"✅ 피드 등록: {name} ({url})")
+
+
+def print_report(report) -> None:
+    print("=" * 60)
+    print(f"📅 후보 날짜: {report['target_date']}")
+    for source in report["sources"]:
+        if source["error"]:
+            state = f"❌ {source['error']}"
+        elif source["status"] == 304:
+            state = "⏸️ 변경 없음 (304)"
+        else:
+            state = f"✅ 항목 {source['entries']}개, 새 기사 {source['new']}개, 중복 {source['duplicates']}개"
+        print(f"  [{source['source_id']}] {source['name']}: {state}")
+    print("=" * 60)
+    print(f"📰 새 후보 {report['new']}개, 중복 {report['duplicates']}개, 변경 없음 {report['not_modified']}개, 실패 {report['failed']}개")
+    print(f"⏱️ 가져오기 {report['fetch_seconds']}초, 전체 {report['total_seconds']}초")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="등록된 RSS/Atom 피드에서 AI 정보 후보를 수집합니다.")
+    parser.add_argument("--date", help="후보로 올릴 날짜 (기본: 오늘)")
+    parser.add_argument("--source-id", type=int, help="이 피드만 가져오기")
+    parser.add_argument("--concurrency", type=int, default=FEED_FETCH_CONCURRENCY, help="동시에 가져올 피드 수")
+    parser.add_argument("--add", nargs=2, metavar=("NAME", "URL"), help="피드를 등록하고 종료")
+    parser.add_argument("--language", choices=LANGUAGES, default="en", help="--add 로 등록할 피드의 언어")
+    parser.add_argument("--add-fixtures", action="store_true", help="fixtures/feeds/ 의 로컬 피드를 등록하고 종료")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.add:
+            add_source(db, args.add[0], args.add[1], args.language)
+            return 0
+        if args.add_fixtures:
+            for path in sorted(FIXTURE_DIR.iterdir()):
+                add_source(db, f"fixture: {path.stem}", path.as_uri(), "en")
+            return 0
+
+        print("📡 피드 수집 시작...")
+        report = asyncio.run(ingest_feeds(db, target_date=args.date, source_ids=[args.source_id] if args.source_id else None,
+                                          concurrency=args.concurrency))
+        print_report(report)
+        return 1 if report["failed"] else 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,27 @@
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from datetime import datetime
+import logging
 import os
 
-from app.api import ai_info, quiz, prompt, base_content, term, auth, logs, system, user_progress
+from app.api import ai_info, quiz, prompt, base_content, term, auth, logs, system, feeds, user_progress
+from app.utils.metrics import metrics_middleware, metrics_endpoint
+from app.utils.json_response import FastJSONResponse
+from app.utils.query_diagnostics import query_diagnostics_middleware
+from app.utils.profiling import install_profiling
+from app.utils.category_index import category_index
+from app.utils.jobs import job_runner
+from app.utils.logging_config import configure_logging
 
-app = FastAPI()
+# 로깅 설정 (LOG_LEVEL, LOG_LEVELS, LOG_FORMAT, LOG_ASYNC)
+configure_logging()
+
+logger = logging.getLogger(__name__)
+
+# 응답 직렬화는 orjson 사용
+app = FastAPI(default_response_class=FastJSONResponse)
 
 # CORS 설정 - Railway 배포 환경에 맞게 조정 (임시로 관대한 설정)
 app.add_middleware(
@@ -18,6 +33,25 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# 응답 압축 (GZIP_MINIMUM_SIZE 바이트 이상일 때만)
+app.add_middleware(GZipMiddleware, minimum_size=int(os.getenv("GZIP_MINIMUM_SIZE", "1024")))
+
+# 요청 계측 (라우트별 처리 시간, 상태 코드, DB 쿼리 수)
+app.middleware("http")(metrics_middleware)
+# 요청별 쿼리 진단 (QUERY_DIAGNOSTICS=true일 때만 동작)
+app.middleware("http")(query_diagnostics_middleware)
+app.add_route("/metrics", metrics_endpoint, methods=["GET"], include_in_schema=False)
+
+# 서버 시작 시 카테고리 색인을 미리 로드 (테이블이 비어 있으면 전체 색인)
+@app.on_event("startup")
+def warm_up_category_index():
+    category_index.warm_up()
+
+# 백그라운드 작업 heartbeat 갱신 시작 (heartbeat가 끊긴 다른 프로세스의 작업은 실패로 표시)
+@app.on_event("startup")
+def start_job_monitor():
+    job_runner.start()
+
 # 헬스체크 엔드포인트
 @app.get("/")
 async def root():
@@ -50,20 +84,20 @@ async def debug_routes():
 @app.options("/{path:path}")
 async def options_handler(path: str):
     """OPTIONS 요청을 명시적으로 처리"""
-    print(f"🔄 OPTIONS 요청 처리: {path}")
+    logger.debug("OPTIONS 요청 처리: %s", path)
     return {"message": "OK"}
 
 @app.middleware("http")
 async def log_requests(request, call_next):
     """모든 요청을 로깅하는 미들웨어"""
     start_time = datetime.now()
-    print(f"📥 요청: {request.method} {request.url}")
-    print(f"🔐 헤더 Authorization: {'있음' if request.headers.get('authorization') else '없음'}")
+    logger.debug("요청: %s %s (Authorization %s)", request.method, request.url,
+                 "있음" if request.headers.get("authorization") else "없음")
     
     response = await call_next(request)
     
     process_time = (datetime.now() - start_time).total_seconds()
-    print(f"📤 응답: {response.status_code} ({process_time:.3f}s)")
+    logger.debug("응답: %s (%.3fs)", response.status_code, process_time)
     
     return response
 
@@ -86,9 +120,13 @@ async def not_found_handler(request: Request, exc: HTTPException):
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(logs.router, prefix="/api/logs", tags=["Activity Logs"])
 app.include_router(system.router, prefix="/api/system", tags=["System Management"])
+app.include_router(feeds.router, prefix="/api/feeds", tags=["Feed Ingestion"])
 app.include_router(user_progress.router, prefix="/api/user-progress", tags=["User Progress"])
 app.include_router(ai_info.router, prefix="/api/ai-info")
 app.include_router(quiz.router, prefix="/api/quiz")
 app.include_router(prompt.router, prefix="/api/prompt")
 app.include_router(base_content.router, prefix="/api/base-content")
 app.include_router(term.router, prefix="/api/term")
+
+# 느린 요청 프로파일링 (PROFILING_ENABLED=true일 때만, 라우터 등록 후 호출)
+install_profiling(app)
@@ -48,6 +48,19 @@ def migrate_database():
                 ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
             """))
             
+            # background_jobs 테이블에 artifact_path 컬럼 추가 (백업 다운로드 경로)
+            conn.execute(text("""
+                ALTER TABLE background_jobs 
+                ADD COLUMN IF NOT EXISTS artifact_path VARCHAR
+            """))
+            
+            # background_jobs 테이블에 owner / heartbeat_at 컬럼 추가 (중단된 작업 판별)
+            conn.execute(text("""
+                ALTER TABLE background_jobs 
+                ADD COLUMN IF NOT EXISTS owner VARCHAR,
+                ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP WITH TIME ZONE
+            """))
+            
             conn.commit()
             print("✅ 데이터베이스 마이그레이션이 성공적으로 완료되었습니다!")
             
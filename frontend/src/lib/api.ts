@@ -166,12 +166,42 @@ export const systemAPI = {
     return response.data
   },
 
-  // 시스템 백업 생성
+  // 백그라운드 작업 상태 조회
+  getJob: async (jobId: string) => {
+    const response = await api.get(`/api/system/jobs/${jobId}`)
+    return response.data
+  },
+
+  // 백그라운드 작업 취소
+  cancelJob: async (jobId: string) => {
+    const response = await api.post(`/api/system/jobs/${jobId}/cancel`)
+    return response.data
+  },
+
+  // 작업이 끝날 때까지 상태를 폴링하고 결과를 반환
+  waitForJob: async (jobId: string, onProgress?: (job: any) => void, intervalMs = 1000) => {
+    while (true) {
+      const job = await systemAPI.getJob(jobId)
+      onProgress?.(job)
+      if (job.status === 'succeeded') {
+        return job.result
+      }
+      if (job.status === 'failed' || job.status === 'cancelled') {
+        throw new Error(job.error || `Job ${job.status}`)
+      }
+      await new Promise((resolve) => setTimeout(resolve, intervalMs))
+    }
+  },
+
+  // 시스템 백업 생성 (작업 제출 후 완료되면 다운로드)
   createBackup: async (options?: {
     include_tables?: string[];
     description?: string;
-  }) => {
-    const response = await api.post('/api/system/backup', options, {
+  }, onProgress?: (job: any) => void) => {
+    const submitted = await api.post('/api/system/backup', options)
+    const result = await systemAPI.waitForJob(submitted.data.job_id, onProgress)
+
+    const response = await api.get(result.download_url, {
       responseType: 'blob'
     })
     
@@ -179,18 +209,7 @@ export const systemAPI = {
     const url = window.URL.createObjectURL(new Blob([response.data]))
     const link = document.createElement('a')
     link.href = url
-    
-    // 파일명 추출 (Content-Disposition 헤더에서)
-    const contentDisposition = response.headers['content-disposition']
-    let filename = 'backup.json'
-    if (contentDisposition) {
-      const filenameMatch = contentDisposition.match(/filename="(.+)"/)
-      if (filenameMatch) {
-        filename = filenameMatch[1]
-      }
-    }
-    
-    link.download = filename
+    link.download = result.filename || 'backup.json'
     document.body.appendChild(link)
     link.click()
     document.body.removeChild(link)
@@ -199,8 +218,8 @@ export const systemAPI = {
     return { message: 'Backup created and downloaded successfully' }
   },
 
-  // 시스템 복원
-  restoreBackup: async (file: File) => {
+  // 시스템 복원 (작업 제출 후 완료될 때까지 대기)
+  restoreBackup: async (file: File, onProgress?: (job: any) => void) => {
     const formData = new FormData()
     formData.append('file', file)
     
@@ -209,7 +228,7 @@ export const systemAPI = {
         'Content-Type': 'multipart/form-data'
       }
     })
-    return response.data
+    return systemAPI.waitForJob(response.data.job_id, onProgress)
   },
 
   // 백업 히스토리 조회
@@ -224,10 +243,10 @@ export const systemAPI = {
     return response.data
   },
 
-  // 모든 데이터 삭제
+  // 모든 데이터 삭제 (작업 제출 후 완료될 때까지 대기)
   clearAllData: async () => {
     const response = await api.delete('/api/system/clear-all-data?confirm=true')
-    return response.data
+    return systemAPI.waitForJob(response.data.job_id)
   },
 
   // 데이터베이스 테이블 초기화
@@ -267,6 +286,10 @@ export const systemAPI = {
 export const aiInfoAPI = {
   getByDate: (date: string) => api.get(`/api/ai-info/${date}`),
   add: (data: any) => api.post('/api/ai-info/', data),
+  bulkImport: (ndjson: string | Blob, options: { mode?: 'replace' | 'append'; dryRun?: boolean; atomic?: boolean } = {}) =>
+    api.post(`/api/ai-info/bulk?mode=${options.mode || 'replace'}&dry_run=${!!options.dryRun}&atomic=${!!options.atomic}`, ndjson, {
+      headers: { 'Content-Type': 'application/x-ndjson' },
+    }),
   delete: (date: string) => api.delete(`/api/ai-info/${date}`),
   deleteItem: (date: string, itemIndex: number) => api.delete(`/api/ai-info/${date}/item/${itemIndex}`),
   getAllDates: () => api.get('/api/ai-info/dates/all'),
@@ -276,6 +299,9 @@ export const aiInfoAPI = {
   // 새로운 API: 특정 항목의 내용 가져오기
   getContentByIndex: (date: string, infoIndex: number, language: string = 'ko') => 
     api.get(`/api/ai-info/content/${date}/${infoIndex}/${language}`),
+  // 검색 API (제목/내용/용어, language='all'이면 모든 언어)
+  search: (q: string, language: string = 'ko', page: number = 1, pageSize: number = 20) =>
+    api.get('/api/ai-info/search', { params: { q, language, page, page_size: pageSize } }),
   getTotalDays: () => api.get('/api/ai-info/total-days'),
   getTotalCount: () => api.get('/api/ai-info/total-count'),
   getLearnedCount: (sessionId: string) => api.get(`/api/ai-info/learned-count/${sessionId}`),
@@ -304,14 +330,49 @@ export const aiInfoAPI = {
     api.put(`/api/ai-info/${date}/terms/${itemIndex}`, termsData),
 }
 
+// Term API
+export const termAPI = {
+  getAll: () => api.get('/api/term/all'),
+  getPage: (limit: number = 50, after?: string, bucket?: string) =>
+    api.get('/api/term/all', { params: { limit, after, bucket } }),
+  getBuckets: () => api.get('/api/term/buckets'),
+  getRandom: (n?: number) => api.get('/api/term/random', { params: n ? { n } : undefined }),
+  suggest: (prefix: string, language: string = 'ko', limit: number = 10) =>
+    api.get('/api/term/suggest', { params: { prefix, language, limit } }),
+}
+
 // Quiz API
 export const quizAPI = {
   getTopics: (language: string = 'ko') => api.get(`/api/quiz/topics?language=${language}`),
+  getTopicCounts: (language: string = 'ko') => api.get(`/api/quiz/topics/counts?language=${language}`),
   getByTopic: (topic: string, language: string = 'ko') => api.get(`/api/quiz/${topic}?language=${language}`),
   add: (data: any) => api.post('/api/quiz/', data),
   update: (id: number, data: any) => api.put(`/api/quiz/${id}`, data),
   delete: (id: number) => api.delete(`/api/quiz/${id}`),
   generate: (topic: string) => api.get(`/api/quiz/generate/${topic}`),
+  createSession: (data: { topic: string; count?: number; language?: string; session_id?: string }) =>
+    api.post('/api/quiz/session', data),
+  answerSession: (quizSessionId: string, answers: Record<number, number>) =>
+    api.post(`/api/quiz/session/${quizSessionId}/answer`, { answers }),
+  bulkImport: (body: string | Blob, format: 'ndjson' | 'csv', options: { dryRun?: boolean; atomic?: boolean } = {}) =>
+    api.post(`/api/quiz/bulk?format=${format}&dry_run=${!!options.dryRun}&atomic=${!!options.atomic}`, body, {
+      headers: { 'Content-Type': format === 'csv' ? 'text/csv' : 'application/x-ndjson' },
+    }),
+  export: (format: 'ndjson' | 'csv' = 'ndjson', topic?: string) =>
+    api.get(`/api/quiz/export?format=${format}${topic ? `&topic=${encodeURIComponent(topic)}` : ''}`, { responseType: 'blob' }),
+}
+
+// Feed Ingestion API (관리자)
+export const feedAPI = {
+  getSources: () => api.get('/api/feeds/sources'),
+  addSource: (data: { name: string; url: string; language?: string; enabled?: boolean }) => api.post('/api/feeds/sources', data),
+  updateSource: (id: number, data: { name: string; url: string; language?: string; enabled?: boolean }) => api.put(`/api/feeds/sources/${id}`, data),
+  deleteSource: (id: number) => api.delete(`/api/feeds/sources/${id}`),
+  ingest: (targetDate?: string, sourceId?: number) =>
+    api.post(`/api/feeds/ingest?${targetDate ? `target_date=${targetDate}&` : ''}${sourceId ? `source_id=${sourceId}` : ''}`),
+  getCandidates: (date?: string, status: string = 'candidate', category?: string) =>
+    api.get(`/api/feeds/candidates?status=${status}${date ? `&date=${date}` : ''}${category ? `&category=${encodeURIComponent(category)}` : ''}`),
+  setCandidateStatus: (id: number, status: 'candidate' | 'published' | 'rejected') => api.patch(`/api/feeds/candidates/${id}`, { status }),
 }
 
 // User Progress API